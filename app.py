@@ -1,13 +1,10 @@
 import os
-import logging
-from logging.handlers import RotatingFileHandler
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from utils.sentry import init_sentry
+from utils.log import init_logging
 from flask_migrate import Migrate
 from flask_login import LoginManager
 from flask_bcrypt import Bcrypt
-from flask_admin import Admin
 from flask_restful import Api
 from config import config
 
@@ -16,8 +13,6 @@ db = SQLAlchemy()
 migrate = Migrate()
 login_manager = LoginManager()
 bcrypt = Bcrypt()
-admin = Admin(name='Solution Desk Admin', template_mode='bootstrap3')
-api = Api()
 
 def create_app(config_name=None):
     # Initialize Flask app
@@ -31,14 +26,8 @@ def create_app(config_name=None):
     app.config.from_object(config[config_name])
     config[config_name].init_app(app)
     
-    # Configure logging
-    handler = RotatingFileHandler(app.config['LOG_FILE'], maxBytes=100000, backupCount=5)
-    handler.setLevel(getattr(logging, app.config['LOG_LEVEL']))
-    handler.setFormatter(logging.Formatter(
-        '%(asctime)s %(levelname)s in %(module)s: %(message)s'
-    ))
-    app.logger.addHandler(handler)
-    app.logger.setLevel(getattr(logging, app.config['LOG_LEVEL']))
+    # Configure logging (file I/O happens on a background thread)
+    init_logging(app)
     app.logger.info('Application startup')
     
     # Load instance config (overrides default config)
@@ -54,6 +43,26 @@ def create_app(config_name=None):
     login_manager.login_view = 'auth.login'
     login_manager.login_message_category = 'info'
     
+    # Optional components are imported behind their config checks so a
+    # process that disables them doesn't pay for the import at boot
+    
+    # Per-request wall/DB time and query counts
+    if app.config.get('REQUEST_TIMING_ENABLED', True):
+        from utils.timing import init_request_timing
+        init_request_timing(app)
+    
+    # Template fragment and bytecode caches
+    from utils.cache import init_template_cache
+    init_template_cache(app)
+    
+    # Fingerprinted static assets
+    from utils.assets import init_assets
+    init_assets(app)
+    
+    # Tools catalog backed by projects.json
+    from utils.catalog import init_tool_catalog
+    init_tool_catalog(app)
+    
     # Create upload folder if it doesn't exist
     os.makedirs(os.path.join(app.root_path, app.config['UPLOAD_FOLDER']), exist_ok=True)
     
@@ -63,54 +72,88 @@ def create_app(config_name=None):
     from routes.projects import projects_bp
     from routes.tools import tools_bp
     from errors import errors as errors_bp
-    from routes.api.docs import api_docs_bp
     from routes.health import health_bp
+    from routes.assets import assets_bp
     
     app.register_blueprint(main_bp)
     app.register_blueprint(auth_bp, url_prefix='/auth')
     app.register_blueprint(projects_bp, url_prefix='/projects')
     app.register_blueprint(tools_bp, url_prefix='/tools')
     app.register_blueprint(errors_bp)
-    app.register_blueprint(api_docs_bp, url_prefix='/api')
     app.register_blueprint(health_bp)
+    app.register_blueprint(assets_bp, url_prefix='/assets')
     
     # Initialize Marshmallow
     from schemas import init_ma
     init_ma(app)
     
-    # Initialize Sentry for production error monitoring
+    # Initialize Sentry for production error monitoring (the SDK itself is
+    # only imported when a DSN is configured)
+    from utils.sentry import init_sentry
     init_sentry(app)
     
-    # Initialize Flask-RESTful API
-    api.init_app(app)
+    # Local Prometheus metrics at /metrics
+    if app.config.get('METRICS_ENABLED'):
+        from utils.metrics import init_metrics
+        init_metrics(app)
+    
+    # Sampling profiler and signed per-request cProfile
+    if app.config.get('PROFILING_ENABLED'):
+        from utils.profiling import init_profiling
+        init_profiling(app)
+    
+    # Register API resources before the docs blueprint: the first rule
+    # registered for a URL wins, and the docs define stub routes on the same paths
+    init_api(app)
     
-    # Register API resources
+    # Swagger docs (flask-restx) and Flask-Admin are heavy imports; only load
+    # them when enabled
+    if app.config.get('API_DOCS_ENABLED', True):
+        from routes.api.docs import api_docs_bp
+        app.register_blueprint(api_docs_bp, url_prefix='/api')
+    
+    if app.config.get('ADMIN_ENABLED', True):
+        init_admin(app)
+    
+    # Register CLI commands
+    from commands import register_commands
+    register_commands(app)
+    
+    # Compare the schema stamp once instead of running create_all() in every
+    # worker; tables are created with `flask init-db` or `flask db upgrade`
+    if app.config.get('SCHEMA_CHECK_ON_STARTUP', True):
+        from utils.schema import check_schema_version
+        check_schema_version(app)
+    
+    return app
+
+# User loader for Flask-Login
+@login_manager.user_loader
+def load_user(user_id):
+    from models.user import User
+    return User.query.get(int(user_id))
+
+# Initialize Flask-RESTful API
+def init_api(app):
     from routes.api.projects import ProjectsAPI
     from routes.api.ideas import IdeasAPI
     from routes.api.sops import SopsAPI
     from routes.api.users import UsersAPI
     from routes.api.kpis import KpisAPI
     
+    # One Api per app: resources added to a shared Api after init_app are
+    # never registered on the app
+    api = Api(app)
     api.add_resource(ProjectsAPI, '/api/projects', '/api/projects/<int:id>')
     api.add_resource(IdeasAPI, '/api/ideas', '/api/ideas/<int:id>')
     api.add_resource(SopsAPI, '/api/sops', '/api/sops/<int:id>')
     api.add_resource(UsersAPI, '/api/users', '/api/users/<int:id>')
     api.add_resource(KpisAPI, '/api/kpis', '/api/kpis/<int:id>')
-    
-    # Create database tables
-    with app.app_context():
-        db.create_all()
-    
-    return app
-
-# User loader for Flask-Login
-@login_manager.user_loader
-def load_user(user_id):
-    from models.user import User
-    return User.query.get(int(user_id))
+    return api
 
 # Initialize Flask-Admin
 def init_admin(app):
+    from flask_admin import Admin
     from flask_admin.contrib.sqla import ModelView
     from models.project import Project
     from models.user import User
@@ -127,23 +170,30 @@ def init_admin(app):
         def inaccessible_callback(self, name, **kwargs):
             return redirect(url_for('auth.login'))
     
-    admin.init_app(app)
+    admin = Admin(app, name='Solution Desk Admin', template_mode='bootstrap3')
     admin.add_view(SecureModelView(User, db.session))
     admin.add_view(SecureModelView(Project, db.session))
     admin.add_view(SecureModelView(Idea, db.session))
     admin.add_view(SecureModelView(SOP, db.session))
     admin.add_view(SecureModelView(KPI, db.session))
 
-# Create app instance using environment variable or default to development
-app = create_app(os.getenv('FLASK_ENV') or 'development')
+# Process-wide application instance, built on first use
+_app = None
 
-# Register CLI commands
-from commands import register_commands
-register_commands(app)
+def get_app():
+    """Return the application for this process, creating it once"""
+    global _app
+    if _app is None:
+        _app = create_app(os.getenv('FLASK_ENV') or 'development')
+    return _app
 
-# Initialize admin after app is created
-with app.app_context():
-    init_admin(app)
+def __getattr__(name):
+    # `app` is resolved lazily so that `from app import db` (models, routes,
+    # scripts) doesn't build an application as an import side effect.
+    # gunicorn `app:app` and FLASK_APP=app.py still find it.
+    if name == 'app':
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=int(os.getenv('PORT', 5000)))
+    get_app().run(debug=True, host='0.0.0.0', port=int(os.getenv('PORT', 5000)))
@@ -46,4 +46,12 @@ if [ -d "migrations" ]; then
     ${PYTHON_CMD} -m flask db upgrade
 fi
 
+# Fingerprint and precompress static assets
+echo "-----> Building static assets"
+${PYTHON_CMD} -m flask build-assets
+
+# Precompile templates so cold workers don't re-parse them
+echo "-----> Precompiling Jinja templates"
+${PYTHON_CMD} -m flask compile-templates
+
 echo "-----> Build completed successfully"
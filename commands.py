@@ -34,12 +34,92 @@ def load_seed_data():
         logger.error(f"Failed to load seed data: {e}")
         return None
 
+SEED_CHUNK_SIZE = 1000
+
+def _user_rows(records, hash_workers=None):
+    # Hashing dominates user creation, so hash the whole batch in parallel
+    from utils.passwords import hash_passwords
+    hashes = hash_passwords([data['password'] for data in records], workers=hash_workers)
+    return [
+        {'email': data['email'], 'password_hash': password_hash, 'role': data['role']}
+        for data, password_hash in zip(records, hashes)
+    ]
+
+def _project_row(data):
+    return {
+        'title': data['title'],
+        'slug': data['slug'],
+        'description': data.get('description'),
+        'long_description': data.get('long_description'),
+        'image_url': data.get('image_url'),
+        'demo_url': data.get('demo_url'),
+        'github_url': data.get('github_url'),
+        'download_url': data.get('download_url'),
+        'is_featured': data.get('is_featured', False),
+    }
+
+def _idea_row(data):
+    return {
+        'title': data['title'],
+        'description': data.get('description'),
+        'status': data.get('status', 'new'),
+        'priority': data.get('priority', 0),
+    }
+
+def _sop_row(data):
+    return {
+        'title': data['title'],
+        'description': data.get('description'),
+        'content': data.get('content'),
+        'version': data.get('version', '1.0'),
+        'category': data.get('category'),
+    }
+
+def _kpi_row(data):
+    return {
+        'title': data['title'],
+        'description': data.get('description'),
+        'target_value': data.get('target_value'),
+        'current_value': data.get('current_value', 0),
+        'unit': data.get('unit'),
+        'category': data.get('category'),
+        'start_date': parse_date(data.get('start_date')),
+        'end_date': parse_date(data.get('end_date')),
+    }
+
+def bulk_insert(model, rows, chunk_size=SEED_CHUNK_SIZE):
+    """Insert row dicts with executemany-style Core inserts, one chunk at a time"""
+    from sqlalchemy import insert
+    for start in range(0, len(rows), chunk_size):
+        db.session.execute(insert(model), rows[start:start + chunk_size])
+
+def truncate_tables():
+    """Empty every model table, creating any that are missing"""
+    from sqlalchemy import delete, inspect
+    existing = set(inspect(db.engine).get_table_names())
+    tables = db.metadata.sorted_tables
+    if any(table.name not in existing for table in tables):
+        db.create_all()
+    
+    if db.engine.dialect.name == 'postgresql':
+        names = ', '.join(db.engine.dialect.identifier_preparer.format_table(t) for t in tables)
+        db.session.execute(db.text(f'TRUNCATE TABLE {names} RESTART IDENTITY CASCADE'))
+    else:
+        # Children first so foreign keys never point at deleted rows
+        for table in reversed(tables):
+            db.session.execute(delete(table))
+    db.session.commit()
+
 @click.command('seed')
 @click.option('--mode', type=click.Choice(['standard', 'reset', 'incremental']), default='standard',
               help='Seed mode: standard (default), reset (wipe first), or incremental (only missing)')
+@click.option('--hash-workers', type=int, default=None,
+              help='Processes used to hash passwords (default: CPU count)')
 @with_appcontext
-def seed_command(mode):
+def seed_command(mode, hash_workers):
     """Seed database with sample data."""
+    from functools import partial
+    from sqlalchemy import select
     from models.user import User
     from models.project import Project
     from models.idea import Idea
@@ -54,154 +134,347 @@ def seed_command(mode):
         logger.error("No seed data found. Exiting.")
         return
     
-    # Reset database if in reset mode
+    # Reset database if in reset mode; emptying the tables is far cheaper
+    # than dropping and recreating the schema
     if mode == 'reset':
         logger.info("Resetting database...")
-        db.drop_all()
-        db.create_all()
+        truncate_tables()
         logger.info("Database reset complete.")
     
     # Determine if we're running in incremental mode
     incremental = (mode == 'incremental')
     
-    # Seed users
-    logger.info("Seeding users...")
-    created_users = 0
+    def rows_of(build_row):
+        return lambda records: [build_row(data) for data in records]
     
-    for user_data in seed_data['users']:
-        email = user_data['email']
+    # (seed data key, model, natural key column, rows builder)
+    seeders = (
+        ('users', User, User.email, partial(_user_rows, hash_workers=hash_workers)),
+        ('projects', Project, Project.slug, rows_of(_project_row)),
+        ('ideas', Idea, Idea.title, rows_of(_idea_row)),
+        ('sops', SOP, SOP.title, rows_of(_sop_row)),
+        ('kpis', KPI, KPI.title, rows_of(_kpi_row)),
+    )
+    
+    for name, model, key_column, build_rows in seeders:
+        logger.info(f"Seeding {name}...")
+        
+        # In incremental mode, fetch every existing key in one query rather
+        # than probing once per record
+        existing = set(db.session.scalars(select(key_column))) if incremental else set()
+        records = []
+        skipped = 0
+        for record in seed_data.get(name, []):
+            key = record.get(key_column.key)
+            if incremental:
+                if key in existing:
+                    skipped += 1
+                    continue
+                existing.add(key)
+            records.append(record)
+        rows = build_rows(records)
         
-        # Check if user exists in incremental mode
-        if incremental and User.get_by_email(email):
-            logger.info(f"User {email} already exists, skipping.")
-            continue
-            
-        # Create new user
-        user = User(email=email, role=user_data['role'])
-        user.set_password(user_data['password'])
-        db.session.add(user)
-        created_users += 1
+        # One transaction per entity type
+        bulk_insert(model, rows)
+        db.session.commit()
+        
+        if skipped:
+            logger.info(f"Created {len(rows)} {name}, skipped {skipped} that already exist.")
+        else:
+            logger.info(f"Created {len(rows)} {name}.")
     
-    db.session.commit()
-    logger.info(f"Created {created_users} users.")
+    logger.info("🌱 Seed complete!")
+    return "Database seeding completed successfully."
+
+@click.command('init-db')
+@with_appcontext
+def init_db_command():
+    """Create database tables and stamp the current migration."""
+    from utils.schema import create_schema
     
-    # Seed projects
-    logger.info("Seeding projects...")
-    created_projects = 0
+    logger.info("Creating database tables...")
+    if create_schema(current_app):
+        logger.info("Database created and stamped at the latest migration.")
+    else:
+        logger.info("Database created (no migrations to stamp).")
+
+@click.command('compile-templates')
+@with_appcontext
+def compile_templates_command():
+    """Precompile Jinja templates into the bytecode cache."""
+    from utils.cache import compile_templates
     
-    for project_data in seed_data['projects']:
-        slug = project_data['slug']
-        
-        # Check if project exists in incremental mode
-        if incremental and Project.get_by_slug(slug):
-            logger.info(f"Project with slug '{slug}' already exists, skipping.")
-            continue
-            
-        # Create new project
-        project = Project(
-            title=project_data['title'],
-            slug=project_data['slug'],
-            description=project_data['description'],
-            long_description=project_data['long_description'],
-            image_url=project_data['image_url'],
-            demo_url=project_data['demo_url'],
-            github_url=project_data['github_url'],
-            download_url=project_data['download_url'],
-            is_featured=project_data['is_featured']
-        )
-        db.session.add(project)
-        created_projects += 1
+    if current_app.jinja_env.bytecode_cache is None:
+        logger.error("JINJA_BYTECODE_CACHE_DIR is not configured. Exiting.")
+        return
     
-    db.session.commit()
-    logger.info(f"Created {created_projects} projects.")
+    compiled = compile_templates(current_app)
+    logger.info(f"Compiled {compiled} templates into {current_app.config['JINJA_BYTECODE_CACHE_DIR']}")
+
+@click.command('build-assets')
+@with_appcontext
+def build_assets_command():
+    """Fingerprint and precompress static assets."""
+    from utils.assets import build_assets
     
-    # Seed ideas
-    logger.info("Seeding ideas...")
-    created_ideas = 0
+    dist_dir = current_app.config['ASSETS_DIST_FOLDER']
+    manifest = build_assets(current_app.static_folder, dist_dir)
+    logger.info(f"Built {len(manifest)} assets into {dist_dir}")
+
+ENTITIES = ('users', 'projects', 'ideas', 'sops', 'kpis')
+
+@click.command('generate-data')
+@click.option('--scale', type=int, default=1000, help='Rows per entity unless overridden below')
+@click.option('--users', type=int, help='Users to create')
+@click.option('--projects', type=int, help='Projects to create')
+@click.option('--ideas', type=int, help='Ideas to create')
+@click.option('--sops', type=int, help='SOPs to create')
+@click.option('--kpis', type=int, help='KPI series to create (each has --kpi-periods rows)')
+@click.option('--kpi-periods', type=int, default=12, help='Monthly history rows per KPI series')
+@click.option('--sop-kb', type=int, default=4, help='Approximate size of each SOP body in KB')
+@click.option('--seed', type=int, default=42, help='Random seed; the same seed gives the same data')
+@click.option('--chunk-size', type=int, default=5000, help='Rows per insert/COPY batch')
+@click.option('--snapshot', type=click.Path(dir_okay=False),
+              help='Write a standalone SQLite file instead of the configured database')
+@click.option('--truncate', is_flag=True, help='Delete existing rows from the target tables first')
+@with_appcontext
+def generate_data_command(scale, kpi_periods, sop_kb, seed, chunk_size, snapshot, truncate, **overrides):
+    """Generate a large synthetic dataset for scale testing."""
+    import time
+    from sqlalchemy import create_engine, delete, event, func, select
+    from utils.datagen import generate
+    from utils.schema import head_revisions, migrations_directory
     
-    for idea_data in seed_data['ideas']:
-        # For incremental mode, we'll skip if an idea with the same title exists
-        title = idea_data['title']
+    counts = {name: scale if overrides[name] is None else overrides[name] for name in ENTITIES}
+    tables = [table for table in db.metadata.sorted_tables
+              if table.name in ('user', 'projects', 'ideas', 'sops', 'kpis')]
+    
+    if snapshot:
+        snapshot = os.path.abspath(snapshot)
+        if os.path.exists(snapshot):
+            os.remove(snapshot)
+        engine = create_engine(f'sqlite:///{snapshot}')
         
-        if incremental:
-            existing_idea = Idea.query.filter_by(title=title).first()
-            if existing_idea:
-                logger.info(f"Idea '{title}' already exists, skipping.")
-                continue
+        # A snapshot is rebuilt rather than recovered, so skip journaling and fsyncs
+        @event.listens_for(engine, 'connect')
+        def fast_pragmas(dbapi_connection, connection_record):
+            dbapi_connection.execute('PRAGMA journal_mode=OFF')
+            dbapi_connection.execute('PRAGMA synchronous=OFF')
         
-        # Create new idea
-        idea = Idea(
-            title=title,
-            description=idea_data['description'],
-            status=idea_data['status'],
-            priority=idea_data['priority']
-        )
-        db.session.add(idea)
-        created_ideas += 1
+        db.metadata.create_all(engine)
+    else:
+        engine = db.engine
     
-    db.session.commit()
-    logger.info(f"Created {created_ideas} ideas.")
-    
-    # Seed SOPs
-    logger.info("Seeding SOPs...")
-    created_sops = 0
-    
-    for sop_data in seed_data['sops']:
-        title = sop_data['title']
+    start = time.perf_counter()
+    with engine.begin() as connection:
+        if truncate:
+            for table in reversed(tables):
+                connection.execute(delete(table))
+        else:
+            populated = [table.name for table in tables
+                         if connection.execute(select(func.count()).select_from(table)).scalar()]
+            if populated:
+                logger.error(f"Tables already contain rows: {', '.join(populated)}. "
+                             f"Use --truncate or --snapshot.")
+                raise SystemExit(1)
         
-        if incremental:
-            existing_sop = SOP.query.filter_by(title=title).first()
-            if existing_sop:
-                logger.info(f"SOP '{title}' already exists, skipping.")
-                continue
+        written = generate(connection, counts, seed=seed, sop_bytes=sop_kb * 1024,
+                           kpi_periods=kpi_periods, chunk_size=chunk_size)
         
-        # Create new SOP
-        sop = SOP(
-            title=title,
-            description=sop_data['description'],
-            content=sop_data['content'],
-            version=sop_data['version'],
-            category=sop_data['category']
-        )
-        db.session.add(sop)
-        created_sops += 1
+        if snapshot and head_revisions(current_app) is not None:
+            # Stamp the snapshot so `flask db upgrade` treats it as current
+            from alembic.runtime.migration import MigrationContext
+            from alembic.script import ScriptDirectory
+            script = ScriptDirectory(migrations_directory(current_app))
+            MigrationContext.configure(connection).stamp(script, 'heads')
     
-    db.session.commit()
-    logger.info(f"Created {created_sops} SOPs.")
+    elapsed = time.perf_counter() - start
+    total = sum(written.values())
+    logger.info(f"Generated {total} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+    
+    if snapshot:
+        with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+            connection.exec_driver_sql('VACUUM')
+        engine.dispose()
+        logger.info(f"Snapshot written to {snapshot} ({os.path.getsize(snapshot) / 1024 / 1024:.1f} MB)")
+
+@click.group('data-migrate')
+def data_migrate_group():
+    """Run batched, resumable data migrations."""
+
+@data_migrate_group.command('list')
+@with_appcontext
+def data_migrate_list_command():
+    """List registered data migrations and their progress."""
+    from utils.datamigrations import MIGRATIONS, get_state
     
-    # Seed KPIs
-    logger.info("Seeding KPIs...")
-    created_kpis = 0
+    with db.engine.connect() as connection:
+        has_states = db.inspect(connection).has_table('data_migrations')
+        for name in sorted(MIGRATIONS):
+            state = get_state(connection, name) if has_states else None
+            if state is None:
+                status = 'not started'
+            elif state['completed_at']:
+                status = f"completed {state['completed_at']:%Y-%m-%d %H:%M}"
+            else:
+                status = f"in progress (last key {state['last_key']})"
+            rows = state['rows_processed'] if state else 0
+            click.echo(f"{name:<32} {status:<36} {rows} rows")
+
+@data_migrate_group.command('run')
+@click.argument('name')
+@click.option('--batch-size', type=int, help='Rows per batch (one transaction each)')
+@click.option('--pause', type=float, help='Seconds to sleep between batches')
+@click.option('--max-batches', type=int, help='Stop after this many batches; rerun to resume')
+@click.option('--dry-run', is_flag=True, help='Only count the rows that would be processed')
+@click.option('--restart', is_flag=True, help='Discard the checkpoint and start from the beginning')
+@with_appcontext
+def data_migrate_run_command(name, batch_size, pause, max_batches, dry_run, restart):
+    """Run or resume the data migration NAME."""
+    from utils.datamigrations import MIGRATIONS, run_migration
     
-    for kpi_data in seed_data['kpis']:
-        title = kpi_data['title']
-        
-        if incremental:
-            existing_kpi = KPI.query.filter_by(title=title).first()
-            if existing_kpi:
-                logger.info(f"KPI '{title}' already exists, skipping.")
-                continue
-        
-        # Create new KPI
-        kpi = KPI(
-            title=title,
-            description=kpi_data['description'],
-            target_value=kpi_data['target_value'],
-            current_value=kpi_data['current_value'],
-            unit=kpi_data['unit'],
-            category=kpi_data['category'],
-            start_date=parse_date(kpi_data['start_date']),
-            end_date=parse_date(kpi_data['end_date'])
-        )
-        db.session.add(kpi)
-        created_kpis += 1
+    if name not in MIGRATIONS:
+        raise click.BadParameter(f"unknown migration, expected one of: {', '.join(sorted(MIGRATIONS))}",
+                                 param_hint='NAME')
     
-    db.session.commit()
-    logger.info(f"Created {created_kpis} KPIs.")
+    try:
+        result = run_migration(MIGRATIONS[name](), db.engine, batch_size=batch_size, pause=pause,
+                               dry_run=dry_run, restart=restart, max_batches=max_batches)
+    except KeyboardInterrupt:
+        # Every committed batch is checkpointed; the interrupted one rolled back
+        logger.warning(f"Interrupted. Run `flask data-migrate run {name}` again to resume.")
+        return
     
-    logger.info("🌱 Seed complete!")
-    return "Database seeding completed successfully."
+    if dry_run:
+        resume = f" after {result['last_key']}" if result['last_key'] is not None else ''
+        logger.info(f"{name}: {result['pending_rows']} rows to process{resume}")
+
+@click.command('export')
+@click.argument('path', type=click.Path(file_okay=False))
+@click.option('--table', 'tables', multiple=True, help='Only export this table (repeatable)')
+@click.option('--chunk-size', type=int, default=5000, help='Rows fetched and written per batch')
+@click.option('--jobs', type=int, default=1, help='Tables to export in parallel')
+@with_appcontext
+def export_command(path, tables, chunk_size, jobs):
+    """Export every table to an archive directory at PATH."""
+    import models.data_migration  # noqa: F401 - register the table in the metadata
+    from utils.archive import export_archive
+    from utils.schema import current_revisions
+    
+    unknown = set(tables) - set(db.metadata.tables)
+    if unknown:
+        raise click.BadParameter(f"unknown table(s): {', '.join(sorted(unknown))}", param_hint='--table')
+    
+    with db.engine.connect() as connection:
+        revision = ','.join(sorted(current_revisions(connection))) or None
+    manifest = export_archive(db.engine, db.metadata, path, tables=tables or None,
+                              chunk_size=chunk_size, jobs=jobs, revision=revision)
+    total = sum(entry['rows'] for entry in manifest['tables'].values())
+    logger.info(f"Exported {total} rows from {len(manifest['tables'])} tables to {path}")
+
+@click.command('import')
+@click.argument('path', type=click.Path(exists=True, file_okay=False))
+@click.option('--table', 'tables', multiple=True, help='Only import this table (repeatable)')
+@click.option('--on-conflict', type=click.Choice(['error', 'skip', 'update']), default='error',
+              help='Rows clashing with existing keys: skip ignores any unique clash, '
+                   'update overwrites by primary key only')
+@click.option('--truncate', is_flag=True, help='Delete existing rows from the imported tables first')
+@click.option('--chunk-size', type=int, default=5000, help='Rows per insert batch')
+@click.option('--jobs', type=int, default=1, help='Tables to import in parallel (ignored on SQLite)')
+@with_appcontext
+def import_command(path, tables, on_conflict, truncate, chunk_size, jobs):
+    """Import an archive directory created by `flask export`."""
+    import models.data_migration  # noqa: F401 - register the table in the metadata
+    from sqlalchemy.exc import IntegrityError
+    from utils.archive import import_archive, read_manifest
+    from utils.schema import current_revisions
+    
+    manifest = read_manifest(path)
+    with db.engine.connect() as connection:
+        revision = ','.join(sorted(current_revisions(connection))) or None
+    if manifest['revision'] != revision:
+        logger.warning(f"Archive was exported at revision {manifest['revision']} "
+                       f"but the database is at {revision}")
+    
+    try:
+        counts = import_archive(db.engine, db.metadata, path, tables=tables or None, on_conflict=on_conflict,
+                                truncate=truncate, chunk_size=chunk_size, jobs=jobs)
+    except IntegrityError as e:
+        logger.error(f"Import failed: {e.orig}. Use --on-conflict skip/update or --truncate.")
+        raise SystemExit(1)
+    logger.info(f"Imported {sum(counts.values())} rows into {len(counts)} tables from {path}")
+
+@click.group('profile')
+def profile_group():
+    """Profile the application."""
+
+@profile_group.command('token')
+@with_appcontext
+def profile_token_command():
+    """Print a signed X-Profile header value for per-request cProfile."""
+    from utils.profiling import make_profile_token
+    
+    click.echo(make_profile_token(current_app))
+
+@profile_group.command('sample')
+@click.argument('path')
+@click.option('--seconds', default=5.0, help='How long to keep requesting PATH')
+@click.option('--interval-ms', default=1.0, help='Sampling interval in milliseconds')
+@click.option('--output', type=click.Path(dir_okay=False), help='Write collapsed stacks to this file')
+@with_appcontext
+def profile_sample_command(path, seconds, interval_ms, output):
+    """Request PATH in-process for a while and sample where time goes."""
+    import time
+    from utils.profiling import SamplingProfiler
+    
+    client = current_app.test_client()
+    profiler = SamplingProfiler(interval=interval_ms / 1000)
+    profiler.start(ignore_current_thread=False)
+    requests_made = 0
+    deadline = time.monotonic() + seconds
+    try:
+        while time.monotonic() < deadline:
+            client.get(path)
+            requests_made += 1
+    finally:
+        profiler.stop()
+    
+    logger.info(f"{requests_made} requests to {path}, {profiler.samples} samples")
+    if output:
+        with open(output, 'w') as f:
+            f.write(profiler.collapsed())
+        logger.info(f"Collapsed stacks written to {output}")
+    else:
+        click.echo(profiler.collapsed())
+
+@profile_group.command('show')
+@click.argument('profile_id')
+@click.option('--limit', default=30, help='Number of functions to show')
+@with_appcontext
+def profile_show_command(profile_id, limit):
+    """Print a saved request profile (.prof) or sample (.collapsed)."""
+    import pstats
+    from utils.profiling import load_sample, profile_output_dir
+    
+    stats_path = os.path.join(profile_output_dir(current_app), f'{profile_id}.prof')
+    if os.path.exists(stats_path):
+        pstats.Stats(stats_path).sort_stats('cumulative').print_stats(limit)
+        return
+    
+    stacks = load_sample(current_app, profile_id)
+    if stacks is None:
+        logger.error(f"No profile found with id {profile_id}")
+        return
+    click.echo(stacks)
 
 def register_commands(app):
     """Register Flask CLI commands"""
     app.cli.add_command(seed_command)
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(compile_templates_command)
+    app.cli.add_command(build_assets_command)
+    app.cli.add_command(generate_data_command)
+    app.cli.add_command(data_migrate_group)
+    app.cli.add_command(export_command)
+    app.cli.add_command(import_command)
+    app.cli.add_command(profile_group)
@@ -15,10 +15,41 @@ class Config:
     # Database
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', f'sqlite:///{os.path.join(basedir, "app.db")}')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SCHEMA_CHECK_ON_STARTUP = os.getenv('SCHEMA_CHECK_ON_STARTUP', 'True').lower() in ('true', '1', 't')
+    AUTO_CREATE_SCHEMA = False  # Never run DDL from request-serving processes
     
     # Logging
     LOG_FILE = os.getenv('LOG_FILE', 'app.log')
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    LOG_FORMAT = os.getenv('LOG_FORMAT', 'json')  # json or text
+    LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', 10 * 1024 * 1024))
+    LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', 5))
+    LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))
+    LOG_QUEUE_POLICY = os.getenv('LOG_QUEUE_POLICY', 'drop')  # drop or block when the queue is full
+    LOG_QUEUE_BLOCK_TIMEOUT = float(os.getenv('LOG_QUEUE_BLOCK_TIMEOUT', 0.05))
+    
+    # Request timing (Server-Timing header, per-endpoint histogram, query budget)
+    REQUEST_TIMING_ENABLED = os.getenv('REQUEST_TIMING_ENABLED', 'True').lower() in ('true', '1', 't')
+    SERVER_TIMING_HEADER = os.getenv('SERVER_TIMING_HEADER', 'True').lower() in ('true', '1', 't')
+    TIMING_STATS_ENDPOINT = os.getenv('TIMING_STATS_ENDPOINT', 'False').lower() in ('true', '1', 't')
+    QUERY_BUDGET = int(os.getenv('QUERY_BUDGET', 0))  # Max SQL queries per request, 0 disables
+    
+    # Prometheus /metrics (set PROMETHEUS_MULTIPROC_DIR when running several workers)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'False').lower() in ('true', '1', 't')
+    METRICS_TOKEN = os.getenv('METRICS_TOKEN')  # Bearer token for scrapes
+    METRICS_REQUIRE_TOKEN = False  # Refuse to serve /metrics without METRICS_TOKEN
+    
+    # Readiness probe (/ready)
+    READINESS_CACHE_SECONDS = float(os.getenv('READINESS_CACHE_SECONDS', 5))
+    READINESS_MAX_POOL_UTILIZATION = float(os.getenv('READINESS_MAX_POOL_UTILIZATION', 0.9))
+    READINESS_MIN_FREE_MB = int(os.getenv('READINESS_MIN_FREE_MB', 50))
+    READINESS_DB_TIMEOUT = float(os.getenv('READINESS_DB_TIMEOUT', 2))  # Seconds for the SELECT 1, including connecting
+    
+    # Profiling (admin-only /debug/profile and signed X-Profile request profiles)
+    PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'False').lower() in ('true', '1', 't')
+    PROFILING_OUTPUT_DIR = os.getenv('PROFILING_OUTPUT_DIR', os.path.join(basedir, 'profiles'))
+    PROFILING_MAX_SECONDS = int(os.getenv('PROFILING_MAX_SECONDS', 60))
+    PROFILING_TOKEN_MAX_AGE = int(os.getenv('PROFILING_TOKEN_MAX_AGE', 3600))
     
     # Session
     PERMANENT_SESSION_LIFETIME = timedelta(days=30)
@@ -35,6 +66,21 @@ class Config:
     MAIL_PASSWORD = os.getenv('MAIL_PASSWORD')
     MAIL_DEFAULT_SENDER = os.getenv('MAIL_DEFAULT_SENDER')
     
+    # Optional components; disabling them skips their imports at boot
+    API_DOCS_ENABLED = os.getenv('API_DOCS_ENABLED', 'True').lower() in ('true', '1', 't')
+    ADMIN_ENABLED = os.getenv('ADMIN_ENABLED', 'True').lower() in ('true', '1', 't')
+    
+    # Static assets (fingerprinted build output, see `flask build-assets`)
+    ASSETS_DIST_FOLDER = os.path.join(basedir, 'static', 'dist')
+    
+    # Tools catalog (reloaded automatically when the file changes)
+    TOOLS_CATALOG_PATH = os.getenv('TOOLS_CATALOG_PATH', os.path.join(basedir, 'projects.json'))
+    
+    # Templates
+    FRAGMENT_CACHE_ENABLED = os.getenv('FRAGMENT_CACHE_ENABLED', 'True').lower() in ('true', '1', 't')
+    FRAGMENT_CACHE_MAX_ENTRIES = int(os.getenv('FRAGMENT_CACHE_MAX_ENTRIES', 256))
+    JINJA_BYTECODE_CACHE_DIR = os.getenv('JINJA_BYTECODE_CACHE_DIR', os.path.join(basedir, '.jinja_cache'))
+    
     @staticmethod
     def init_app(app):
         # Create upload folder if it doesn't exist
@@ -43,14 +89,26 @@ class Config:
 class DevelopmentConfig(Config):
     DEBUG = True
     SQLALCHEMY_ECHO = True  # Log SQL queries
+    AUTO_CREATE_SCHEMA = True  # Create missing tables on startup for convenience
+    TIMING_STATS_ENDPOINT = True
+    QUERY_BUDGET = int(os.getenv('QUERY_BUDGET', 20))  # Logs a warning when exceeded
 
 class ProductionConfig(Config):
     DEBUG = False
+    # Swagger docs and Flask-Admin are opt-in in production: enabling them
+    # imports flask-restx and flask-admin at boot
+    API_DOCS_ENABLED = os.getenv('API_DOCS_ENABLED', 'False').lower() in ('true', '1', 't')
+    ADMIN_ENABLED = os.getenv('ADMIN_ENABLED', 'False').lower() in ('true', '1', 't')
+    # Scrapes expose endpoint names and traffic; never serve them unauthenticated
+    METRICS_REQUIRE_TOKEN = True
     
 class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = False
+    JINJA_BYTECODE_CACHE_DIR = None
+    SCHEMA_CHECK_ON_STARTUP = False  # Tests create their own tables
+    QUERY_BUDGET = 20  # Requests over budget raise QueryBudgetExceeded
 
 # Config dictionary for easy lookup
 config = {
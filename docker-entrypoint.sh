@@ -0,0 +1,19 @@
+#!/bin/sh
+# Bring the database schema to the migration head, then run the container's
+# command (gunicorn by default). Workers never create tables themselves.
+set -e
+
+export FLASK_APP="${FLASK_APP:-app.py}"
+
+# A database container may still be starting, so retry for a few seconds
+attempt=1
+until flask db upgrade; do
+    if [ "$attempt" -ge "${DB_UPGRADE_ATTEMPTS:-5}" ]; then
+        echo "flask db upgrade failed after $attempt attempts" >&2
+        exit 1
+    fi
+    attempt=$((attempt + 1))
+    sleep 2
+done
+
+exec "$@"
@@ -0,0 +1,21 @@
+"""
+Gunicorn settings (picked up automatically from the working directory)
+
+When PROMETHEUS_MULTIPROC_DIR is set, workers share metric samples through
+that directory. It is emptied here, before the app is loaded (this file is
+read before --preload builds the app), and samples of workers that exit are
+marked dead so their gauges drop out of the live sums.
+"""
+import os
+import shutil
+
+multiproc_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+if multiproc_dir:
+    shutil.rmtree(multiproc_dir, ignore_errors=True)
+    os.makedirs(multiproc_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if multiproc_dir:
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
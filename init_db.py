@@ -1,4 +1,5 @@
 from app import app, db
+from utils.schema import create_schema
 from models.user import User
 from models.project import Project
 from models.idea import Idea
@@ -7,7 +8,7 @@ from models.kpi import KPI
 import os
 
 with app.app_context():
-    db.create_all()
+    create_schema(app)
     
     # Create admin user if none exists
     if User.query.filter_by(is_admin=True).first() is None:
@@ -0,0 +1,27 @@
+"""
+Operations shared by the Alembic revisions
+
+Revisions import from here, never from the application, so that changing
+application code cannot change what an already-applied revision does.
+Treat these functions as frozen: if a new revision needs different
+behaviour, add a new function rather than editing one that revisions use.
+"""
+from alembic import op
+
+
+def create_index_concurrently(name, table, columns, **kwargs):
+    """
+    ``op.create_index`` that doesn't block writes on PostgreSQL
+
+    PostgreSQL builds the index CONCURRENTLY, which cannot run inside a
+    transaction, so it runs in an autocommit block; other dialects ignore
+    the option and build it as usual.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(name, table, columns, postgresql_concurrently=True, **kwargs)
+
+
+def drop_index_concurrently(name, table):
+    """``op.drop_index`` counterpart of create_index_concurrently()"""
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
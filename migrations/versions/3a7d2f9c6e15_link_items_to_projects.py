@@ -0,0 +1,57 @@
+"""Link ideas, SOPs and KPIs to projects
+
+Revision ID: 3a7d2f9c6e15
+Revises: e51d0b6a2c84
+Create Date: 2026-10-19 18:02:44.613290
+
+Adds a nullable, indexed project_id foreign key to each table, so existing
+rows stay unlinked and deleting a project only unlinks its items. No
+table is rewritten on upgrade, and on PostgreSQL the indexes are built
+CONCURRENTLY. Tables that already have the column (created by create_all)
+are skipped. Downgrading SQLite copies each table (batch mode), as SQLite
+cannot drop a column with a foreign key.
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = '3a7d2f9c6e15'
+down_revision = 'e51d0b6a2c84'
+branch_labels = None
+depends_on = None
+
+TABLES = ('ideas', 'sops', 'kpis')
+
+
+def upgrade():
+    offline = context.is_offline_mode()
+    inspector = None if offline else sa.inspect(op.get_bind())
+
+    for table in TABLES:
+        if offline or 'project_id' not in {column['name'] for column in inspector.get_columns(table)}:
+            # Named as PostgreSQL names the create_all constraint
+            constraint = f'{table}_project_id_fkey'
+            if op.get_context().dialect.name == 'sqlite':
+                # SQLite cannot ALTER constraints, but a nullable column may
+                # carry its own REFERENCES clause, which avoids copying the table
+                op.execute(f'ALTER TABLE {table} ADD COLUMN project_id INTEGER '
+                           f'CONSTRAINT {constraint} REFERENCES projects (id) ON DELETE SET NULL')
+            else:
+                op.add_column(table, sa.Column('project_id', sa.Integer(), nullable=True))
+                op.create_foreign_key(constraint, table, 'projects', ['project_id'], ['id'], ondelete='SET NULL')
+
+        index = f'ix_{table}_project_id'
+        if offline or index not in {existing['name'] for existing in inspector.get_indexes(table)}:
+            create_index_concurrently(index, table, ['project_id'])
+
+
+def downgrade():
+    for table in TABLES:
+        drop_index_concurrently(f'ix_{table}_project_id', table)
+        # Dropping the column drops its foreign key as well; SQLite needs a
+        # copy of the table for that
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('project_id')
@@ -0,0 +1,108 @@
+"""Initial schema
+
+Revision ID: 8b1f3c2d9a47
+Revises: 
+Create Date: 2026-10-19 16:10:20.978580
+
+Databases created before migrations existed (by create_all) already have
+some or all of these tables, so each one is only created when missing.
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b1f3c2d9a47'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Offline (--sql) there is no database to inspect; emit every table
+    existing = set() if context.is_offline_mode() else set(sa.inspect(op.get_bind()).get_table_names())
+
+    def create_table(name, *columns):
+        if name not in existing:
+            op.create_table(name, *columns)
+
+    create_table('ideas',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('priority', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    create_table('kpis',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('target_value', sa.Float(), nullable=True),
+    sa.Column('current_value', sa.Float(), nullable=True),
+    sa.Column('unit', sa.String(length=20), nullable=True),
+    sa.Column('category', sa.String(length=50), nullable=True),
+    sa.Column('start_date', sa.DateTime(), nullable=True),
+    sa.Column('end_date', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    create_table('projects',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=100), nullable=False),
+    sa.Column('slug', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('long_description', sa.Text(), nullable=True),
+    sa.Column('image_url', sa.String(length=200), nullable=True),
+    sa.Column('demo_url', sa.String(length=200), nullable=True),
+    sa.Column('github_url', sa.String(length=200), nullable=True),
+    sa.Column('download_url', sa.String(length=200), nullable=True),
+    sa.Column('is_featured', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('slug')
+    )
+    create_table('sops',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('content', sa.Text(), nullable=True),
+    sa.Column('version', sa.String(length=10), nullable=True),
+    sa.Column('category', sa.String(length=50), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    create_table('user',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(length=120), nullable=False),
+    sa.Column('password_hash', sa.String(length=128), nullable=False),
+    sa.Column('role', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('email')
+    )
+    create_table('data_migrations',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('last_key', sa.String(length=255), nullable=True),
+    sa.Column('rows_processed', sa.Integer(), nullable=False),
+    sa.Column('batches', sa.Integer(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('data_migrations')
+    op.drop_table('user')
+    op.drop_table('sops')
+    op.drop_table('projects')
+    op.drop_table('kpis')
+    op.drop_table('ideas')
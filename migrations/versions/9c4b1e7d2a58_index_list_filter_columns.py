@@ -0,0 +1,46 @@
+"""Index the columns the list API filters, sorts and facets on
+
+Revision ID: 9c4b1e7d2a58
+Revises: 3a7d2f9c6e15
+Create Date: 2026-10-19 19:14:06.387512
+
+Every column in a model's filter_columns must be indexed; these are the
+ones that were not already (titles of projects and the project_id columns
+are). On PostgreSQL the indexes are built CONCURRENTLY so the tables stay
+writable, and indexes that already exist (create_all) are skipped.
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4b1e7d2a58'
+down_revision = '3a7d2f9c6e15'
+branch_labels = None
+depends_on = None
+
+COLUMNS = {
+    'projects': ('is_featured', 'created_at'),
+    'ideas': ('status', 'priority', 'created_at'),
+    'sops': ('title', 'category'),
+    'kpis': ('title', 'category'),
+}
+
+
+def upgrade():
+    inspector = None if context.is_offline_mode() else sa.inspect(op.get_bind())
+
+    for table, columns in COLUMNS.items():
+        existing = set() if inspector is None else {index['name'] for index in inspector.get_indexes(table)}
+        for column in columns:
+            name = f'ix_{table}_{column}'
+            if name not in existing:
+                create_index_concurrently(name, table, [column])
+
+
+def downgrade():
+    for table, columns in COLUMNS.items():
+        for column in columns:
+            drop_index_concurrently(f'ix_{table}_{column}', table)
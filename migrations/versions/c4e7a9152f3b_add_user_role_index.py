@@ -0,0 +1,57 @@
+"""Add user.role with an index and backfill it from is_admin
+
+Revision ID: c4e7a9152f3b
+Revises: 8b1f3c2d9a47
+Create Date: 2026-10-19 16:12:41.204117
+
+Works on SQLite and PostgreSQL. Columns and indexes are found with the
+SQLAlchemy inspector (not PRAGMA), so databases that already have the role
+column are left as they are. The backfill from the legacy is_admin flag
+runs outside the migration transaction as the batched, resumable
+backfill-user-roles data migration, and on PostgreSQL the index is built
+CONCURRENTLY so the table stays writable while it builds.
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e7a9152f3b'
+down_revision = '8b1f3c2d9a47'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'ix_user_role'
+
+
+def upgrade():
+    if context.is_offline_mode():
+        # No database to inspect; run `flask data-migrate run backfill-user-roles` afterwards
+        op.add_column('user', sa.Column('role', sa.String(length=32), nullable=False, server_default='Viewer'))
+        op.create_index(INDEX_NAME, 'user', ['role'])
+        return
+
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name'] for column in inspector.get_columns('user')}
+    indexes = {index['name'] for index in inspector.get_indexes('user')}
+
+    if 'role' not in columns:
+        # A constant default is a metadata-only change on PostgreSQL 11+
+        op.add_column('user', sa.Column('role', sa.String(length=32), nullable=False, server_default='Viewer'))
+
+    if 'is_admin' in columns:
+        from utils.datamigrations import BackfillUserRoles, run_migration
+
+        # Commit the DDL so each batch commits (and releases its locks) on its own
+        with op.get_context().autocommit_block():
+            run_migration(BackfillUserRoles(), op.get_bind())
+
+    if INDEX_NAME not in indexes:
+        create_index_concurrently(INDEX_NAME, 'user', ['role'])
+
+
+def downgrade():
+    # The role column predates migrations on most databases, so it is kept
+    drop_index_concurrently(INDEX_NAME, 'user')
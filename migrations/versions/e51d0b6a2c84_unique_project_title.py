@@ -0,0 +1,42 @@
+"""Add a unique index on projects.title
+
+Revision ID: e51d0b6a2c84
+Revises: c4e7a9152f3b
+Create Date: 2026-10-19 16:41:07.532981
+
+The API used to check for an existing title with a query before every
+insert; the index makes the database enforce it instead. Duplicate titles
+already in the table must be renamed first, so the upgrade stops with a
+list of them rather than failing halfway through building the index.
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision = 'e51d0b6a2c84'
+down_revision = 'c4e7a9152f3b'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'ix_projects_title'
+
+
+def upgrade():
+    if not context.is_offline_mode():
+        bind = op.get_bind()
+        if INDEX_NAME in {index['name'] for index in sa.inspect(bind).get_indexes('projects')}:
+            return
+        duplicates = bind.execute(sa.text(
+            'SELECT title FROM projects GROUP BY title HAVING COUNT(*) > 1 ORDER BY title LIMIT 10'
+        )).scalars().all()
+        if duplicates:
+            raise RuntimeError(f"Rename duplicate project titles before upgrading: {', '.join(duplicates)}")
+
+    create_index_concurrently(INDEX_NAME, 'projects', ['title'], unique=True)
+
+
+def downgrade():
+    drop_index_concurrently(INDEX_NAME, 'projects')
@@ -0,0 +1,28 @@
+from datetime import datetime
+from app import db
+
+class DataMigrationState(db.Model):
+    """Checkpoint for a batched data migration (see utils/datamigrations.py)"""
+    __tablename__ = 'data_migrations'
+
+    name = db.Column(db.String(100), primary_key=True)
+    last_key = db.Column(db.String(255))
+    rows_processed = db.Column(db.Integer, nullable=False, default=0)
+    batches = db.Column(db.Integer, nullable=False, default=0)
+    started_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    completed_at = db.Column(db.DateTime)
+
+    def __repr__(self):
+        return f'<DataMigrationState {self.name}>'
+
+    def serialize(self):
+        return {
+            'name': self.name,
+            'last_key': self.last_key,
+            'rows_processed': self.rows_processed,
+            'batches': self.batches,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+        }
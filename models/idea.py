@@ -1,18 +1,23 @@
 from datetime import datetime
 from app import db
+from models.rows import RowSelectMixin
 
-class Idea(db.Model):
+class Idea(RowSelectMixin, db.Model):
     """Idea model for project ideas and concepts"""
     __tablename__ = 'ideas'
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text)
-    status = db.Column(db.String(20), default='new')  # new, in_progress, completed, archived
-    priority = db.Column(db.Integer, default=0)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    status = db.Column(db.String(20), default='new', index=True)  # new, in_progress, completed, archived
+    priority = db.Column(db.Integer, default=0, index=True)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='SET NULL'), index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    filter_columns = ('status', 'priority', 'project_id', 'created_at')
+    facet_columns = ('status', 'priority')
+
     def __repr__(self):
         return f'<Idea {self.title}>'
     
@@ -32,6 +37,7 @@ class Idea(db.Model):
             'description': self.description,
             'status': self.status,
             'priority': self.priority,
+            'project_id': self.project_id,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
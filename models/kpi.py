@@ -1,22 +1,27 @@
 from datetime import datetime
 from app import db
+from models.rows import RowSelectMixin
 
-class KPI(db.Model):
+class KPI(RowSelectMixin, db.Model):
     """Key Performance Indicator model"""
     __tablename__ = 'kpis'
     
     id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(100), nullable=False)
+    title = db.Column(db.String(100), nullable=False, index=True)
     description = db.Column(db.Text)
     target_value = db.Column(db.Float)
     current_value = db.Column(db.Float, default=0)
     unit = db.Column(db.String(20))
-    category = db.Column(db.String(50))
+    category = db.Column(db.String(50), index=True)
     start_date = db.Column(db.DateTime)
     end_date = db.Column(db.DateTime)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='SET NULL'), index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    filter_columns = ('title', 'category', 'project_id')
+    facet_columns = ('category',)
+
     def __repr__(self):
         return f'<KPI {self.title}>'
     
@@ -28,11 +33,16 @@ class KPI(db.Model):
             query = query.filter_by(category=category)
         return query.order_by(cls.title).all()
     
+    @staticmethod
+    def calculate_progress(current_value, target_value):
+        """Progress towards the target as a percentage clamped to 0-100"""
+        if target_value and target_value > 0:
+            return min(100, max(0, ((current_value or 0) / target_value) * 100))
+        return 0
+    
     def progress_percentage(self):
         """Calculate the progress percentage"""
-        if self.target_value and self.target_value > 0:
-            return min(100, max(0, (self.current_value / self.target_value) * 100))
-        return 0
+        return self.calculate_progress(self.current_value, self.target_value)
     
     def serialize(self):
         """Convert KPI to dictionary for API responses"""
@@ -47,6 +57,7 @@ class KPI(db.Model):
             'progress_percentage': self.progress_percentage(),
             'start_date': self.start_date.isoformat() if self.start_date else None,
             'end_date': self.end_date.isoformat() if self.end_date else None,
+            'project_id': self.project_id,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
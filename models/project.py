@@ -1,12 +1,16 @@
 from datetime import datetime
 from app import db
+from models.idea import Idea
+from models.kpi import KPI
+from models.rows import RowSelectMixin
+from models.sop import SOP
 
-class Project(db.Model):
+class Project(RowSelectMixin, db.Model):
     """Project model for portfolio projects"""
     __tablename__ = 'projects'
     
     id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(100), nullable=False)
+    title = db.Column(db.String(100), nullable=False, unique=True, index=True)
     slug = db.Column(db.String(100), unique=True, nullable=False)
     description = db.Column(db.Text)
     long_description = db.Column(db.Text)
@@ -14,10 +18,20 @@ class Project(db.Model):
     demo_url = db.Column(db.String(200))
     github_url = db.Column(db.String(200))
     download_url = db.Column(db.String(200))
-    is_featured = db.Column(db.Boolean, default=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    is_featured = db.Column(db.Boolean, default=False, index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    filter_columns = ('title', 'is_featured', 'created_at')
+    facet_columns = ('is_featured',)
+
+    # Lazy by default; the API eager loads them with selectinload when asked
+    # to include them. Deleting a project unlinks its items rather than
+    # deleting them.
+    ideas = db.relationship(Idea, backref='project', order_by=Idea.id)
+    sops = db.relationship(SOP, backref='project', order_by=SOP.id)
+    kpis = db.relationship(KPI, backref='project', order_by=KPI.id)
+
     def __repr__(self):
         return f'<Project {self.title}>'
     
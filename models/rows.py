@@ -0,0 +1,59 @@
+"""
+Column-tuple selects for the list endpoints
+
+Listing through the ORM materializes a full instance per row (identity map
+entry, instrumented attribute state) only to serialize it and throw it
+away. Models with RowSelectMixin build a ``select`` of plain columns
+instead; the result rows expose the columns as attributes, so the API
+schemas' ``serialize_many`` (schemas/__init__.py) turns them into the same
+dicts as it does for instances.
+"""
+from sqlalchemy import func, select
+from app import db
+
+
+class RowSelectMixin:
+    """Adds ``row_select()`` and the list API's filter and facet settings"""
+    # Column names the row select reads, in order; None selects every column
+    serialized_columns = None
+    # Columns the list API may filter and sort on; each must be indexed
+    # (see routes/api/filters.py)
+    filter_columns = ()
+    # Low-cardinality columns the list API can return facet counts for
+    facet_columns = ()
+
+    @classmethod
+    def row_columns(cls):
+        table = cls.__table__
+        if cls.serialized_columns is None:
+            return list(table.columns)
+        return [table.c[name] for name in cls.serialized_columns]
+
+    @classmethod
+    def row_select(cls):
+        """A select of the serialized columns, for callers that add their own criteria"""
+        # Mapped attributes rather than bare table columns: rows are still
+        # plain tuples, but the statement keeps its model for the ORM
+        # execute hooks (per-model DB latency metrics)
+        return select(*(getattr(cls, column.key) for column in cls.row_columns()))
+
+    @classmethod
+    def facet_counts(cls, names, *criteria):
+        """
+        ``{name: [{'value': v, 'count': n}, ...]}`` over the rows matching
+        ``criteria``, most common value first
+
+        One GROUP BY over all the columns together, summed per column here,
+        rather than a query per column.
+        """
+        columns = [getattr(cls, name) for name in names]
+        statement = select(*columns, func.count()).where(*criteria).group_by(*columns)
+        counts = {name: {} for name in names}
+        for *values, count in db.session.execute(statement):
+            for name, value in zip(names, values):
+                counts[name][value] = counts[name].get(value, 0) + count
+        return {
+            name: [{'value': value, 'count': count}
+                   for value, count in sorted(by_value.items(), key=lambda item: (-item[1], str(item[0])))]
+            for name, by_value in counts.items()
+        }
@@ -1,19 +1,24 @@
 from datetime import datetime
 from app import db
+from models.rows import RowSelectMixin
 
-class SOP(db.Model):
+class SOP(RowSelectMixin, db.Model):
     """Standard Operating Procedure model"""
     __tablename__ = 'sops'
     
     id = db.Column(db.Integer, primary_key=True)
-    title = db.Column(db.String(100), nullable=False)
+    title = db.Column(db.String(100), nullable=False, index=True)
     description = db.Column(db.Text)
     content = db.Column(db.Text)
     version = db.Column(db.String(10), default='1.0')
-    category = db.Column(db.String(50))
+    category = db.Column(db.String(50), index=True)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='SET NULL'), index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    filter_columns = ('title', 'category', 'project_id')
+    facet_columns = ('category',)
+
     def __repr__(self):
         return f'<SOP {self.title}>'
     
@@ -34,6 +39,7 @@ class SOP(db.Model):
             'content': self.content,
             'version': self.version,
             'category': self.category,
+            'project_id': self.project_id,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
@@ -3,21 +3,25 @@ from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
 from enum import Enum
 from app import db
+from models.rows import RowSelectMixin
 
 class RoleEnum(Enum):
     ADMIN = 'Admin'
     CONTRIBUTOR = 'Contributor'
     VIEWER = 'Viewer'
 
-class User(UserMixin, db.Model):
+class User(UserMixin, RowSelectMixin, db.Model):
     """User model for authentication and authorization"""
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(120), unique=True, nullable=False)
     password_hash = db.Column(db.String(128), nullable=False)
-    role = db.Column(db.String(32), nullable=False, default=RoleEnum.VIEWER.value)
+    role = db.Column(db.String(32), nullable=False, default=RoleEnum.VIEWER.value, index=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # The list endpoint's row select must never read password_hash
+    serialized_columns = ('id', 'email', 'role', 'created_at', 'updated_at')
+    
     def __repr__(self):
         return f'<User {self.email}>'
 
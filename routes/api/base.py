@@ -0,0 +1,152 @@
+"""
+Shared CRUD behaviour for the model-backed API resources
+
+Every resource validates request bodies with its model's shared schema
+(see schemas/__init__.py) and answers with the same shapes:
+
+- 400 ``{"errors": {field: [messages]}}`` for invalid input, including
+  bodies that are not a JSON object and unique index violations
+- 404 for unknown ids
+- 500 ``{"error": "..."}`` when saving fails for any other reason
+
+Lists take the filter, sort and facet parameters described in
+routes/api/filters.py.
+
+GET can embed related collections with ``?include=name,...`` for the
+relationships a resource lists in ``includes``. They are loaded with
+selectinload: one ``SELECT ... WHERE parent_id IN (...)`` per relationship
+for every 500 records returned, instead of one query per record.
+"""
+from flask_restful import Resource
+from flask import request, current_app
+from marshmallow import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+from routes.api.filters import parse_list_args
+from schemas import unique_violation
+from app import db
+
+class ModelResource(Resource):
+    """GET/POST/PUT/DELETE for one model through its shared schema"""
+    model = None
+    schema = None
+    # Used in log lines and error messages, e.g. 'project'
+    label = None
+    # Attribute that names a record in log lines
+    name_attribute = 'title'
+    # Relationships GET can embed, mapped to the schema that serializes them
+    includes = {}
+
+    def get(self, id=None):
+        """Get a specific record, or all records matching the filters"""
+        try:
+            include = self._include()
+            if not id:
+                criteria, order_by, facets = parse_list_args(self.model, request.args)
+        except ValidationError as err:
+            return {"errors": err.messages}, 400
+
+        if id:
+            if include:
+                return self._serialize_including(self._query_including(include).get_or_404(id), include)
+            return self.schema.serialize(self.model.query.get_or_404(id))
+
+        if include:
+            query = self._query_including(include).filter(*criteria).order_by(*order_by)
+            items = [self._serialize_including(obj, include) for obj in query]
+        else:
+            # Lists skip ORM instances; the schema serializes the column tuples
+            statement = self.model.row_select().where(*criteria).order_by(*order_by)
+            items = self.schema.serialize_many(db.session.execute(statement))
+        if facets is None:
+            return items
+        return {"items": items, "facets": self.model.facet_counts(facets, *criteria)}
+
+    def post(self):
+        """Create a new record"""
+        try:
+            data = self.schema.load(request.get_json(silent=True))
+        except ValidationError as err:
+            current_app.logger.warning(f"Invalid {self.label} data: {err.messages}")
+            return {"errors": err.messages}, 400
+
+        obj = self.model()
+        self._assign(obj, data)
+        db.session.add(obj)
+        error = self._commit(data, 'creating')
+        if error:
+            return error
+        current_app.logger.info(f"Created {self.label}: {self._name(obj)} (ID: {obj.id})")
+        return self.schema.serialize(obj), 201
+
+    def put(self, id):
+        """Update an existing record; omitted fields are left unchanged"""
+        obj = self.model.query.get_or_404(id)
+        try:
+            data = self.schema.load(request.get_json(silent=True), partial=True)
+        except ValidationError as err:
+            current_app.logger.warning(f"Invalid {self.label} update for ID {id}: {err.messages}")
+            return {"errors": err.messages}, 400
+
+        self._assign(obj, data)
+        error = self._commit(data, 'updating')
+        if error:
+            return error
+        current_app.logger.info(f"Updated {self.label}: {self._name(obj)} (ID: {id})")
+        return self.schema.serialize(obj)
+
+    def delete(self, id):
+        """Delete a record"""
+        obj = self.model.query.get_or_404(id)
+        name = self._name(obj)  # Store for logging before deletion
+        db.session.delete(obj)
+        error = self._commit({}, 'deleting')
+        if error:
+            return error
+        current_app.logger.info(f"Deleted {self.label}: {name} (ID: {id})")
+        return '', 204
+
+    def _assign(self, obj, data):
+        """Copy loaded request data onto a new or existing record"""
+        for key, value in data.items():
+            setattr(obj, key, value)
+
+    def _name(self, obj):
+        return getattr(obj, self.name_attribute)
+
+    def _include(self):
+        """The relationships named in ?include=, validated against includes"""
+        names = [name.strip() for name in request.args.get('include', '').split(',')]
+        names = list(dict.fromkeys(name for name in names if name))
+        unknown = [name for name in names if name not in self.includes]
+        if unknown:
+            expected = f"expected one of: {', '.join(sorted(self.includes))}" if self.includes else 'nothing can be included'
+            raise ValidationError({'include': [f'Cannot include {name}; {expected}' for name in unknown]})
+        return names
+
+    def _query_including(self, include):
+        return self.model.query.options(*(selectinload(getattr(self.model, name)) for name in include))
+
+    def _serialize_including(self, obj, include):
+        data = self.schema.serialize(obj)
+        for name in include:
+            data[name] = self.includes[name].serialize_many(getattr(obj, name))
+        return data
+
+    def _commit(self, data, action):
+        """Commit the session; returns an error response, or None on success"""
+        try:
+            db.session.commit()
+        except IntegrityError as e:
+            db.session.rollback()
+            errors = unique_violation(e, self.model, data)
+            if errors is not None:
+                current_app.logger.warning(f"Invalid {self.label} data: {errors}")
+                return {"errors": errors}, 400
+            current_app.logger.error(f"Error {action} {self.label}: {str(e)}")
+            return {"error": f"An error occurred while {action} the {self.label}"}, 500
+        except Exception as e:
+            current_app.logger.error(f"Error {action} {self.label}: {str(e)}")
+            db.session.rollback()
+            return {"error": f"An error occurred while {action} the {self.label}"}, 500
+        return None
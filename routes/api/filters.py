@@ -0,0 +1,125 @@
+"""
+Filtering, sorting and facets for the list endpoints
+
+    GET /api/ideas?status=in:new,in_progress&priority=gte:2&sort=-priority,created_at&facets=status
+
+- ``<column>=<op>:<value>`` filters on a column from the model's
+  ``filter_columns``; ``op`` is one of eq, ne, gt, gte, lt, lte or in (a
+  comma-separated list), and a bare value means eq. ``null`` matches
+  missing values with eq and ne. Repeated parameters are ANDed.
+- ``sort=<column>,-<column>`` orders by whitelisted columns, ``-`` for
+  descending.
+- ``facets=<column>,...`` (empty for all of the model's ``facet_columns``)
+  wraps the response as ``{"items": [...], "facets": {...}}`` with value
+  counts over the filtered rows.
+
+Only indexed columns are whitelisted, so no filter or sort can turn into a
+full table scan. Values are converted to the column's type, and anything
+invalid raises a ValidationError keyed by parameter, which the resources
+return as the usual 400.
+"""
+from datetime import date, datetime
+from marshmallow import ValidationError
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer
+
+# Parameters with their own meaning on list endpoints
+RESERVED = ('sort', 'facets', 'include')
+
+COMPARISONS = {
+    'gt': lambda column, value: column > value,
+    'gte': lambda column, value: column >= value,
+    'lt': lambda column, value: column < value,
+    'lte': lambda column, value: column <= value,
+}
+
+BOOLEANS = {'true': True, '1': True, 'false': False, '0': False}
+
+def _split(value):
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+def _convert(column, raw):
+    """Convert a query string value to the column's Python type"""
+    if raw == 'null':
+        return None
+    column_type = column.type
+    try:
+        if isinstance(column_type, Boolean):
+            return BOOLEANS[raw.lower()]
+        if isinstance(column_type, Integer):
+            return int(raw)
+        if isinstance(column_type, Float):
+            return float(raw)
+        if isinstance(column_type, DateTime):
+            return datetime.fromisoformat(raw)
+        if isinstance(column_type, Date):
+            return date.fromisoformat(raw)
+    except (KeyError, ValueError):
+        raise ValueError(f'Invalid value {raw!r}')
+    return raw
+
+def _condition(column, raw):
+    """Build the criterion for one ``op:value`` parameter value"""
+    op, _, value = raw.partition(':')
+    if op not in COMPARISONS and op not in ('eq', 'ne', 'in'):
+        # No operator; the value itself may contain colons (timestamps)
+        op, value = 'eq', raw
+
+    if op == 'in':
+        values = [_convert(column, part) for part in _split(value)]
+        if not values or None in values:
+            raise ValueError('in: needs one or more values, and cannot match null')
+        return column.in_(values)
+
+    value = _convert(column, value)
+    if op == 'eq':
+        return column.is_(None) if value is None else column == value
+    if op == 'ne':
+        return column.is_not(None) if value is None else column != value
+    if value is None:
+        raise ValueError(f'{op}: cannot compare with null')
+    return COMPARISONS[op](column, value)
+
+def parse_list_args(model, args):
+    """
+    Turn list request args into ``(criteria, order_by, facets)``
+
+    ``facets`` is None when no facets were asked for. Raises
+    ValidationError with every invalid parameter.
+    """
+    errors = {}
+    allowed = ', '.join(model.filter_columns)
+
+    criteria = []
+    for name in args:
+        if name in RESERVED:
+            continue
+        if name not in model.filter_columns:
+            errors[name] = [f'Cannot filter on {name}; expected one of: {allowed}']
+            continue
+        column = getattr(model, name)
+        for raw in args.getlist(name):
+            try:
+                criteria.append(_condition(column, raw))
+            except ValueError as error:
+                errors.setdefault(name, []).append(str(error))
+
+    order_by = []
+    for key in _split(args.get('sort', '')):
+        name = key[1:] if key.startswith('-') else key
+        if name not in model.filter_columns:
+            errors.setdefault('sort', []).append(f'Cannot sort on {name}; expected one of: {allowed}')
+            continue
+        column = getattr(model, name)
+        order_by.append(column.desc() if key.startswith('-') else column.asc())
+
+    facets = None
+    if 'facets' in args:
+        facets = _split(args['facets']) or list(model.facet_columns)
+        for name in facets:
+            if name not in model.facet_columns:
+                errors.setdefault('facets', []).append(
+                    f"Cannot facet on {name}; expected one of: {', '.join(model.facet_columns)}")
+
+    if errors:
+        raise ValidationError(errors)
+    return criteria, order_by, facets
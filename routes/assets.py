@@ -0,0 +1,46 @@
+"""
+Serve fingerprinted static assets with far-future caching
+
+Files under the dist folder are content-addressed, so they never change at a
+given URL and can be cached forever. Precompressed ``.br``/``.gz`` variants
+are picked based on the client's Accept-Encoding.
+"""
+import mimetypes
+import os
+
+from flask import Blueprint, abort, current_app, request, send_file
+from werkzeug.security import safe_join
+
+assets_bp = Blueprint('assets', __name__)
+
+ONE_YEAR = 365 * 24 * 60 * 60
+
+# Preferred order when the client accepts several encodings
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def _pick_encoding(path):
+    """Return (path, encoding) for the best variant the client accepts"""
+    for encoding, suffix in ENCODINGS:
+        if request.accept_encodings[encoding] and os.path.isfile(path + suffix):
+            return path + suffix, encoding
+    return path, None
+
+
+@assets_bp.route('/<path:filename>')
+def serve_asset(filename):
+    """Serve a fingerprinted asset, precompressed when possible"""
+    path = safe_join(current_app.config['ASSETS_DIST_FOLDER'], filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+
+    variant, encoding = _pick_encoding(path)
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    response = send_file(variant, mimetype=mimetype, conditional=True, max_age=ONE_YEAR)
+
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
@@ -3,7 +3,8 @@ Health check endpoint for monitoring application status
 Used by integration tests and monitoring systems
 """
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, current_app, abort
+from utils.readiness import get_readiness
 
 health_bp = Blueprint('health', __name__)
 
@@ -17,3 +18,28 @@ def health_check():
         'status': 'ok',
         'message': 'Application is running'
     }), 200
+
+@health_bp.route('/ready', methods=['GET'])
+def readiness_check():
+    """
+    Readiness probe for the load balancer
+    Checks the database, connection pool, writable upload/log directories
+    and cache, and reports the schema; returns 503 if any check fails
+    """
+    ready, checks, age = get_readiness()
+    return jsonify({
+        'status': 'ready' if ready else 'unavailable',
+        'checks': checks,
+        'cached_for_seconds': round(age, 2)
+    }), 200 if ready else 503
+
+@health_bp.route('/health/timing', methods=['GET'])
+def timing_stats():
+    """
+    Per-endpoint request timings collected by this process
+    Only available when TIMING_STATS_ENDPOINT is enabled
+    """
+    stats = current_app.extensions.get('request_timing')
+    if not current_app.config.get('TIMING_STATS_ENDPOINT') or stats is None:
+        abort(404)
+    return jsonify(stats.snapshot()), 200
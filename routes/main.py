@@ -4,6 +4,9 @@ import os
 # Create main blueprint
 main = Blueprint('main', __name__)
 
+# The home and contact pages are static markup with no table behind them, so
+# there is no version to key a {% cache %} fragment on and nothing for it to
+# save; like every template they load from the Jinja bytecode cache
 @main.route('/')
 def index():
     """Render the home page"""
@@ -0,0 +1,27 @@
+"""
+Prometheus scrape endpoint
+Registered only when METRICS_ENABLED is set, and in production only with a
+METRICS_TOKEN (see utils/metrics.py)
+"""
+import hmac
+
+from flask import Blueprint, Response, abort, current_app, request
+
+from utils.metrics import render_metrics
+
+metrics_bp = Blueprint('metrics', __name__)
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    Metrics in the Prometheus text format
+    Requires `Authorization: Bearer <METRICS_TOKEN>` when a token is configured
+    """
+    token = current_app.config.get('METRICS_TOKEN')
+    if token:
+        supplied = request.headers.get('Authorization', '')
+        if not hmac.compare_digest(supplied, f'Bearer {token}'):
+            abort(401)
+
+    body, content_type = render_metrics()
+    return Response(body, content_type=content_type)
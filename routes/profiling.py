@@ -0,0 +1,54 @@
+"""
+Profiling endpoints for admins
+Registered only when PROFILING_ENABLED is set (see utils/profiling.py)
+"""
+import os
+
+from flask import Blueprint, Response, abort, current_app, jsonify, request, send_from_directory, url_for
+from flask_login import login_required
+
+from models.user import RoleEnum
+from utils.profiling import PROFILE_ID_PATTERN, load_sample, profile_output_dir, start_background_sample
+from utils.rbac import roles_required
+
+profiling_bp = Blueprint('profiling', __name__)
+
+@profiling_bp.route('', methods=['POST'])
+@login_required
+@roles_required(RoleEnum.ADMIN.value)
+def start_sample():
+    """
+    Sample the worker that receives this request for ?seconds=N
+    Returns immediately; fetch the collapsed stacks from the result URL
+    """
+    max_seconds = current_app.config.get('PROFILING_MAX_SECONDS', 60)
+    seconds = min(max(request.args.get('seconds', 10, type=float), 0.1), max_seconds)
+    interval = max(request.args.get('interval_ms', 5, type=float), 1) / 1000
+
+    profile_id = start_background_sample(current_app._get_current_object(), seconds, interval)
+    return jsonify({
+        'id': profile_id,
+        'pid': os.getpid(),
+        'seconds': seconds,
+        'result': url_for('profiling.get_sample', profile_id=profile_id)
+    }), 202
+
+@profiling_bp.route('/<profile_id>', methods=['GET'])
+@login_required
+@roles_required(RoleEnum.ADMIN.value)
+def get_sample(profile_id):
+    """Collapsed stacks (flamegraph input) for a finished sample"""
+    stacks = load_sample(current_app, profile_id)
+    if stacks is None:
+        return jsonify({'error': 'Profile not found or still running'}), 404
+    return Response(stacks, content_type='text/plain; charset=utf-8')
+
+@profiling_bp.route('/requests/<profile_id>', methods=['GET'])
+@login_required
+@roles_required(RoleEnum.ADMIN.value)
+def get_request_profile(profile_id):
+    """Download the cProfile stats of a request profiled with X-Profile"""
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        abort(404)
+    return send_from_directory(profile_output_dir(current_app), f'{profile_id}.prof',
+                               as_attachment=True)
@@ -4,6 +4,7 @@ from models.project import Project
 from models.user import RoleEnum
 from flask_login import login_required, current_user
 from utils.rbac import roles_required
+from utils.cache import table_version
 from app import db
 
 projects_bp = Blueprint('projects', __name__)
@@ -11,8 +12,10 @@ projects_bp = Blueprint('projects', __name__)
 @projects_bp.route('/')
 def list_projects():
     """List all projects"""
-    projects = Project.get_all()
-    return render_template('projects/index.html', projects=projects)
+    # Pass the query unexecuted; it only runs when the cached grid is stale
+    projects = Project.query.order_by(Project.created_at.desc())
+    return render_template('projects.html', projects=projects,
+                           projects_version=table_version(Project))
 
 @projects_bp.route('/<slug>')
 def project_detail(slug):
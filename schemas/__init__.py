@@ -1,10 +1,99 @@
 """
 Schema initialization and common utilities
 """
+import re
+from datetime import datetime
+from operator import attrgetter
 from flask_marshmallow import Marshmallow
+from marshmallow import fields, ValidationError
 
 ma = Marshmallow()
 
 def init_ma(app):
     """Initialize Marshmallow with the Flask app"""
     ma.init_app(app)
+
+class DateOrDateTime(fields.DateTime):
+    """An ISO datetime that also accepts a plain date (taken as midnight)"""
+    DATE_ONLY = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        if isinstance(value, str) and self.DATE_ONLY.match(value):
+            try:
+                return datetime.strptime(value, '%Y-%m-%d')
+            except ValueError as error:
+                raise self.make_error('invalid', input=value, obj_type=self.OBJ_TYPE) from error
+        return super()._deserialize(value, attr, data, **kwargs)
+
+def project_exists(project_id):
+    """Validator for project_id fields"""
+    from app import db
+    from models.project import Project
+
+    # A primary key lookup rather than relying on the foreign key: SQLite
+    # does not enforce it, and on PostgreSQL the violation would otherwise
+    # surface as a 500
+    if db.session.get(Project, project_id) is None:
+        raise ValidationError(f'Project {project_id} does not exist')
+
+def _iso(get):
+    def convert(obj):
+        value = get(obj)
+        return value.isoformat() if value is not None else None
+    return convert
+
+class ApiSchema(ma.SQLAlchemyAutoSchema):
+    """
+    Base for the API resource schemas
+
+    Subclasses are instantiated once per module and shared: ``load`` returns
+    a plain dict (no load_instance, so no per-call state lives on the
+    schema). ``serialize`` produces the same output as ``dump`` through
+    getters compiled once from the dump fields, and accepts anything with
+    the fields as attributes: model instances or SQL result rows.
+    """
+    class Meta:
+        include_fk = True
+        dump_only = ('id', 'created_at', 'updated_at')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._getters = tuple(self._compile_getter(name, field) for name, field in self.dump_fields.items())
+
+    def _compile_getter(self, name, field):
+        key = field.data_key or name
+        if isinstance(field, fields.Method):
+            return key, getattr(self, field.serialize_method_name)
+        get = attrgetter(field.attribute or name)
+        if type(field) in (fields.DateTime, DateOrDateTime, fields.Date) and field.format in (None, 'iso'):
+            return key, _iso(get)
+        if isinstance(field, (fields.String, fields.Integer, fields.Float, fields.Boolean)) \
+                and not getattr(field, 'as_string', False):
+            # Column values already have the type these fields would cast to
+            return key, get
+        return key, lambda obj: field.serialize(name, obj)
+
+    def serialize(self, obj):
+        """Dump one object or row to a dict"""
+        return {key: get(obj) for key, get in self._getters}
+
+    def serialize_many(self, objs):
+        """Dump an iterable of objects or rows to a list of dicts"""
+        getters = self._getters
+        return [{key: get(obj) for key, get in getters} for obj in objs]
+
+def unique_violation(error, model, data):
+    """
+    Turn an IntegrityError from one of ``model``'s unique columns into
+    field errors (the format ValidationError.messages uses), or return
+    None if the error came from something else
+    """
+    table = model.__table__
+    message = str(error.orig)
+    for column in table.columns:
+        # SQLite: "UNIQUE constraint failed: projects.title";
+        # PostgreSQL: "Key (title)=(...) already exists"
+        if column.unique and (f'{table.name}.{column.name}' in message or f'Key ({column.name})=' in message):
+            value = data.get(column.name)
+            return {column.name: [f'{model.__name__} with {column.name} "{value}" already exists']}
+    return None
@@ -1,13 +1,17 @@
 from marshmallow import fields, validate
 from models.idea import Idea
-from schemas import ma
+from schemas import ApiSchema, project_exists
 
-class IdeaSchema(ma.SQLAlchemyAutoSchema):
-    class Meta:
+IDEA_STATUSES = ('new', 'in_progress', 'completed', 'archived')
+
+class IdeaSchema(ApiSchema):
+    class Meta(ApiSchema.Meta):
         model = Idea
-        load_instance = True
-        include_fk = True
     
     title = fields.String(required=True, validate=validate.Length(min=3, max=100))
-    description = fields.String(required=True, validate=validate.Length(min=10))
-    project_id = fields.Integer(allow_none=True)
+    description = fields.String(allow_none=True)
+    status = fields.String(validate=validate.OneOf(IDEA_STATUSES))
+    priority = fields.Integer(allow_none=True)
+    project_id = fields.Integer(allow_none=True, validate=project_exists)
+
+idea_schema = IdeaSchema()
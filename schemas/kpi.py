@@ -1,15 +1,31 @@
-from marshmallow import fields, validate
+from marshmallow import fields, validate, validates_schema, ValidationError
 from models.kpi import KPI
-from schemas import ma
+from schemas import ApiSchema, DateOrDateTime, project_exists
 
-class KPISchema(ma.SQLAlchemyAutoSchema):
-    class Meta:
+class KPISchema(ApiSchema):
+    class Meta(ApiSchema.Meta):
         model = KPI
-        load_instance = True
-        include_fk = True
     
-    name = fields.String(required=True, validate=validate.Length(min=3, max=100))
-    description = fields.String(required=True, validate=validate.Length(min=10))
-    target_value = fields.Float(required=True)
-    current_value = fields.Float(required=True)
-    project_id = fields.Integer(required=True)
+    title = fields.String(required=True, validate=validate.Length(min=3, max=100))
+    description = fields.String(allow_none=True)
+    target_value = fields.Float(allow_none=True)
+    # Omitted on create, the model default (0) applies
+    current_value = fields.Float(allow_none=True)
+    unit = fields.String(allow_none=True, validate=validate.Length(max=20))
+    category = fields.String(allow_none=True, validate=validate.Length(max=50))
+    start_date = DateOrDateTime(allow_none=True)
+    end_date = DateOrDateTime(allow_none=True)
+    project_id = fields.Integer(allow_none=True, validate=project_exists)
+    progress_percentage = fields.Method('get_progress_percentage', dump_only=True)
+    
+    def get_progress_percentage(self, kpi):
+        # Works on result rows as well as KPI instances
+        return KPI.calculate_progress(kpi.current_value, kpi.target_value)
+    
+    @validates_schema
+    def validate_dates(self, data, **kwargs):
+        start, end = data.get('start_date'), data.get('end_date')
+        if start and end and end < start:
+            raise ValidationError('End date must not be before the start date', 'end_date')
+
+kpi_schema = KPISchema()
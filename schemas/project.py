@@ -1,24 +1,19 @@
-from marshmallow import fields, validate, validates, ValidationError
+from marshmallow import fields, validate
 from models.project import Project
-from schemas import ma
+from schemas import ApiSchema
 
-class ProjectSchema(ma.SQLAlchemyAutoSchema):
-    class Meta:
+class ProjectSchema(ApiSchema):
+    class Meta(ApiSchema.Meta):
         model = Project
-        load_instance = True
-        include_fk = True
     
     title = fields.String(required=True, validate=validate.Length(min=3, max=100))
     description = fields.String(required=True, validate=validate.Length(min=10))
     github_url = fields.URL(allow_none=True)
     demo_url = fields.URL(allow_none=True)
     download_url = fields.String(allow_none=True)
-    
-    @validates('title')
-    def validate_title(self, title):
-        # Custom validation example - check if title already exists on creation
-        if self.context.get('create_mode', False):
-            existing = Project.query.filter_by(title=title).first()
-            if existing:
-                raise ValidationError(f'Project with title "{title}" already exists')
-        return title
+
+# Built once per process: constructing a SQLAlchemyAutoSchema deep-copies
+# every field, which was a measurable share of each write request. Title
+# uniqueness is enforced by the ix_projects_title unique index, not a query.
+project_schema = ProjectSchema()
+projects_schema = ProjectSchema(many=True)
@@ -1,14 +1,15 @@
 from marshmallow import fields, validate
 from models.sop import SOP
-from schemas import ma
+from schemas import ApiSchema, project_exists
 
-class SOPSchema(ma.SQLAlchemyAutoSchema):
-    class Meta:
+class SOPSchema(ApiSchema):
+    class Meta(ApiSchema.Meta):
         model = SOP
-        load_instance = True
-        include_fk = True
     
     title = fields.String(required=True, validate=validate.Length(min=3, max=100))
-    content = fields.String(required=True, validate=validate.Length(min=10))
-    category = fields.String(validate=validate.Length(max=50))
-    project_id = fields.Integer(allow_none=True)
+    content = fields.String(allow_none=True)
+    version = fields.String(validate=validate.Length(max=10))
+    category = fields.String(allow_none=True, validate=validate.Length(max=50))
+    project_id = fields.Integer(allow_none=True, validate=project_exists)
+
+sop_schema = SOPSchema()
@@ -1,21 +1,18 @@
-from marshmallow import fields, validate, validates, ValidationError
+from marshmallow import fields, validate
 from models.user import User, RoleEnum
-from schemas import ma
+from schemas import ApiSchema
 
-class UserSchema(ma.SQLAlchemyAutoSchema):
-    class Meta:
+class UserSchema(ApiSchema):
+    class Meta(ApiSchema.Meta):
         model = User
-        load_instance = True
+        # Dumps only the columns User.row_select() reads, so the list can
+        # serialize rows that never contain the hash
         exclude = ('password_hash',)
-        
+    
     email = fields.Email(required=True)
     role = fields.String(validate=validate.OneOf([r.value for r in RoleEnum]))
+    # Hashed by UsersAPI with User.set_password; never dumped
     password = fields.String(load_only=True, validate=validate.Length(min=8), required=True)
-    
-    @validates('email')
-    def validate_email(self, email):
-        if self.context.get('create_mode', False):
-            existing = User.query.filter_by(email=email).first()
-            if existing:
-                raise ValidationError('Email is already registered')
-        return email
+
+# Email uniqueness is enforced by the unique column, not a lookup query
+user_schema = UserSchema()
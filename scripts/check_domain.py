@@ -3,159 +3,263 @@
 Domain configuration checker for The Solution Desk.
 
 This script verifies that the domain configuration is correct for production.
+Every check (DNS, TLS certificate, HTTP -> HTTPS and www redirects) for every
+host in config.domains.ALLOWED_HOSTS runs concurrently on one asyncio event
+loop, each with its own timeout, so a slow or unreachable host only costs its
+own timeout instead of delaying everything after it.
+
+    python scripts/check_domain.py                  # human-readable report
+    python scripts/check_domain.py --json           # machine-readable report
+    python scripts/check_domain.py --watch 300      # re-check every 5 minutes
 """
 import os
 import sys
-import socket
 import ssl
-import dns.resolver
-import requests
-from urllib.parse import urlparse
+import json
+import time
+import socket
+import asyncio
+import argparse
+import importlib.util
 from datetime import datetime, timezone
 
-# Domain to check
-DOMAIN = "thesolutiondesk.ca"
-WWW_DOMAIN = f"www.{DOMAIN}"
-RENDER_DOMAIN = "thesolutiondesk.onrender.com"
+try:
+    import dns.asyncresolver
+    import dns.resolver
+except ImportError:  # dnspython is optional; addresses are resolved either way
+    dns = None
 
-def check_dns(domain):
-    """Check DNS records for the domain."""
-    print(f"\n🔍 Checking DNS for {domain}...")
-    try:
-        # Check A records
-        a_records = dns.resolver.resolve(domain, 'A')
-        print(f"✅ A records: {', '.join([str(r) for r in a_records])}")
-        
-        # Check CNAME records
-        try:
-            cname_records = dns.resolver.resolve(domain, 'CNAME')
-            print(f"✅ CNAME records: {', '.join([str(r.target) for r in cname_records])}")
-        except dns.resolver.NoAnswer:
-            print("ℹ️  No CNAME records found")
-            
-        # Check MX records
-        try:
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            print(f"✅ MX records: {', '.join([str(r.exchange) for r in mx_records])}")
-        except dns.resolver.NoAnswer:
-            print("ℹ️  No MX records found (this is fine if you're not handling email)")
-            
-        # Check TXT records (for verification, SPF, etc.)
-        try:
-            txt_records = dns.resolver.resolve(domain, 'TXT')
-            print("✅ TXT records:")
-            for r in txt_records:
-                print(f"   - {r}")
-        except dns.resolver.NoAnswer:
-            print("ℹ️  No TXT records found")
-            
-    except Exception as e:
-        print(f"❌ DNS check failed: {e}")
-        return False
-    return True
+# Development hosts in ALLOWED_HOSTS that have no public DNS or certificate
+LOCAL_HOSTS = {"localhost", "127.0.0.1"}
+
+DEFAULT_TIMEOUT = 10.0
+EXPIRY_WARNING_DAYS = 30
+REDIRECT_STATUSES = (301, 308)
+
+OK, WARN, FAIL = 'ok', 'warn', 'fail'
+ICONS = {OK: '✅', WARN: '⚠️ ', FAIL: '❌'}
+
+
+def default_hosts():
+    """The production hosts from ALLOWED_HOSTS"""
+    # config/domains.py is loaded by path: the top-level config.py module
+    # shadows the config/ directory, so `import config.domains` fails
+    path = os.path.join(os.path.dirname(__file__), '..', 'config', 'domains.py')
+    spec = importlib.util.spec_from_file_location('domains', path)
+    domains = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(domains)
+    return [host for host in domains.ALLOWED_HOSTS if host not in LOCAL_HOSTS]
+
+
+async def check_dns(host):
+    """Resolve the host's addresses, plus CNAME/MX/TXT records if dnspython is installed."""
+    loop = asyncio.get_running_loop()
+    infos = await loop.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    addresses = sorted({info[4][0] for info in infos})
+    data = {'addresses': addresses}
+
+    if dns is not None:
+        async def records(kind):
+            try:
+                answer = await dns.asyncresolver.resolve(host, kind)
+            except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
+                return kind, []
+            return kind, [str(record) for record in answer]
 
-def check_ssl(domain):
-    """Check SSL certificate for the domain."""
-    print(f"\n🔐 Checking SSL for {domain}...")
+        data.update(await asyncio.gather(*(records(kind) for kind in ('CNAME', 'MX', 'TXT'))))
+
+    return OK, f"resolves to {', '.join(addresses)}", data
+
+
+async def check_tls(host, port=443, context=None):
+    """Handshake with the host and check the certificate it presents."""
+    context = context or ssl.create_default_context()
+    _, writer = await asyncio.open_connection(host, port, ssl=context, server_hostname=host)
     try:
-        context = ssl.create_default_context()
-        with socket.create_connection((domain, 443)) as sock:
-            with context.wrap_socket(sock, server_hostname=domain) as ssock:
-                cert = ssock.getpeercert()
-                
-                # Check expiration
-                expire_date = datetime.strptime(cert['notAfter'], '%b %d %H:%M:%S %Y %Z')
-                days_until_expiry = (expire_date - datetime.now(timezone.utc)).days
-                expiry_status = "✅" if days_until_expiry > 30 else "⚠️ "
-                print(f"{expiry_status} SSL certificate expires on {expire_date.strftime('%Y-%m-%d')} "
-                      f"({days_until_expiry} days remaining)")
-                
-                # Check issuer
-                issuer = dict(x[0] for x in cert['issuer'])
-                print(f"✅ Issuer: {issuer.get('organizationName', 'Unknown')}")
-                
-                # Check subject alternative names
-                san = ""
-                for ext in cert.get('subjectAltName', []):
-                    if ext[0].lower() == 'dns':
-                        san += f"{ext[1]} "
-                if san:
-                    print(f"✅ Subject Alternative Names: {san.strip()}")
-                
-                # Check protocol version
-                print(f"✅ Protocol: {ssock.version()}")
-                
-    except Exception as e:
-        print(f"❌ SSL check failed: {e}")
-        return False
-    return True
-
-def check_http_redirects():
-    """Check HTTP to HTTPS redirects and www redirects."""
-    print("\n🔄 Checking HTTP redirects...")
-    
-    # Check HTTP -> HTTPS redirect
+        cert = writer.get_extra_info('peercert')
+        protocol = writer.get_extra_info('ssl_object').version()
+    finally:
+        writer.close()
+
+    expires = datetime.fromtimestamp(ssl.cert_time_to_seconds(cert['notAfter']), timezone.utc)
+    days_left = (expires - datetime.now(timezone.utc)).days
+    issuer = dict(item[0] for item in cert['issuer'])
+    data = {
+        'expires': expires.isoformat(),
+        'days_left': days_left,
+        'issuer': issuer.get('organizationName') or issuer.get('commonName', 'Unknown'),
+        'subject_alt_names': [value for kind, value in cert.get('subjectAltName', ()) if kind.lower() == 'dns'],
+        'protocol': protocol,
+    }
+    status = OK if days_left > EXPIRY_WARNING_DAYS else WARN
+    detail = f"certificate expires {expires:%Y-%m-%d} ({days_left} days), {protocol}, issuer {data['issuer']}"
+    return status, detail, data
+
+
+async def fetch_head(host, port, context=None):
+    """Send a GET for / and return (status code, headers) without following redirects."""
+    use_tls = context is not None
+    reader, writer = await asyncio.open_connection(host, port, ssl=context,
+                                                   server_hostname=host if use_tls else None)
     try:
-        r = requests.get(f"http://{DOMAIN}", allow_redirects=False, timeout=10)
-        if r.status_code == 301 and r.headers.get('Location', '').startswith('https://'):
-            print(f"✅ HTTP -> HTTPS redirect works")
-        else:
-            print(f"❌ HTTP -> HTTPS redirect failed (status: {r.status_code}, location: {r.headers.get('Location')})")
-    except Exception as e:
-        print(f"❌ HTTP check failed: {e}")
-    
-    # Check www -> non-www redirect (or vice versa, depending on your preference)
+        writer.write(f"GET / HTTP/1.1\r\nHost: {host}\r\nUser-Agent: check_domain\r\n"
+                     f"Accept: */*\r\nConnection: close\r\n\r\n".encode('ascii'))
+        await writer.drain()
+        head = await reader.readuntil(b'\r\n\r\n')
+    finally:
+        writer.close()
+
+    status_line, *header_lines = head.decode('latin-1').split('\r\n')
+    headers = {}
+    for line in header_lines:
+        if ':' in line:
+            name, value = line.split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+    return int(status_line.split()[1]), headers
+
+
+async def check_https_redirect(host, port=80):
+    """Plain HTTP must permanently redirect to HTTPS."""
+    status, headers = await fetch_head(host, port)
+    location = headers.get('location', '')
+    data = {'status': status, 'location': location}
+    if status in REDIRECT_STATUSES and location.startswith('https://'):
+        return OK, f"HTTP -> HTTPS redirect works ({status} to {location})", data
+    return FAIL, f"HTTP -> HTTPS redirect failed (status: {status}, location: {location or None})", data
+
+
+async def check_canonical_redirect(host, target, port=443, context=None):
+    """The www host must permanently redirect to the bare domain."""
+    status, headers = await fetch_head(host, port, context or ssl.create_default_context())
+    location = headers.get('location', '')
+    data = {'status': status, 'location': location}
+    if status in REDIRECT_STATUSES and location.startswith(f'https://{target}'):
+        return OK, f"{host} -> {target} redirect works", data
+    return WARN, f"{host} does not redirect to {target} (status: {status}, location: {location or None})", data
+
+
+async def timed(host, name, check, timeout):
+    """Run one check with its own timeout and turn any error into a failed result."""
+    start = time.perf_counter()
     try:
-        r = requests.get(f"https://{WWW_DOMAIN}", allow_redirects=False, timeout=10)
-        if r.status_code == 301 and r.headers.get('Location', '').startswith(f'https://{DOMAIN}'):
-            print(f"✅ {WWW_DOMAIN} -> {DOMAIN} redirect works")
-        else:
-            print(f"⚠️  {WWW_DOMAIN} does not redirect to {DOMAIN} (status: {r.status_code}, location: {r.headers.get('Location')})")
+        status, detail, data = await asyncio.wait_for(check, timeout)
+    except asyncio.TimeoutError:
+        status, detail, data = FAIL, f"timed out after {timeout:g}s", {}
     except Exception as e:
-        print(f"❌ {WWW_DOMAIN} check failed: {e}")
-
-def check_render_config():
-    """Check if Render service is properly configured for the custom domain."""
-    print("\n⚙️  Checking Render configuration...")
-    
-    # This is a placeholder for actual Render API checks
-    # In a real implementation, you would use the Render API to verify:
-    # 1. Custom domain is properly configured in Render
-    # 2. SSL certificate is provisioned for the custom domain
-    # 3. DNS records point to the correct Render service
-    
-    print("ℹ️  Note: Run this on Render's infrastructure or with RENDER_API_KEY "
-          "to verify Render-specific settings")
-
-def main():
-    print(f"🌐 Domain Configuration Check for {DOMAIN}")
+        status, detail, data = FAIL, f"{type(e).__name__}: {e}", {}
+    return {
+        'host': host,
+        'check': name,
+        'status': status,
+        'detail': detail,
+        'elapsed_ms': round((time.perf_counter() - start) * 1000, 1),
+        'data': data,
+    }
+
+
+async def run_checks(hosts=None, timeout=DEFAULT_TIMEOUT, https_port=443, http_port=80, ssl_context=None):
+    """Run every check for every host concurrently and return the report."""
+    hosts = hosts or default_hosts()
+    started = datetime.now(timezone.utc)
+    start = time.perf_counter()
+
+    checks = []
+    for host in hosts:
+        checks.append(timed(host, 'dns', check_dns(host), timeout))
+        checks.append(timed(host, 'tls', check_tls(host, https_port, ssl_context), timeout))
+        checks.append(timed(host, 'https_redirect', check_https_redirect(host, http_port), timeout))
+        if host.startswith('www.'):
+            target = host[len('www.'):]
+            checks.append(timed(host, 'www_redirect',
+                                check_canonical_redirect(host, target, https_port, ssl_context), timeout))
+    results = await asyncio.gather(*checks)
+
+    summary = {status: sum(result['status'] == status for result in results) for status in (OK, WARN, FAIL)}
+    return {
+        'checked_at': started.isoformat(),
+        'duration_ms': round((time.perf_counter() - start) * 1000, 1),
+        'hosts': list(hosts),
+        'ok': summary[FAIL] == 0,
+        'summary': summary,
+        'results': results,
+    }
+
+
+def print_report(report):
+    """Print a report the way a person reads it, grouped by host."""
+    print(f"🌐 Domain Configuration Check ({report['checked_at']})")
     print("=" * 50)
-    
-    # Check DNS records
-    dns_ok = check_dns(DOMAIN)
-    
-    # Check www subdomain DNS
-    www_dns_ok = check_dns(WWW_DOMAIN)
-    
-    # Check SSL certificates
-    ssl_ok = check_ssl(DOMAIN)
-    
-    # Check redirects
-    check_http_redirects()
-    
-    # Check Render configuration
-    check_render_config()
-    
+    for host in report['hosts']:
+        print(f"\n🔍 {host}")
+        for result in report['results']:
+            if result['host'] == host:
+                print(f"{ICONS[result['status']]} {result['check']}: {result['detail']} "
+                      f"({result['elapsed_ms']:.0f}ms)")
+
+    summary = report['summary']
     print("\n" + "=" * 50)
-    print("✅ Domain check completed!")
-    
-    if not all([dns_ok, www_dns_ok, ssl_ok]):
+    print(f"{summary[OK]} passed, {summary[WARN]} warnings, {summary[FAIL]} failed "
+          f"in {report['duration_ms'] / 1000:.1f}s")
+    if not report['ok']:
         print("\n⚠️  Some checks failed. Please review the output above.")
-        sys.exit(1)
+
+
+def emit(report, as_json):
+    if as_json:
+        print(json.dumps(report), flush=True)
+    else:
+        print_report(report)
+
+
+async def watch(interval, rounds=None, as_json=False, **options):
+    """Re-run the checks every ``interval`` seconds; returns whether the last round passed."""
+    completed = 0
+    while True:
+        start = time.monotonic()
+        report = await run_checks(**options)
+        emit(report, as_json)
+        completed += 1
+        if rounds is not None and completed >= rounds:
+            return report['ok']
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - start)))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Check DNS, TLS and redirects for the production domains')
+    parser.add_argument('--host', action='append', dest='hosts',
+                        help='Host to check (repeatable; default: production hosts in ALLOWED_HOSTS)')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='Seconds allowed per check')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON (one line per round)')
+    parser.add_argument('--watch', type=float, metavar='SECONDS', help='Repeat the checks at this interval')
+    parser.add_argument('--rounds', type=int, help='With --watch, stop after this many rounds')
+    parser.add_argument('--https-port', type=int, default=443, help='HTTPS port (e.g. for a local stand-in server)')
+    parser.add_argument('--http-port', type=int, default=80, help='HTTP port (e.g. for a local stand-in server)')
+    parser.add_argument('--cafile', help='Trust this CA bundle instead of the system store')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    options = {
+        'hosts': args.hosts,
+        'timeout': args.timeout,
+        'https_port': args.https_port,
+        'http_port': args.http_port,
+        'ssl_context': ssl.create_default_context(cafile=args.cafile) if args.cafile else None,
+    }
+
+    if args.watch:
+        ok = asyncio.run(watch(args.watch, args.rounds, args.json, **options))
+    else:
+        report = asyncio.run(run_checks(**options))
+        emit(report, args.json)
+        ok = report['ok']
+    return 0 if ok else 1
+
 
 if __name__ == "__main__":
     try:
-        main()
+        sys.exit(main())
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
         sys.exit(1)
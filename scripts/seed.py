@@ -1,20 +1,18 @@
 #!/usr/bin/env python3
 """
 Seed script for The Solution Desk database
-This script generates SQL statements for seeding the database with sample data from seed-data.json.
-The statements can be piped to sqlite3 command-line tool.
+Loads the sample data from seed-data.json into the SQLite database in-process
+(parameterized executemany in one transaction), or with --output streams the
+equivalent SQL statements to a file for use with the sqlite3 command-line tool.
 """
 
 import os
 import sys
 import json
 import argparse
-import base64
 from datetime import datetime
 import logging
-import hashlib
-import subprocess
-from pathlib import Path
+import sqlite3
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -24,6 +22,8 @@ logger = logging.getLogger(__name__)
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, parent_dir)
 
+from utils.passwords import hash_passwords
+
 
 def load_seed_data():
     """Load seed data from JSON file and sanitize edge cases"""
@@ -168,7 +168,8 @@ def escape_sql_string(value):
     """Escape string values for SQL statements"""
     if value is None:
         return "NULL"
-    return f"'{str(value).replace("'", "''")}'"
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
 
 
 def format_value(value):
@@ -182,16 +183,6 @@ def format_value(value):
     return escape_sql_string(value)
 
 
-def generate_password_hash(password):
-    """Generate a simple password hash similar to werkzeug's"""
-    # This is a simplified version and not secure for production
-    # In real app, we would use werkzeug.security.generate_password_hash
-    salt = os.urandom(8).hex()
-    h = hashlib.sha256(f"{salt}{password}".encode()).digest()
-    hash_b64 = base64.b64encode(h).decode('utf-8')
-    return f"sha256${salt}${hash_b64}"
-
-
 def parse_date(date_str):
     """Parse date string to datetime object"""
     if not date_str:
@@ -204,113 +195,85 @@ def parse_date(date_str):
 
 
 def format_datetime(dt):
-    """Format datetime object for SQL or return NULL if None"""
+    """Format a datetime the way SQLAlchemy stores it in SQLite, or None"""
     if dt is None:
-        return "NULL"
-    return escape_sql_string(dt.isoformat())
+        return None
+    return dt.isoformat(sep=' ')
 
 
-def generate_create_tables_sql():
-    """Generate SQL to create all necessary tables"""
-    return '''
-    DROP TABLE IF EXISTS users;
-    DROP TABLE IF EXISTS projects;
-    DROP TABLE IF EXISTS ideas;
-    DROP TABLE IF EXISTS sops;
-    DROP TABLE IF EXISTS kpis;
-    
-    CREATE TABLE users (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        email TEXT NOT NULL UNIQUE,
-        password_hash TEXT NOT NULL,
-        role TEXT NOT NULL DEFAULT 'Viewer',
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    );
-    
-    CREATE TABLE projects (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        title TEXT NOT NULL,
-        slug TEXT NOT NULL UNIQUE,
-        description TEXT,
-        long_description TEXT,
-        image_url TEXT,
-        demo_url TEXT,
-        github_url TEXT,
-        download_url TEXT,
-        is_featured INTEGER DEFAULT 0,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    );
-    
-    CREATE TABLE ideas (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        title TEXT NOT NULL,
-        description TEXT,
-        status TEXT DEFAULT 'new',
-        priority INTEGER DEFAULT 0,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    );
-    
-    CREATE TABLE sops (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        title TEXT NOT NULL,
-        description TEXT,
-        content TEXT,
-        version TEXT DEFAULT '1.0',
-        category TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    );
-    
-    CREATE TABLE kpis (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        title TEXT NOT NULL,
-        description TEXT,
-        target_value REAL,
-        current_value REAL DEFAULT 0,
-        unit TEXT,
-        category TEXT,
-        start_date TIMESTAMP,
-        end_date TIMESTAMP,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    );
-'''
-
-
-def generate_users_sql(users_data, incremental=False):
-    """Generate SQL statements for users with proper escaping"""
-    logger.info("Generating SQL for users...")
-    sql_statements = []
+def model_metadata():
+    """The application's table metadata, with every model registered"""
+    from app import db
+    import models.data_migration  # noqa: F401
+    import models.project  # noqa: F401 (imports the idea, KPI and SOP models)
+    import models.user  # noqa: F401
+    return db.metadata
+
+
+def migration_head():
+    """The migrations' head revision, or None if the tree has no migrations"""
+    from alembic.script import ScriptDirectory
+    directory = os.path.join(parent_dir, 'migrations')
+    if not os.path.isdir(os.path.join(directory, 'versions')):
+        return None
+    return ScriptDirectory(directory).get_current_head()
+
+
+def reset_schema_statements():
+    """
+    SQLite statements that drop and recreate every table, stamped at the migration head
+
+    The DDL is compiled from the models' metadata, the same schema
+    ``flask init-db`` creates, so a reset database matches what
+    ``flask db upgrade`` builds (columns, foreign keys and indexes) and the
+    app can use it as is.
+    """
+    from sqlalchemy.dialects import sqlite
+    from sqlalchemy.schema import CreateIndex, CreateTable, DropTable
+
+    tables = model_metadata().sorted_tables
+    ddl = [DropTable(table, if_exists=True) for table in reversed(tables)]
+    for table in tables:
+        ddl.append(CreateTable(table))
+        ddl += [CreateIndex(index) for index in sorted(table.indexes, key=lambda index: index.name)]
+
+    dialect = sqlite.dialect()
+    statements = ['DROP TABLE IF EXISTS alembic_version']
+    statements += [str(element.compile(dialect=dialect)).strip() for element in ddl]
+    head = migration_head()
+    if head is not None:
+        statements.append('CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL, '
+                          'CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num))')
+        statements.append(f'INSERT INTO alembic_version (version_num) VALUES ({escape_sql_string(head)})')
+    return statements
+
+
+USER_COLUMNS = ('email', 'password_hash', 'role')
+PROJECT_COLUMNS = ('title', 'slug', 'description', 'long_description', 'image_url',
+                   'demo_url', 'github_url', 'download_url', 'is_featured')
+IDEA_COLUMNS = ('title', 'description', 'status', 'priority')
+SOP_COLUMNS = ('title', 'description', 'content', 'version', 'category')
+KPI_COLUMNS = ('title', 'description', 'target_value', 'current_value', 'unit',
+               'category', 'start_date', 'end_date')
+# Appended to every table's columns; like migrated databases, the tables have
+# no server-side defaults for them
+TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+
+
+def user_rows(users_data, hash_workers=None):
+    """Yield user rows as tuples in USER_COLUMNS order"""
+    logger.info("Preparing users...")
     
-    for user in users_data:
-        email = user['email'].replace("'", "''")
-        password = user['password']
-        role = user.get('role', 'Viewer').replace("'", "''")
-        password_hash = generate_password_hash(password)
-        
-        if incremental:
-            sql_statements.append(f"-- Check if user {email} exists")
-            sql_statements.append("INSERT OR IGNORE INTO users ")
-        else:
-            sql_statements.append("INSERT INTO users ")
-            
-        sql_statements.append("(email, password_hash, role) ")
-        sql_statements.append("VALUES (")
-        sql_statements.append(f"{escape_sql_string(email)}, ")
-        sql_statements.append(f"{escape_sql_string(password_hash)}, ")
-        sql_statements.append(f"{escape_sql_string(role)}")
-        sql_statements.append(");")
+    # Real werkzeug hashes (so seeded users can log in), computed in parallel
+    hashes = hash_passwords([user['password'] for user in users_data], workers=hash_workers)
     
-    return "\n".join(sql_statements)
+    for user, password_hash in zip(users_data, hashes):
+        yield (user['email'], password_hash, user.get('role', 'Viewer'))
 
 
-def generate_projects_sql(projects_data, incremental=False):
-    """Generate SQL to insert projects with edge case handling"""
-    logger.info("Generating SQL for projects...")
-    sql_statements = []
+def project_rows(projects_data):
+    """Yield project rows with edge case handling"""
+    logger.info("Preparing projects...")
     
     for project_data in projects_data:
         # Handle required fields
@@ -322,40 +285,22 @@ def generate_projects_sql(projects_data, incremental=False):
         if description is None:
             logger.warning(f"Project '{title[:30]}...' has no description, using NULL")
         
-        long_description = project_data.get('long_description')
-        image_url = project_data.get('image_url')
-        demo_url = project_data.get('demo_url')
-        github_url = project_data.get('github_url')
-        download_url = project_data.get('download_url')
-        is_featured = 1 if project_data.get('is_featured') else 0
-        
-        if incremental:
-            sql_statements.append(f"-- Check if project with slug '{slug}' exists")
-            sql_statements.append("INSERT OR IGNORE INTO projects ")
-        else:
-            sql_statements.append("INSERT INTO projects ")
-        
-        sql_statements.append("(title, slug, description, long_description, image_url, ")
-        sql_statements.append("demo_url, github_url, download_url, is_featured) ")
-        sql_statements.append("VALUES (")
-        sql_statements.append(f"{escape_sql_string(title)}, ")
-        sql_statements.append(f"{escape_sql_string(slug)}, ")
-        sql_statements.append(f"{escape_sql_string(description) if description else 'NULL'}, ")
-        sql_statements.append(f"{escape_sql_string(long_description) if long_description else 'NULL'}, ")
-        sql_statements.append(f"{escape_sql_string(image_url) if image_url else 'NULL'}, ")
-        sql_statements.append(f"{escape_sql_string(demo_url) if demo_url else 'NULL'}, ")
-        sql_statements.append(f"{escape_sql_string(github_url) if github_url else 'NULL'}, ")
-        sql_statements.append(f"{escape_sql_string(download_url) if download_url else 'NULL'}, ")
-        sql_statements.append(f"{is_featured}")
-        sql_statements.append(");")
-    
-    return "\n".join(sql_statements)
+        yield (
+            title,
+            slug,
+            description or None,
+            project_data.get('long_description') or None,
+            project_data.get('image_url') or None,
+            project_data.get('demo_url') or None,
+            project_data.get('github_url') or None,
+            project_data.get('download_url') or None,
+            1 if project_data.get('is_featured') else 0,
+        )
 
 
-def generate_ideas_sql(ideas_data, incremental=False):
-    """Generate SQL to insert ideas with proper handling of edge cases"""
-    logger.info("Generating SQL for ideas...")
-    sql_statements = []
+def idea_rows(ideas_data):
+    """Yield idea rows with proper handling of edge cases"""
+    logger.info("Preparing ideas...")
     
     for idea_data in ideas_data:
         title = idea_data['title']
@@ -364,32 +309,13 @@ def generate_ideas_sql(ideas_data, incremental=False):
         description = idea_data.get('description')
         if description is None:
             logger.warning(f"Idea '{title[:30]}...' has no description, using NULL")
-            description = None
         
-        status = idea_data.get('status', 'new')
-        priority = idea_data.get('priority', 0)
-        
-        if incremental:
-            sql_statements.append(f"-- Check if idea '{title}' exists")
-            sql_statements.append("INSERT OR IGNORE INTO ideas ")
-        else:
-            sql_statements.append("INSERT INTO ideas ")
-        
-        sql_statements.append("(title, description, status, priority) ")
-        sql_statements.append("VALUES (")
-        sql_statements.append(f"{escape_sql_string(title)}, ")
-        sql_statements.append(f"{escape_sql_string(description) if description else 'NULL'}, ")
-        sql_statements.append(f"{escape_sql_string(status)}, ")
-        sql_statements.append(f"{priority}")
-        sql_statements.append(");")
-    
-    return "\n".join(sql_statements)
+        yield (title, description or None, idea_data.get('status', 'new'), idea_data.get('priority', 0))
 
 
-def generate_sops_sql(sops_data, incremental=False):
-    """Generate SQL to insert SOPs with edge case handling"""
-    logger.info("Generating SQL for SOPs...")
-    sql_statements = []
+def sop_rows(sops_data):
+    """Yield SOP rows with edge case handling"""
+    logger.info("Preparing SOPs...")
     
     for sop_data in sops_data:
         title = sop_data['title']
@@ -404,31 +330,13 @@ def generate_sops_sql(sops_data, incremental=False):
             logger.warning(f"SOP '{title[:30]}...' has no content, using placeholder")
             content = f"# {title}\n\nPlaceholder content for {title}"
         
-        version = sop_data.get('version', '1.0')
-        category = sop_data.get('category', 'General')
-        
-        if incremental:
-            sql_statements.append(f"-- Check if SOP '{title}' exists")
-            sql_statements.append("INSERT OR IGNORE INTO sops ")
-        else:
-            sql_statements.append("INSERT INTO sops ")
-        
-        sql_statements.append("(title, description, content, version, category) ")
-        sql_statements.append("VALUES (")
-        sql_statements.append(f"{escape_sql_string(title)}, ")
-        sql_statements.append(f"{escape_sql_string(description) if description else 'NULL'}, ")
-        sql_statements.append(f"{escape_sql_string(content)}, ")
-        sql_statements.append(f"{escape_sql_string(version)}, ")
-        sql_statements.append(f"{escape_sql_string(category)}")
-        sql_statements.append(");")
-    
-    return "\n".join(sql_statements)
+        yield (title, description or None, content, sop_data.get('version', '1.0'),
+               sop_data.get('category', 'General'))
 
 
-def generate_kpis_sql(kpis_data, incremental=False):
-    """Generate SQL to insert KPIs with edge case handling"""
-    logger.info("Generating SQL for KPIs...")
-    sql_statements = []
+def kpi_rows(kpis_data):
+    """Yield KPI rows with edge case handling"""
+    logger.info("Preparing KPIs...")
     
     if not isinstance(kpis_data, list):
         logger.warning("KPIs data is not a list, converting...")
@@ -436,7 +344,7 @@ def generate_kpis_sql(kpis_data, incremental=False):
             kpis_data = [kpis_data]
         else:
             logger.error("Invalid KPI data format")
-            return "-- No valid KPI data to insert"
+            return
     
     for kpi_data in kpis_data:
         # Ensure we're working with a dictionary
@@ -455,7 +363,6 @@ def generate_kpis_sql(kpis_data, incremental=False):
         description = kpi_data.get('description')
         if description is None:
             logger.warning(f"KPI '{title[:30]}...' has no description, using NULL")
-            description = None
             
         # Handle numeric fields
         try:
@@ -469,161 +376,125 @@ def generate_kpis_sql(kpis_data, incremental=False):
         except (ValueError, TypeError):
             logger.warning(f"KPI '{title[:30]}...' has invalid current_value, using 0")
             current_value = 0
-            
-        unit = kpi_data.get('unit', '')
-        category = kpi_data.get('category', '')
         
-        # Handle potential special characters in category
-        if category and any(char in category for char in '<>&\'"'):
-            logger.warning(f"KPI '{title[:30]}...' has special characters in category, escaping")
-            # Already handled in sanitize function, just log the warning
-            
-        if incremental:
-            sql_statements.append(f"-- Check if KPI '{title}' exists")
-            sql_statements.append("INSERT OR IGNORE INTO kpis ")
-        else:
-            sql_statements.append("INSERT INTO kpis ")
-            
         # Parse dates if provided
-        start_date = None
-        if 'start_date' in kpi_data and kpi_data['start_date']:
-            try:
-                start_date = parse_date(kpi_data['start_date'])
-                # Warn about very old dates (already handled in sanitize function)
-                if start_date.year < 2010:
-                    logger.warning(f"KPI '{title[:30]}...' has very old start_date: {start_date.year}")
-            except ValueError:
-                logger.warning(f"KPI '{title[:30]}...' has invalid start_date format, using NULL")
-                
-        end_date = None
-        if 'end_date' in kpi_data and kpi_data['end_date']:
-            try:
-                end_date = parse_date(kpi_data['end_date'])
-            except ValueError:
-                logger.warning(f"KPI '{title[:30]}...' has invalid end_date format, using NULL")
+        start_date = parse_date(kpi_data.get('start_date'))
+        if start_date and start_date.year < 2010:
+            # Already handled in sanitize function, just log the warning
+            logger.warning(f"KPI '{title[:30]}...' has very old start_date: {start_date.year}")
+        end_date = parse_date(kpi_data.get('end_date'))
         
-        sql_statements.append("(title, description, target_value, current_value, unit, ")
-        sql_statements.append("category, start_date, end_date) ")
-        sql_statements.append("VALUES (")
-        sql_statements.append(f"{escape_sql_string(title)}, ")
-        sql_statements.append(f"{escape_sql_string(description) if description else 'NULL'}, ")
-        sql_statements.append(f"{target_value}, ")
-        sql_statements.append(f"{current_value}, ")
-        sql_statements.append(f"{escape_sql_string(unit)}, ")
-        sql_statements.append(f"{escape_sql_string(category)}, ")
-        sql_statements.append(f"{format_datetime(start_date)}, ")
-        sql_statements.append(f"{format_datetime(end_date)}")
-        sql_statements.append(");")
+        yield (
+            title,
+            description or None,
+            target_value,
+            current_value,
+            kpi_data.get('unit', ''),
+            kpi_data.get('category', ''),
+            format_datetime(start_date),
+            format_datetime(end_date),
+        )
+
+
+def with_timestamps(rows, timestamp):
+    """Append created_at and updated_at to each row"""
+    for row in rows:
+        yield row + (timestamp, timestamp)
+
+
+def seed_tables(seed_data, hash_workers=None):
+    """(table, columns, rows) in insert order; rows are generated lazily"""
+    tables = (
+        ('user', USER_COLUMNS, user_rows(seed_data['users'], hash_workers)),
+        ('projects', PROJECT_COLUMNS, project_rows(seed_data['projects'])),
+        ('ideas', IDEA_COLUMNS, idea_rows(seed_data['ideas'])),
+        ('sops', SOP_COLUMNS, sop_rows(seed_data['sops'])),
+        ('kpis', KPI_COLUMNS, kpi_rows(seed_data.get('kpis', []))),
+    )
+    now = format_datetime(datetime.utcnow())
+    return tuple((table, columns + TIMESTAMP_COLUMNS, with_timestamps(rows, now))
+                 for table, columns, rows in tables)
+
+
+def insert_prefix(table, columns, incremental=False):
+    """INSERT clause up to VALUES; incremental mode ignores rows that hit a unique key"""
+    verb = "INSERT OR IGNORE" if incremental else "INSERT"
+    return f'{verb} INTO "{table}" ({", ".join(columns)}) VALUES '
+
+
+def load_database(db_path, seed_data, mode='standard', hash_workers=None):
+    """Load the seed data in-process with parameterized executemany, in one transaction"""
+    logger.info(f"Loading seed data into {db_path}")
+    connection = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        # WAL stays on for the app; skipping fsyncs is only for this connection's load
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=OFF")
+        connection.execute("BEGIN")
+        
+        if mode == 'reset':
+            for statement in reset_schema_statements():
+                connection.execute(statement)
+        
+        incremental = (mode == 'incremental')
+        for table, columns, rows in seed_tables(seed_data, hash_workers):
+            placeholders = f"({', '.join('?' for _ in columns)})"
+            cursor = connection.executemany(insert_prefix(table, columns, incremental) + placeholders, rows)
+            logger.info(f"Inserted {cursor.rowcount} rows into {table}")
+        
+        connection.execute("COMMIT")
+    except Exception:
+        if connection.in_transaction:
+            connection.execute("ROLLBACK")
+        raise
+    finally:
+        connection.close()
+
+
+def write_sql(output, seed_data, mode='standard', hash_workers=None):
+    """Stream SQL statements to ``output`` (a path, or '-' for stdout) one row at a time"""
+    out = sys.stdout if output == '-' else open(output, 'w')
+    try:
+        out.write("-- Generated SQL for database seeding\n")
+        out.write(f"-- Mode: {mode}\n")
+        out.write(f"-- Generated at: {datetime.now().isoformat()}\n\n")
+        out.write("BEGIN TRANSACTION;\n\n")
+        
+        # Reset database if in reset mode
+        if mode == 'reset':
+            out.write("-- Reset database\n")
+            for statement in reset_schema_statements():
+                out.write(f"{statement};\n")
+            out.write("\n")
+        
+        incremental = (mode == 'incremental')
+        for table, columns, rows in seed_tables(seed_data, hash_workers):
+            out.write(f"-- Seed {table}\n")
+            prefix = insert_prefix(table, columns, incremental)
+            for row in rows:
+                out.write(f"{prefix}({', '.join(format_value(value) for value in row)});\n")
+            out.write("\n")
+        
+        out.write("COMMIT;\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
     
-    return "\n".join(sql_statements)
+    if output != '-':
+        logger.info(f"SQL statements written to {output}")
 
 
-def run_seed(mode='standard'):
-    """Generate SQL statements for seeding the database"""
-    logger.info(f"Starting SQL generation in {mode} mode")
+def run_seed(mode='standard', hash_workers=None, output=None, database=None):
+    """Seed the SQLite database in-process, or write the SQL to ``output`` instead"""
+    logger.info(f"Starting seed in {mode} mode")
     
     # Load seed data
     seed_data = load_seed_data()
     
-    # Store all SQL statements
-    all_sql = []
-    all_sql.append("-- Generated SQL for database seeding")
-    all_sql.append(f"-- Mode: {mode}")
-    all_sql.append(f"-- Generated at: {datetime.now().isoformat()}")
-    all_sql.append("")
-    
-    # Begin transaction
-    all_sql.append("BEGIN TRANSACTION;")
-    all_sql.append("")
-    
-    # Reset database if in reset mode
-    if mode == 'reset':
-        all_sql.append("-- Reset database")
-        all_sql.append(generate_create_tables_sql())
-        all_sql.append("")
-    
-    # Determine if we're running in incremental mode
-    incremental = (mode == 'incremental')
-    
-    # Generate SQL for each model
-    all_sql.append("-- Seed users")
-    all_sql.append(generate_users_sql(seed_data['users'], incremental))
-    all_sql.append("")
-    
-    all_sql.append("-- Seed projects")
-    all_sql.append(generate_projects_sql(seed_data['projects'], incremental))
-    all_sql.append("")
-    
-    all_sql.append("-- Seed ideas")
-    all_sql.append(generate_ideas_sql(seed_data['ideas'], incremental))
-    all_sql.append("")
-    
-    all_sql.append("-- Seed SOPs")
-    all_sql.append(generate_sops_sql(seed_data['sops'], incremental))
-    all_sql.append("")
-    
-    all_sql.append("-- Seed KPIs")
-    try:
-        # Add debugging to check the KPIs data structure
-        if 'kpis' not in seed_data:
-            logger.warning("No KPIs data found in seed data")
-            all_sql.append("-- No KPIs data to insert")
-        else:
-            kpis_data = seed_data['kpis']
-            logger.info(f"KPIs data type: {type(kpis_data)}")
-            
-            # Ensure kpis_data is a list
-            if not isinstance(kpis_data, list):
-                logger.warning("KPIs data is not a list, converting to list")
-                if isinstance(kpis_data, dict):
-                    kpis_data = [kpis_data]
-                else:
-                    logger.error(f"Invalid KPIs data type: {type(kpis_data)}")
-                    kpis_data = []
-            
-            logger.info(f"Number of KPIs: {len(kpis_data)}")
-            all_sql.append(generate_kpis_sql(kpis_data, incremental))
-    except Exception as e:
-        logger.error(f"Error processing KPIs data: {e}")
-        all_sql.append("-- Error processing KPIs data")
-    all_sql.append("")
-    
-    # Commit transaction
-    all_sql.append("COMMIT;")
-    
-    # Join all SQL statements with newlines
-    sql_content = "\n".join(all_sql)
-    
-    # Get the database path
-    db_path = get_db_path()
-    
-    # Create SQL file
-    output_path = os.path.join(os.path.dirname(__file__), 'seed.sql')
-    with open(output_path, 'w') as f:
-        f.write(sql_content)
-    
-    logger.info(f"SQL statements written to {output_path}")
-    
-    # Execute the SQL if sqlite3 is available
-    try:
-        logger.info(f"Executing SQL on database at {db_path}")
-        result = subprocess.run(
-            ['sqlite3', db_path],
-            input=sql_content.encode(),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        
-        if result.returncode == 0:
-            logger.info("SQL execution successful")
-        else:
-            logger.error(f"SQL execution failed: {result.stderr.decode()}")
-            logger.info("You can manually run the SQL with:")
-            logger.info(f"sqlite3 {db_path} < {output_path}")
-    except FileNotFoundError:
-        logger.warning("sqlite3 command not found - SQL file generated but not executed")
-        logger.info("You can manually run the SQL with:")
-        logger.info(f"sqlite3 {db_path} < {output_path}")
+    if output:
+        write_sql(output, seed_data, mode, hash_workers)
+    else:
+        load_database(database or get_db_path(), seed_data, mode, hash_workers)
     
     logger.info("🌱 Seed complete!")
     return "Database seeding completed successfully."
@@ -636,6 +507,14 @@ if __name__ == "__main__":
                       choices=['standard', 'reset', 'incremental'], 
                       default='standard', 
                       help='Seeding mode: standard (default), reset (wipe first), or incremental (only missing)')
+    parser.add_argument('--hash-workers',
+                      type=int,
+                      default=None,
+                      help='Processes used to hash passwords (default: CPU count)')
+    parser.add_argument('--database',
+                      help='SQLite database file to seed (default: from config)')
+    parser.add_argument('--output',
+                      help="Write the SQL to this file ('-' for stdout) instead of loading it")
     parser.add_argument('--debug', 
                       action='store_true', 
                       help='Enable debug logging')
@@ -648,7 +527,7 @@ if __name__ == "__main__":
     
     # Run seeding process
     try:
-        run_seed(mode=args.mode)
+        run_seed(mode=args.mode, hash_workers=args.hash_workers, output=args.output, database=args.database)
     except Exception as e:
         logger.error(f"Seed process failed: {e}")
         # Print traceback for better debugging
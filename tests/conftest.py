@@ -1,7 +1,5 @@
-import os
-import tempfile
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from app import create_app, db
 from models.project import Project
 from models.user import User, RoleEnum
@@ -11,21 +9,28 @@ from flask_login import login_user
 
 @pytest.fixture
 def app():
-    """Create and configure a new app instance for testing."""
-    # Create a temporary file to isolate the database for each test
-    db_fd, db_path = tempfile.mkstemp()
-    
-    app = create_app({
-        'TESTING': True,
-        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}',
-        'WTF_CSRF_ENABLED': False
-    })
+    """
+    An app on an empty in-memory database
 
-    # Create the database and load test data
+    Modules that need rows override this with a fixture of the same name
+    that takes ``app`` and seeds it.
+    """
+    app = create_app('testing')
     with app.app_context():
         db.create_all()
-        # Add test data
-        test_project = Project(
+
+    yield app
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture()
+def sample_data(app):
+    """The featured Test Project and two ideas that the page and API tests expect"""
+    with app.app_context():
+        db.session.add(Project(
             title='Test Project',
             slug='test-project',
             description='A test project',
@@ -33,39 +38,12 @@ def app():
             github_url='https://github.com/test/project',
             download_url='/downloads/test-project.zip',
             is_featured=True
-        )
-        db.session.add(test_project)
-        
-        # Add test ideas
-        test_idea_1 = Idea(
-            title='Test Idea 1',
-            description='A test idea with high priority',
-            status='new',
-            priority=1
-        )
-        
-        test_idea_2 = Idea(
-            title='Test Idea 2',
-            description='A test idea in progress',
-        )
-        
-        viewer_user = User(
-            email="viewer@example.com",
-            password="password",
-            role="Viewer"
-        )
-        
-        db.session.add_all([admin_user, regular_user, viewer_user])
+        ))
+        db.session.add_all([
+            Idea(title='Test Idea 1', description='A test idea with high priority', status='new', priority=1),
+            Idea(title='Test Idea 2', description='A test idea in progress'),
+        ])
         db.session.commit()
-        logger.info("Test users created successfully")
-
-    yield app
-
-    # Clean up / reset resources
-    with app.app_context():
-        logger.info("Tearing down test database")
-        db.session.remove()
-        db.drop_all()
 
 
 @pytest.fixture()
@@ -0,0 +1,74 @@
+"""
+Fixtures for the in-process benchmark suite
+
+The benchmarks only run with --benchmark-only, so a plain `pytest` stays fast:
+
+    pytest tests/performance --benchmark-only --benchmark-json=benchmarks.json
+    BENCHMARK_SIZES=1000,100000 pytest tests/performance --benchmark-only
+    BENCHMARK_SIZES=100000 pytest tests/performance --benchmark-only -k "list_orm or list_rows"
+
+Compare two runs with `pytest-benchmark compare a.json b.json`.
+"""
+import os
+import pytest
+from app import create_app, db
+from config import TestingConfig
+from models.user import User, RoleEnum
+from tests.performance.dataset import populate
+
+BENCHMARK_USER = {'email': 'admin@example.com', 'password': 'password123'}
+
+def benchmark_sizes():
+    """Rows per model, from BENCHMARK_SIZES (default 1000)"""
+    return [int(size) for size in os.getenv('BENCHMARK_SIZES', '1000').split(',')]
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('benchmark_only', default=False):
+        return
+    skip = pytest.mark.skip(reason='benchmarks run with --benchmark-only')
+    here = os.path.dirname(__file__)
+    for item in items:
+        if str(item.fspath).startswith(here):
+            item.add_marker(skip)
+
+def _build_app(database_uri):
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', database_uri)
+        patch.setattr(TestingConfig, 'QUERY_BUDGET', 0)
+        return create_app('testing')
+
+@pytest.fixture(scope='session', params=benchmark_sizes(), ids=lambda size: f'{size}rows')
+def seeded_app(request, tmp_path_factory):
+    """App backed by a SQLite file seeded with `size` rows per model"""
+    size = request.param
+    path = tmp_path_factory.mktemp('benchmark') / f'bench-{size}.db'
+    app = _build_app(f'sqlite:///{path}')
+    app.config['BENCHMARK_SIZE'] = size
+
+    with app.app_context():
+        db.create_all()
+        populate(db, size)
+        user = User(email=BENCHMARK_USER['email'], role=RoleEnum.ADMIN.value)
+        user.set_password(BENCHMARK_USER['password'])
+        db.session.add(user)
+        db.session.commit()
+
+    yield app
+
+    with app.app_context():
+        db.engine.dispose()
+    app.extensions['queue_logging'].stop()
+
+@pytest.fixture()
+def bench_client(seeded_app, benchmark):
+    benchmark.extra_info['rows_per_model'] = seeded_app.config['BENCHMARK_SIZE']
+    return seeded_app.test_client()
+
+@pytest.fixture()
+def empty_app(tmp_path):
+    """App backed by an empty SQLite file (for seed benchmarks)"""
+    app = _build_app(f'sqlite:///{tmp_path / "seed.db"}')
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+    app.extensions['queue_logging'].stop()
@@ -0,0 +1,18 @@
+"""
+Deterministic benchmark dataset
+
+Generates ``size`` rows per model (users, projects, ideas, SOPs, KPIs) from
+a fixed random seed, so every run and every commit benchmarks the same data.
+Rows come from utils.datagen, the generator behind ``flask generate-data``;
+KPIs get a single period each so every model has exactly ``size`` rows.
+"""
+from utils.datagen import generate
+
+SOP_BYTES = 1024
+
+
+def populate(db, size, seed=42):
+    """Insert ``size`` rows per model; must be called inside an app context"""
+    counts = {'users': size, 'projects': size, 'ideas': size, 'sops': size, 'kpis': size}
+    generate(db.session.connection(), counts, seed=seed, sop_bytes=SOP_BYTES, kpi_periods=1)
+    db.session.commit()
@@ -0,0 +1,133 @@
+"""
+Import-time / cold-start benchmark for the application
+
+Builds the app in a fresh interpreter under ``python -X importtime`` and
+reports where boot time goes, aggregated by top-level package.
+
+Run with:
+    python tests/performance/importtime.py
+    python tests/performance/importtime.py --json importtime.json --budget-ms 1500
+
+importtime-baseline.json next to this file is the report for the current
+tree; regenerate it with ``--json`` when boot time changes intentionally.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Builds the app exactly once, the way gunicorn's `app:app` does
+BOOT_CODE = (
+    "import time; start = time.perf_counter(); "
+    "import app; app.get_app(); "
+    "print('BOOT_MS=%.1f' % ((time.perf_counter() - start) * 1000))"
+)
+
+
+def run_importtime(env_overrides):
+    """Boot the app in a subprocess and return (boot_ms, importtime lines)"""
+    env = os.environ.copy()
+    env.setdefault('FLASK_ENV', 'production')
+    # Keep the benchmark off any real database
+    env.setdefault('DATABASE_URL', 'sqlite://')
+    env.update(env_overrides)
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', BOOT_CODE],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(f"App failed to boot (exit code {result.returncode})")
+
+    boot_ms = None
+    for line in result.stdout.splitlines():
+        if line.startswith('BOOT_MS='):
+            boot_ms = float(line.split('=', 1)[1])
+    lines = [l for l in result.stderr.splitlines() if l.startswith('import time:')]
+    return boot_ms, lines
+
+
+def parse_importtime(lines):
+    """Parse ``-X importtime`` output into [(module, self_us, cumulative_us)]"""
+    modules = []
+    for line in lines:
+        # import time: self [us] | cumulative | imported package
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0])
+            cumulative_us = int(parts[1])
+        except ValueError:
+            continue  # header row
+        modules.append((parts[2].strip(), self_us, cumulative_us))
+    return modules
+
+
+def summarize(modules, top):
+    """Aggregate self time per top-level package and pick the slowest modules"""
+    by_package = defaultdict(int)
+    for name, self_us, _ in modules:
+        by_package[name.split('.')[0]] += self_us
+
+    return {
+        'total_import_ms': round(sum(m[1] for m in modules) / 1000, 1),
+        'modules_imported': len(modules),
+        'top_packages': [
+            {'package': name, 'self_ms': round(us / 1000, 1)}
+            for name, us in sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        ],
+        'top_modules': [
+            {'module': name, 'cumulative_ms': round(cum / 1000, 1)}
+            for name, _, cum in sorted(modules, key=lambda m: m[2], reverse=True)[:top]
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure application cold-start import time.')
+    parser.add_argument('--top', type=int, default=15, help='Number of packages/modules to list')
+    parser.add_argument('--runs', type=int, default=3, help='Boots to run; the fastest is reported')
+    parser.add_argument('--json', dest='json_path', help='Write the report to this JSON file')
+    parser.add_argument('--budget-ms', type=float, help='Exit non-zero if boot exceeds this many ms')
+    parser.add_argument('--set', action='append', default=[], metavar='KEY=VALUE',
+                        help='Extra environment for the boot, e.g. --set ADMIN_ENABLED=False')
+    args = parser.parse_args()
+
+    env_overrides = dict(item.split('=', 1) for item in args.set)
+
+    # Take the fastest run to reduce noise from a cold filesystem cache
+    runs = [run_importtime(env_overrides) for _ in range(args.runs)]
+    boot_ms, lines = min(runs, key=lambda r: r[0])
+
+    report = summarize(parse_importtime(lines), args.top)
+    report['boot_ms'] = boot_ms
+    report['python'] = sys.version.split()[0]
+    report['env'] = env_overrides
+
+    print(f"Boot time: {boot_ms:.1f} ms ({report['modules_imported']} modules, "
+          f"{report['total_import_ms']:.1f} ms in imports)")
+    print("\nSlowest packages (self time):")
+    for row in report['top_packages']:
+        print(f"  {row['self_ms']:>8.1f} ms  {row['package']}")
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.json_path}")
+
+    if args.budget_ms is not None and boot_ms > args.budget_ms:
+        print(f"\n❌ Boot time {boot_ms:.1f} ms exceeds budget of {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
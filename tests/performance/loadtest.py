@@ -0,0 +1,200 @@
+"""
+Headless load test against a local gunicorn server
+
+Seeds a SQLite database with the deterministic benchmark dataset, boots
+gunicorn with the chosen worker class/count, runs the locust scenarios in
+locustfile.py headless for a fixed duration and reports throughput and
+p50/p95/p99 latency per endpoint.
+
+Run with (locust is a dev-only dependency: pip install locust):
+    python tests/performance/loadtest.py --rows 1000 --workers 2 --duration 30s
+    python tests/performance/loadtest.py --worker-class gthread --threads 4 --json gthread.json
+"""
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+LOCUSTFILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'locustfile.py')
+
+# Accounts the locust scenarios log in with
+LOAD_TEST_USERS = (
+    ('admin@example.com', 'password123', 'Admin'),
+    ('user@example.com', 'password123', 'Viewer'),
+)
+
+
+def seed_database(database_url, rows):
+    """Create the schema and load the dataset in a fresh interpreter"""
+    code = (
+        "from app import create_app, db; "
+        "from models.user import User; "
+        "from tests.performance.dataset import populate; "
+        "from tests.performance.loadtest import LOAD_TEST_USERS; "
+        "app = create_app(); "
+        "ctx = app.app_context(); ctx.push(); "
+        "db.create_all(); "
+        f"populate(db, {rows}); "
+        "users = [User(email=e, role=r) for e, _, r in LOAD_TEST_USERS]; "
+        "[u.set_password(p) for u, (_, p, _) in zip(users, LOAD_TEST_USERS)]; "
+        "db.session.add_all(users); db.session.commit()"
+    )
+    subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, env=server_env(database_url),
+                   check=True, capture_output=True)
+
+
+def server_env(database_url, log_file=os.devnull):
+    env = os.environ.copy()
+    env.update({
+        'FLASK_ENV': 'production',
+        'DATABASE_URL': database_url,
+        'LOG_FILE': log_file,
+        'SECRET_KEY': env.get('SECRET_KEY', 'load-test'),
+        'SCHEMA_CHECK_ON_STARTUP': 'False',
+    })
+    return env
+
+
+def start_gunicorn(args, database_url, log_file):
+    command = [
+        sys.executable, '-m', 'gunicorn', 'wsgi:application',
+        '--bind', f'127.0.0.1:{args.port}',
+        '--workers', str(args.workers),
+        '--worker-class', args.worker_class,
+        '--threads', str(args.threads),
+        '--log-level', 'warning',
+    ]
+    if args.preload:
+        command.append('--preload')
+    return subprocess.Popen(command, cwd=PROJECT_ROOT, env=server_env(database_url, log_file))
+
+
+def wait_until_ready(url, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f'{url}/health', timeout=2) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            # Refused or timed out while workers boot (URLError is an OSError)
+            pass
+        time.sleep(0.2)
+    raise SystemExit(f"Server at {url} did not become ready within {timeout}s")
+
+
+def run_locust(args, url, csv_prefix):
+    command = [
+        sys.executable, '-m', 'locust',
+        '-f', LOCUSTFILE,
+        '--headless',
+        '--host', url,
+        '--users', str(args.users),
+        '--spawn-rate', str(args.spawn_rate),
+        '--run-time', args.duration,
+        '--csv', csv_prefix,
+        '--only-summary',
+        *args.user_classes,
+    ]
+    env = os.environ.copy()
+    env['LOADTEST_ROWS'] = str(args.rows)
+    subprocess.run(command, cwd=PROJECT_ROOT, env=env, check=False)
+
+
+def read_stats(csv_prefix):
+    """Parse locust's <prefix>_stats.csv into per-endpoint rows"""
+    endpoints = []
+    with open(f'{csv_prefix}_stats.csv', newline='') as f:
+        for row in csv.DictReader(f):
+            endpoints.append({
+                'method': row['Type'],
+                'name': row['Name'],
+                'requests': int(row['Request Count']),
+                'failures': int(row['Failure Count']),
+                'rps': round(float(row['Requests/s']), 2),
+                'p50_ms': float(row['50%']),
+                'p95_ms': float(row['95%']),
+                'p99_ms': float(row['99%']),
+            })
+    return endpoints
+
+
+def print_report(report):
+    config = report['config']
+    print(f"\n{config['workers']} x {config['worker_class']} worker(s), {config['threads']} thread(s), "
+          f"{config['users']} users, {config['rows']} rows/model, {config['duration']}")
+    print(f"{'Endpoint':<52} {'reqs':>7} {'fail':>6} {'rps':>8} {'p50':>7} {'p95':>7} {'p99':>7}")
+    for row in report['endpoints']:
+        name = f"{row['method']} {row['name']}".strip()[:52]
+        print(f"{name:<52} {row['requests']:>7} {row['failures']:>6} {row['rps']:>8.1f} "
+              f"{row['p50_ms']:>7.0f} {row['p95_ms']:>7.0f} {row['p99_ms']:>7.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the locust scenarios against a local gunicorn.')
+    parser.add_argument('--rows', type=int, default=1000, help='Rows per model to seed')
+    parser.add_argument('--workers', type=int, default=2, help='Gunicorn worker processes')
+    parser.add_argument('--worker-class', default='sync', help='Gunicorn worker class (sync, gthread, gevent, ...)')
+    parser.add_argument('--threads', type=int, default=1, help='Threads per worker (gthread)')
+    parser.add_argument('--preload', action='store_true', help='Start gunicorn with --preload')
+    parser.add_argument('--users', type=int, default=20, help='Concurrent locust users')
+    parser.add_argument('--spawn-rate', type=float, default=10, help='Users started per second')
+    parser.add_argument('--duration', default='30s', help='Locust run time, e.g. 30s or 2m')
+    parser.add_argument('--port', type=int, default=8765, help='Port for the local server')
+    parser.add_argument('--user-class', dest='user_classes', action='append', default=[],
+                        help='Locust user class to run (default: all in locustfile.py)')
+    parser.add_argument('--json', dest='json_path', help='Write the report to this JSON file')
+    parser.add_argument('--keep', action='store_true', help='Keep the database, logs and CSV files')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='loadtest-')
+    database_url = f"sqlite:///{os.path.join(workdir, 'loadtest.db')}"
+    url = f'http://127.0.0.1:{args.port}'
+    csv_prefix = os.path.join(workdir, 'locust')
+
+    print(f"Seeding {args.rows} rows per model into {workdir} ...")
+    seed_database(database_url, args.rows)
+
+    server = start_gunicorn(args, database_url, os.path.join(workdir, 'app.log'))
+    try:
+        wait_until_ready(url)
+        run_locust(args, url, csv_prefix)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    report = {
+        'config': {
+            'rows': args.rows,
+            'workers': args.workers,
+            'worker_class': args.worker_class,
+            'threads': args.threads,
+            'preload': args.preload,
+            'users': args.users,
+            'duration': args.duration,
+        },
+        'endpoints': read_stats(csv_prefix),
+    }
+    print_report(report)
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.json_path}")
+
+    if args.keep:
+        print(f"Artifacts kept in {workdir}")
+    else:
+        for name in os.listdir(workdir):
+            os.remove(os.path.join(workdir, name))
+        os.rmdir(workdir)
+
+
+if __name__ == '__main__':
+    main()
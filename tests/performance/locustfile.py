@@ -1,13 +1,18 @@
 """
 Load testing configuration for The Solution Desk application
 Run with: locust -f tests/performance/locustfile.py
+Or headless against a seeded local server: python tests/performance/loadtest.py
 """
 
+import os
 import time
 import json
 import random
 from locust import HttpUser, task, between
 
+# Rows per model in the target database (set by loadtest.py); random ids stay in range
+ROW_COUNT = int(os.getenv('LOADTEST_ROWS', 10))
+
 
 class APIUser(HttpUser):
     """
@@ -32,12 +37,14 @@ class APIUser(HttpUser):
             "password": "password123"
         }
         
+        # The login view reads form fields and redirects on success
         with self.client.post(
             "/auth/login", 
-            json=credentials,
+            data=credentials,
+            allow_redirects=False,
             catch_response=True
         ) as response:
-            if response.status_code == 200:
+            if response.status_code == 302:
                 # For a real implementation, you might extract a token here
                 # self.api_token = response.json()["token"]
                 self.api_token = "simulated_token"
@@ -67,7 +74,7 @@ class APIUser(HttpUser):
         Medium frequency task
         """
         # In a real scenario, we'd pick a random ID from existing ideas
-        idea_id = random.randint(1, 10)
+        idea_id = random.randint(1, ROW_COUNT)
         
         with self.client.get(
             f"/api/ideas/{idea_id}",
@@ -123,7 +130,7 @@ class APIUser(HttpUser):
         Medium frequency task
         """
         # In a real scenario, we'd pick a random ID from existing projects
-        project_id = random.randint(1, 5)
+        project_id = random.randint(1, ROW_COUNT)
         
         with self.client.get(
             f"/api/projects/{project_id}",
@@ -157,7 +164,7 @@ class APIUser(HttpUser):
         Low frequency task
         """
         # In a real scenario, we'd pick a random ID from existing KPIs
-        kpi_id = random.randint(1, 5)
+        kpi_id = random.randint(1, ROW_COUNT)
         
         update_data = {
             "current_value": random.uniform(10.0, 100.0),
@@ -219,26 +226,18 @@ class WebsiteUser(HttpUser):
     @task(5)
     def view_projects_page(self):
         """
-        GET /projects - View projects listing page
+        GET /projects/ - View projects listing page
         Common task for web users
         """
-        self.client.get("/projects", name="Projects Page")
+        self.client.get("/projects/", name="Projects Page")
     
     @task(4)
-    def view_ideas_page(self):
+    def view_tools_page(self):
         """
-        GET /ideas - View ideas listing page
+        GET /tools/ - View tools listing page
         Fairly common task for web users
         """
-        self.client.get("/ideas", name="Ideas Page")
-    
-    @task(2)
-    def view_kpi_dashboard(self):
-        """
-        GET /dashboard - View KPI dashboard
-        Less common task for regular users
-        """
-        self.client.get("/dashboard", name="KPI Dashboard")
+        self.client.get("/tools/", name="Tools Page")
 
 
 # Execute with:
@@ -0,0 +1,189 @@
+"""
+In-process benchmarks for API hot paths
+
+Uses the Flask test client against a seeded SQLite database, so results
+measure application cost only (no network, no server).
+"""
+import itertools
+import tracemalloc
+import pytest
+from app import db
+from models.idea import Idea
+from models.kpi import KPI
+from models.project import Project
+from models.sop import SOP
+from models.user import User
+from schemas.idea import idea_schema
+from schemas.kpi import kpi_schema
+from schemas.project import ProjectSchema, project_schema, projects_schema
+from schemas.sop import sop_schema
+from schemas.user import user_schema
+from tests.performance.conftest import BENCHMARK_USER
+
+RESOURCES = ('projects', 'ideas', 'sops', 'kpis')
+
+LIST_MODELS = {'projects': Project, 'ideas': Idea, 'sops': SOP, 'kpis': KPI, 'users': User}
+LIST_SCHEMAS = {'projects': project_schema, 'ideas': idea_schema, 'sops': sop_schema, 'kpis': kpi_schema,
+                'users': user_schema}
+
+VALID_PAYLOADS = {
+    'ideas': {'title': 'Benchmark idea', 'description': 'An idea used to benchmark validation',
+              'status': 'new', 'priority': 2},
+    'sops': {'title': 'Benchmark SOP', 'content': '1. Measure\n2. Change one thing\n3. Measure again',
+             'category': 'Performance'},
+    'kpis': {'title': 'Benchmark KPI', 'description': 'A KPI used to benchmark validation',
+             'target_value': 100.0, 'current_value': 42.0, 'start_date': '2026-01-01'},
+}
+
+VALID_PROJECT = {
+    'title': 'Benchmark Project',
+    'slug': 'benchmark-project',
+    'description': 'A project used to benchmark schema validation',
+    'github_url': 'https://github.com/example/benchmark',
+    'demo_url': 'https://demo.example.com/benchmark',
+    'download_url': '/downloads/benchmark.zip',
+}
+
+@pytest.mark.parametrize('resource', RESOURCES)
+def test_list(benchmark, bench_client, resource):
+    """GET /api/<resource>"""
+    response = benchmark(bench_client.get, f'/api/{resource}')
+    assert response.status_code == 200
+
+@pytest.mark.parametrize('resource', RESOURCES)
+def test_detail(benchmark, bench_client, resource):
+    """GET /api/<resource>/<id>"""
+    response = benchmark(bench_client.get, f'/api/{resource}/1')
+    assert response.status_code == 200
+
+@pytest.mark.parametrize('query', (
+    'status=new&sort=-priority',
+    'status=in:new,in_progress&priority=gte:3&sort=-priority,created_at&facets=',
+))
+def test_list_ideas_filtered(benchmark, bench_client, query):
+    """GET /api/ideas with index-backed filters, sorting and facets"""
+    response = benchmark(bench_client.get, f'/api/ideas?{query}')
+    assert response.status_code == 200
+
+@pytest.mark.parametrize('include', ('ideas', 'ideas,sops,kpis'))
+def test_list_projects_including(benchmark, bench_client, include):
+    """GET /api/projects?include=..., one selectinload query per relationship"""
+    response = benchmark(bench_client.get, f'/api/projects?include={include}')
+    assert response.status_code == 200
+
+def test_serialize_projects(benchmark, seeded_app):
+    """Project.serialize() over a page of 1000 rows"""
+    with seeded_app.app_context():
+        projects = Project.query.limit(1000).all()
+        result = benchmark(lambda: [p.serialize() for p in projects])
+    assert len(result) == len(projects)
+
+def record_peak_allocation(benchmark, function):
+    """Run ``function`` once under tracemalloc and store its peak in the benchmark JSON"""
+    tracemalloc.start()
+    try:
+        function()
+        benchmark.extra_info['peak_alloc_kib'] = round(tracemalloc.get_traced_memory()[1] / 1024)
+    finally:
+        tracemalloc.stop()
+
+@pytest.mark.parametrize('resource', sorted(LIST_MODELS))
+def test_list_orm(benchmark, seeded_app, resource):
+    """Every row as ORM instances, then serialize() (the old list path)"""
+    model = LIST_MODELS[resource]
+    with seeded_app.app_context():
+        def run():
+            items = [obj.serialize() for obj in model.query.all()]
+            # A new session per call, like a new request
+            db.session.remove()
+            return items
+        record_peak_allocation(benchmark, run)
+        result = benchmark(run)
+    assert len(result) == seeded_app.config['BENCHMARK_SIZE'] + (resource == 'users')
+
+@pytest.mark.parametrize('resource', sorted(LIST_MODELS))
+def test_list_rows(benchmark, seeded_app, resource):
+    """Every row as column tuples through the schema's serialize_many"""
+    model, schema = LIST_MODELS[resource], LIST_SCHEMAS[resource]
+    with seeded_app.app_context():
+        def run():
+            items = schema.serialize_many(db.session.execute(model.row_select()))
+            db.session.remove()
+            return items
+        record_peak_allocation(benchmark, run)
+        result = benchmark(run)
+    assert len(result) == seeded_app.config['BENCHMARK_SIZE'] + (resource == 'users')
+
+def test_schema_dump_projects(benchmark, seeded_app):
+    """ProjectSchema(many=True).dump over a page of 1000 rows"""
+    with seeded_app.app_context():
+        projects = Project.query.limit(1000).all()
+        result = benchmark(projects_schema.dump, projects)
+    assert len(result) == len(projects)
+
+def test_schema_serialize_projects(benchmark, seeded_app):
+    """project_schema.serialize_many (compiled getters) over a page of 1000 rows"""
+    with seeded_app.app_context():
+        projects = Project.query.limit(1000).all()
+        result = benchmark(project_schema.serialize_many, projects)
+    assert len(result) == len(projects)
+
+@pytest.mark.parametrize('resource', sorted(VALID_PAYLOADS))
+def test_schema_load(benchmark, resource):
+    """Validating a create payload with the shared schema (per-request overhead)"""
+    schema = LIST_SCHEMAS[resource]
+    data = benchmark(schema.load, VALID_PAYLOADS[resource])
+    assert data['title'] == VALID_PAYLOADS[resource]['title']
+
+def test_schema_validate_project(benchmark, seeded_app):
+    """ProjectSchema validation of a create payload"""
+    with seeded_app.app_context():
+        errors = benchmark(project_schema.validate, VALID_PROJECT, session=db.session)
+    assert errors == {}
+
+def test_schema_construct_project(benchmark):
+    """ProjectSchema() construction, formerly paid on every write request"""
+    schema = benchmark(ProjectSchema)
+    assert 'title' in schema.fields
+
+def test_create_project(benchmark, bench_client):
+    """POST /api/projects (validation, insert and unique title check)"""
+    counter = itertools.count()
+
+    def create():
+        n = next(counter)
+        return bench_client.post('/api/projects', json=dict(VALID_PROJECT, title=f'Benchmark Project {n}',
+                                                            slug=f'benchmark-project-{n}'))
+
+    response = benchmark(create)
+    assert response.status_code == 201
+
+@pytest.mark.parametrize('resource', sorted(VALID_PAYLOADS))
+def test_create(benchmark, bench_client, resource):
+    """POST /api/<resource> (validation, insert and serialization)"""
+    response = benchmark(bench_client.post, f'/api/{resource}', json=VALID_PAYLOADS[resource])
+    assert response.status_code == 201
+
+def test_password_hash(benchmark):
+    """Hashing a password on registration"""
+    user = User(email='bench@example.com')
+    benchmark(user.set_password, BENCHMARK_USER['password'])
+    assert user.password_hash
+
+def test_login(benchmark, bench_client):
+    """POST /auth/login (lookup plus password check)"""
+    def login():
+        response = bench_client.post('/auth/login', data=BENCHMARK_USER)
+        bench_client.get('/auth/logout')
+        return response
+
+    response = benchmark(login)
+    assert response.status_code == 302
+
+def test_seed(benchmark, empty_app):
+    """`flask seed --mode reset` from scripts/seed-data.json"""
+    from commands import seed_command
+    runner = empty_app.test_cli_runner()
+    result = benchmark.pedantic(runner.invoke, args=(seed_command, ['--mode', 'reset']),
+                                rounds=3, iterations=1)
+    assert result.exit_code == 0
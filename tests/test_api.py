@@ -5,6 +5,8 @@ import json
 import pytest
 from flask import url_for
 
+pytestmark = pytest.mark.usefixtures('sample_data')
+
 def test_get_projects_api(client):
     """Test getting all projects via API"""
     response = client.get('/api/projects')
@@ -0,0 +1,93 @@
+"""
+Tests for streaming export and import archives
+"""
+import json
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, Table
+from sqlalchemy.exc import IntegrityError
+from app import db
+from commands import export_command, import_command
+from models.kpi import KPI
+from models.project import Project
+from models.sop import SOP
+from utils.archive import MANIFEST, dependency_levels, export_archive, import_archive
+from utils.datagen import generate
+
+@pytest.fixture()
+def app(app):
+    with app.app_context():
+        with db.engine.begin() as connection:
+            generate(connection, {'users': 3, 'sops': 12, 'kpis': 2}, kpi_periods=3, sop_bytes=512)
+    return app
+
+def snapshot(model):
+    return [sorted(row.serialize().items()) for row in model.query.order_by(model.id)]
+
+def test_round_trip(app, tmp_path):
+    """Test an export imports back into an empty database unchanged"""
+    with app.app_context():
+        before = snapshot(SOP), snapshot(KPI)
+        manifest = export_archive(db.engine, db.metadata, tmp_path, chunk_size=5)
+        assert manifest['tables']['sops']['rows'] == 12
+        assert (tmp_path / 'sops.ndjson.gz').exists()
+
+        counts = import_archive(db.engine, db.metadata, tmp_path, truncate=True, chunk_size=5)
+        db.session.expire_all()
+        assert counts['kpis'] == 6
+        assert (snapshot(SOP), snapshot(KPI)) == before
+
+def test_conflicts(app, tmp_path):
+    """Test existing keys fail by default and can be skipped or updated"""
+    with app.app_context():
+        export_archive(db.engine, db.metadata, tmp_path, tables={'sops'})
+        SOP.query.filter_by(id=1).update({'title': 'Changed'})
+        db.session.commit()
+
+        with pytest.raises(IntegrityError):
+            import_archive(db.engine, db.metadata, tmp_path)
+        import_archive(db.engine, db.metadata, tmp_path, on_conflict='skip')
+        assert db.session.get(SOP, 1).title == 'Changed'
+        db.session.expire_all()
+        import_archive(db.engine, db.metadata, tmp_path, on_conflict='update')
+        assert db.session.get(SOP, 1).title != 'Changed'
+        assert SOP.query.count() == 12
+
+def test_skip_ignores_unique_column_clashes(app, tmp_path):
+    """Test skip also passes over rows whose unique title matches a different row"""
+    with app.app_context():
+        db.session.add(Project(title='Kept', slug='kept'))
+        db.session.commit()
+        export_archive(db.engine, db.metadata, tmp_path, tables={'projects'})
+        Project.query.delete()
+        db.session.add(Project(id=2, title='Kept', slug='kept-again'))
+        db.session.commit()
+
+        import_archive(db.engine, db.metadata, tmp_path, on_conflict='skip')
+        assert [project.slug for project in Project.query] == ['kept-again']
+        with pytest.raises(IntegrityError):
+            import_archive(db.engine, db.metadata, tmp_path, on_conflict='update')
+
+def test_dependency_levels():
+    """Test referenced tables load in an earlier level than their referrers"""
+    metadata = MetaData()
+    parent = Table('parent', metadata, Column('id', Integer, primary_key=True))
+    child = Table('child', metadata, Column('id', Integer, primary_key=True),
+                  Column('parent_id', ForeignKey('parent.id')))
+    other = Table('other', metadata, Column('id', Integer, primary_key=True))
+    levels = dependency_levels([parent, child, other])
+    assert levels == [[parent, other], [child]]
+
+def test_cli_commands(app, tmp_path):
+    """Test flask export and flask import with --truncate"""
+    runner = app.test_cli_runner()
+    result = runner.invoke(export_command, [str(tmp_path), '--table', 'sops', '--table', 'kpis'])
+    assert result.exit_code == 0, result.output
+    manifest = json.loads((tmp_path / MANIFEST).read_text())
+    assert set(manifest['tables']) == {'sops', 'kpis'}
+
+    result = runner.invoke(import_command, [str(tmp_path)])
+    assert result.exit_code == 1
+    result = runner.invoke(import_command, [str(tmp_path), '--truncate', '--jobs', '2'])
+    assert result.exit_code == 0, result.output
+    with app.app_context():
+        assert SOP.query.count() == 12
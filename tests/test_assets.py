@@ -0,0 +1,56 @@
+"""
+Tests for the static asset pipeline
+"""
+import gzip
+import os
+import pytest
+from utils.assets import build_assets, load_manifest
+
+@pytest.fixture()
+def built_assets(app, tmp_path):
+    """Build fingerprinted assets into a temporary dist folder"""
+    static_dir = tmp_path / 'static'
+    static_dir.mkdir()
+    (static_dir / 'main.css').write_text('body { color: #fff; }\n' * 50)
+    (static_dir / 'logo.png').write_bytes(b'\x89PNG fake image bytes')
+    dist_dir = tmp_path / 'dist'
+    
+    manifest = build_assets(str(static_dir), str(dist_dir))
+    app.config['ASSETS_DIST_FOLDER'] = str(dist_dir)
+    app.extensions['asset_manifest'] = manifest
+    return manifest, dist_dir
+
+def test_build_assets_fingerprints_and_compresses(built_assets):
+    """Test assets are hashed, precompressed and recorded in the manifest"""
+    manifest, dist_dir = built_assets
+    assert manifest['main.css'].startswith('main.')
+    assert manifest['main.css'].endswith('.css')
+    assert manifest['main.css'] != 'main.css'
+    assert os.path.exists(dist_dir / (manifest['main.css'] + '.gz'))
+    # Images are not precompressed
+    assert not os.path.exists(dist_dir / (manifest['logo.png'] + '.gz'))
+    assert load_manifest(str(dist_dir)) == manifest
+
+def test_asset_served_gzip_when_accepted(client, built_assets):
+    """Test the gzip variant is served with immutable caching"""
+    manifest, _ = built_assets
+    response = client.get(f"/assets/{manifest['main.css']}", headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'immutable' in response.headers['Cache-Control']
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert gzip.decompress(response.data).startswith(b'body')
+
+def test_asset_served_identity_without_accept_encoding(client, built_assets):
+    """Test clients that don't accept compression get the plain file"""
+    manifest, _ = built_assets
+    response = client.get(f"/assets/{manifest['main.css']}", headers={'Accept-Encoding': 'identity'})
+    assert response.status_code == 200
+    assert 'Content-Encoding' not in response.headers
+    assert response.data.startswith(b'body')
+
+def test_templates_use_fingerprinted_urls(client, built_assets):
+    """Test pages link to the fingerprinted stylesheet"""
+    manifest, _ = built_assets
+    response = client.get('/')
+    assert f"/assets/{manifest['main.css']}".encode() in response.data
@@ -0,0 +1,106 @@
+"""
+Tests for the asyncio domain checker against local stand-in servers
+"""
+import asyncio
+import contextlib
+import importlib.util
+import json
+import os
+import shutil
+import ssl
+import subprocess
+import pytest
+
+pytestmark = pytest.mark.skipif(shutil.which('openssl') is None, reason='needs the openssl CLI')
+
+def load_checker():
+    path = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'check_domain.py')
+    spec = importlib.util.spec_from_file_location('check_domain', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture(scope='module')
+def certificate(tmp_path_factory):
+    directory = tmp_path_factory.mktemp('tls')
+    cert, key = directory / 'cert.pem', directory / 'key.pem'
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '90',
+                    '-subj', '/CN=localhost', '-addext', 'subjectAltName=DNS:localhost',
+                    '-keyout', str(key), '-out', str(cert)], check=True, capture_output=True)
+    return str(cert), str(key)
+
+async def redirect(reader, writer):
+    await reader.readuntil(b'\r\n\r\n')
+    writer.write(b'HTTP/1.1 301 Moved Permanently\r\nLocation: https://localhost/\r\n'
+                 b'Content-Length: 0\r\nConnection: close\r\n\r\n')
+    await writer.drain()
+    writer.close()
+
+async def stall(reader, writer):
+    await asyncio.sleep(5)
+    writer.close()
+
+@contextlib.asynccontextmanager
+async def local_servers(certificate, http_handler=redirect):
+    """Local HTTPS and HTTP servers, yielding the options that point the checks at them"""
+    cert, key = certificate
+    server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_context.load_cert_chain(cert, key)
+    https = await asyncio.start_server(redirect, '127.0.0.1', 0, ssl=server_context)
+    http = await asyncio.start_server(http_handler, '127.0.0.1', 0)
+    async with https, http:
+        yield {
+            'hosts': ['localhost'],
+            'https_port': https.sockets[0].getsockname()[1],
+            'http_port': http.sockets[0].getsockname()[1],
+            'ssl_context': ssl.create_default_context(cafile=cert),
+        }
+
+def run_against(certificate, check, http_handler=redirect):
+    async def scenario():
+        async with local_servers(certificate, http_handler) as options:
+            return await check(options)
+    return asyncio.run(scenario())
+
+def test_checks_pass_against_local_servers(certificate):
+    """Test DNS, TLS and redirect checks all pass and report details"""
+    checker = load_checker()
+    report = run_against(certificate, lambda options: checker.run_checks(**options))
+    results = {result['check']: result for result in report['results']}
+    assert report['ok'] is True
+    assert report['summary'] == {'ok': 3, 'warn': 0, 'fail': 0}
+    assert results['tls']['data']['subject_alt_names'] == ['localhost']
+    assert 88 <= results['tls']['data']['days_left'] <= 90
+    assert results['https_redirect']['data']['location'] == 'https://localhost/'
+    json.dumps(report)
+
+def test_each_check_has_its_own_timeout(certificate):
+    """Test a stalled server fails its check without holding up the others"""
+    checker = load_checker()
+    report = run_against(certificate, lambda options: checker.run_checks(timeout=0.5, **options),
+                         http_handler=stall)
+    results = {result['check']: result for result in report['results']}
+    assert report['ok'] is False
+    assert results['https_redirect']['detail'] == 'timed out after 0.5s'
+    assert results['tls']['status'] == 'ok'
+    assert report['duration_ms'] < 2000
+
+def test_untrusted_certificate_fails(certificate):
+    """Test a certificate that does not verify fails the TLS check"""
+    checker = load_checker()
+
+    # The client only trusts the system store, not the self-signed certificate
+    result = run_against(certificate, lambda options: checker.timed(
+        'localhost', 'tls', checker.check_tls('localhost', options['https_port']), 5))
+    assert result['status'] == 'fail'
+    assert 'CERTIFICATE_VERIFY_FAILED' in result['detail']
+
+def test_watch_emits_json_lines(certificate, capsys):
+    """Test watch mode prints one JSON report per round"""
+    checker = load_checker()
+
+    passed = run_against(certificate, lambda options: checker.watch(0.01, rounds=2, as_json=True, **options))
+    assert passed is True
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    assert all(json.loads(line)['ok'] for line in lines)
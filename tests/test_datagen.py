@@ -0,0 +1,57 @@
+"""
+Tests for the synthetic data generator
+"""
+import random
+from app import db
+from commands import generate_data_command
+from models.kpi import KPI
+from models.sop import SOP
+from utils.datagen import generate, kpi_rows, sop_rows
+
+def test_rows_are_deterministic():
+    """Test the same seed produces the same rows"""
+    first = list(sop_rows(5, random.Random(1), body_bytes=2048))
+    second = list(sop_rows(5, random.Random(1), body_bytes=2048))
+    assert first == second
+    assert all(len(row['content']) >= 2048 for row in first)
+    assert first[0]['content'].startswith('# ')
+
+def test_kpi_histories():
+    """Test each KPI series has one row per consecutive period"""
+    rows = list(kpi_rows(3, random.Random(1), periods=4))
+    assert len(rows) == 12
+    series = rows[:4]
+    assert len({row['title'] for row in series}) == 1
+    assert all(a['end_date'] == b['start_date'] for a, b in zip(series, series[1:]))
+
+def test_generate_writes_counts(app):
+    """Test generate() inserts the requested rows"""
+    with app.app_context():
+        with db.engine.begin() as connection:
+            written = generate(connection, {'sops': 7, 'kpis': 2}, kpi_periods=3, chunk_size=4)
+        assert written == {'sops': 7, 'kpis': 6}
+        assert SOP.query.count() == 7
+        assert KPI.query.count() == 6
+
+def test_command_refuses_populated_tables(app):
+    """Test generate-data leaves existing data alone without --truncate"""
+    runner = app.test_cli_runner()
+    assert runner.invoke(generate_data_command, ['--scale', '0', '--sops', '3']).exit_code == 0
+    assert runner.invoke(generate_data_command, ['--scale', '0', '--sops', '5']).exit_code == 1
+    with app.app_context():
+        assert SOP.query.count() == 3
+    assert runner.invoke(generate_data_command, ['--scale', '0', '--sops', '5', '--truncate']).exit_code == 0
+    with app.app_context():
+        assert SOP.query.count() == 5
+
+def test_command_writes_snapshot(app, tmp_path):
+    """Test --snapshot builds a standalone SQLite file"""
+    import sqlite3
+    path = tmp_path / 'snapshot.db'
+    result = app.test_cli_runner().invoke(generate_data_command,
+                                          ['--scale', '2', '--kpi-periods', '2', '--snapshot', str(path)])
+    assert result.exit_code == 0
+    connection = sqlite3.connect(path)
+    assert connection.execute('SELECT COUNT(*) FROM kpis').fetchone()[0] == 4
+    assert connection.execute('SELECT COUNT(*) FROM user').fetchone()[0] == 2
+    connection.close()
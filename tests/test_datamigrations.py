@@ -0,0 +1,72 @@
+"""
+Tests for batched, resumable data migrations
+"""
+import pytest
+from sqlalchemy import inspect, text
+from app import db
+from commands import data_migrate_run_command
+from utils.datamigrations import BackfillUserRoles, get_state, run_migration
+
+@pytest.fixture()
+def app(app):
+    with app.app_context():
+        # A legacy table that still has the is_admin flag
+        db.session.execute(text('ALTER TABLE "user" ADD COLUMN is_admin BOOLEAN DEFAULT 0'))
+        for i in range(10):
+            role = 'Contributor' if i == 9 else 'Viewer'
+            db.session.execute(
+                text('INSERT INTO "user" (email, password_hash, role, is_admin) VALUES (:e, :p, :r, :a)'),
+                {'e': f'user{i}@example.com', 'p': 'x', 'r': role, 'a': i % 3 == 0},
+            )
+        db.session.commit()
+    return app
+
+def roles(app):
+    with app.app_context():
+        return [row[0] for row in db.session.execute(text('SELECT role FROM "user" ORDER BY id'))]
+
+def test_dry_run_counts_without_writing(app):
+    """Test a dry run reports pending rows and changes nothing"""
+    with app.app_context():
+        result = run_migration(BackfillUserRoles(), db.engine, dry_run=True)
+    assert result['pending_rows'] == 4
+    assert roles(app).count('Admin') == 0
+
+def test_dry_run_runs_no_ddl(app):
+    """Test a dry run treats a missing checkpoint table as no checkpoint instead of creating it"""
+    with app.app_context():
+        db.session.execute(text('DROP TABLE data_migrations'))
+        db.session.commit()
+        result = run_migration(BackfillUserRoles(), db.engine, dry_run=True)
+        assert (result['pending_rows'], result['last_key']) == (4, None)
+        assert not inspect(db.engine).has_table('data_migrations')
+
+def test_batches_resume_from_checkpoint(app):
+    """Test a stopped run resumes after the last committed batch"""
+    with app.app_context():
+        first = run_migration(BackfillUserRoles(), db.engine, batch_size=2, max_batches=1)
+        assert first['completed'] is False
+        assert first['rows_processed'] == 2
+        with db.engine.connect() as connection:
+            assert get_state(connection, 'backfill-user-roles')['last_key'] == str(first['last_key'])
+        
+        assert run_migration(BackfillUserRoles(), db.engine, dry_run=True)['pending_rows'] == 2
+        second = run_migration(BackfillUserRoles(), db.engine, batch_size=2)
+    assert second['completed'] is True
+    assert second['rows_processed'] == 4
+    assert roles(app) == ['Admin', 'Viewer', 'Viewer', 'Admin', 'Viewer', 'Viewer', 'Admin',
+                          'Viewer', 'Viewer', 'Admin']
+
+def test_completed_migration_is_not_rerun(app):
+    """Test a completed migration is skipped unless restarted"""
+    with app.app_context():
+        run_migration(BackfillUserRoles(), db.engine)
+        db.session.execute(text('UPDATE "user" SET role = \'Viewer\' WHERE id = 1'))
+        db.session.commit()
+        assert run_migration(BackfillUserRoles(), db.engine)['rows_processed'] == 4
+        assert run_migration(BackfillUserRoles(), db.engine, restart=True)['rows_processed'] == 1
+
+def test_cli_rejects_unknown_migration(app):
+    result = app.test_cli_runner().invoke(data_migrate_run_command, ['no-such-migration'])
+    assert result.exit_code != 0
+    assert 'backfill-user-roles' in result.output
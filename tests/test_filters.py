@@ -0,0 +1,101 @@
+"""
+Tests for list filtering, sorting and facets (routes/api/filters.py)
+"""
+from datetime import datetime
+import pytest
+from sqlalchemy import event
+from app import db
+from models.idea import Idea
+from models.kpi import KPI
+from models.project import Project
+from models.sop import SOP
+
+IDEAS = [
+    # title, status, priority, day of January
+    ('Alpha', 'new', 3, 1),
+    ('Bravo', 'new', 1, 2),
+    ('Charlie', 'in_progress', 4, 3),
+    ('Delta', 'in_progress', 2, 4),
+    ('Echo', 'completed', 5, 5),
+    ('Foxtrot', 'archived', 0, 6),
+]
+
+@pytest.fixture()
+def app(app):
+    with app.app_context():
+        project = Project(title='Filtered project', slug='filtered-project')
+        db.session.add(project)
+        for i, (title, status, priority, day) in enumerate(IDEAS):
+            db.session.add(Idea(title=title, status=status, priority=priority,
+                                created_at=datetime(2026, 1, day), project=project if i % 2 else None))
+        db.session.commit()
+    return app
+
+def titles(response):
+    assert response.status_code == 200, response.get_json()
+    body = response.get_json()
+    return [item['title'] for item in (body['items'] if isinstance(body, dict) else body)]
+
+def test_filter_and_sort(app):
+    """Test in/gte filters combine and sort orders by several columns"""
+    client = app.test_client()
+    response = client.get('/api/ideas?status=in:new,in_progress&priority=gte:2&sort=-priority,created_at')
+    assert titles(response) == ['Charlie', 'Alpha', 'Delta']
+    assert titles(client.get('/api/ideas?status=new&sort=priority')) == ['Bravo', 'Alpha']
+    assert titles(client.get('/api/ideas?priority=gt:1&priority=lt:4&sort=created_at')) == ['Alpha', 'Delta']
+
+def test_filter_values_are_typed(app):
+    """Test values are converted to the column type, including null and timestamps"""
+    client = app.test_client()
+    assert titles(client.get('/api/ideas?created_at=gte:2026-01-05&sort=created_at')) == ['Echo', 'Foxtrot']
+    assert titles(client.get('/api/ideas?created_at=2026-01-02T00:00:00')) == ['Bravo']
+    assert titles(client.get('/api/ideas?project_id=null&sort=created_at')) == ['Alpha', 'Charlie', 'Echo']
+    assert titles(client.get('/api/ideas?project_id=ne:null&status=ne:new&sort=created_at')) == ['Delta', 'Foxtrot']
+    assert titles(client.get('/api/projects?is_featured=false')) == ['Filtered project']
+
+def test_facets_come_from_one_grouped_query(app):
+    """Test facet counts follow the filters and cost a single extra query"""
+    statements = []
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        response = app.test_client().get('/api/ideas?priority=gte:1&facets=')
+    assert response.status_code == 200
+    body = response.get_json()
+    assert len(body['items']) == 5
+    assert body['facets']['status'] == [
+        {'value': 'in_progress', 'count': 2}, {'value': 'new', 'count': 2}, {'value': 'completed', 'count': 1}]
+    assert sum(facet['count'] for facet in body['facets']['priority']) == 5
+    assert len(statements) == 2
+    assert 'GROUP BY ideas.status, ideas.priority' in statements[1]
+
+def test_invalid_parameters_are_rejected(app):
+    """Test unknown columns, bad values, sorts and facets return 400 per parameter"""
+    response = app.test_client().get(
+        '/api/ideas?description=x&priority=gte:high&status=in:&sort=title&facets=project_id')
+    assert response.status_code == 400
+    errors = response.get_json()['errors']
+    assert set(errors) == {'description', 'priority', 'status', 'sort', 'facets'}
+    assert errors['description'] == ['Cannot filter on description; expected one of: '
+                                     'status, priority, project_id, created_at']
+    assert errors['priority'] == ["Invalid value 'high'"]
+    assert app.test_client().get('/api/ideas?created_at=lt:null').status_code == 400
+
+def test_filters_apply_with_include(app):
+    """Test filters and sort also apply to lists with included relationships"""
+    client = app.test_client()
+    with app.app_context():
+        db.session.add(Project(title='Featured project', slug='featured-project', is_featured=True))
+        db.session.commit()
+    body = client.get('/api/projects?include=ideas&is_featured=false&facets=').get_json()
+    assert [idea['title'] for idea in body['items'][0]['ideas']] == ['Bravo', 'Delta', 'Foxtrot']
+    assert body['facets'] == {'is_featured': [{'value': False, 'count': 1}]}
+
+@pytest.mark.parametrize('model', (Project, Idea, SOP, KPI), ids=lambda model: model.__name__)
+def test_filter_columns_are_indexed(model):
+    """Test every whitelisted column leads an index, so filters never scan the table"""
+    table = model.__table__
+    leading = {index.columns[0].name for index in table.indexes}
+    leading |= {column.name for column in table.columns if column.unique or column.primary_key}
+    assert set(model.filter_columns) <= leading
+    assert set(model.facet_columns) <= set(model.filter_columns)
@@ -0,0 +1,65 @@
+"""
+Tests for template fragment caching
+"""
+from sqlalchemy import event
+from app import db
+from models.project import Project
+from utils.cache import FragmentCache, table_version
+
+def test_fragment_cache_renders_once_per_key():
+    """Test a fragment is rendered once and then served from cache"""
+    cache = FragmentCache()
+    calls = []
+    render = lambda: calls.append(1) or 'html'
+    
+    assert cache.get_or_render(('grid', 1), render) == 'html'
+    assert cache.get_or_render(('grid', 1), render) == 'html'
+    assert len(calls) == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+def test_fragment_cache_evicts_least_recently_used():
+    """Test the cache is bounded"""
+    cache = FragmentCache(max_entries=2)
+    cache.get_or_render('a', lambda: 'a')
+    cache.get_or_render('b', lambda: 'b')
+    cache.get_or_render('a', lambda: 'a')
+    cache.get_or_render('c', lambda: 'c')
+    
+    assert cache.get_or_render('a', lambda: 'a-rerendered') == 'a'
+    assert cache.get_or_render('b', lambda: 'b-rerendered') == 'b-rerendered'
+
+def test_table_version_changes_on_insert(app):
+    """Test the table version moves when rows are added"""
+    with app.app_context():
+        before = table_version(Project)
+        db.session.add(Project(title='Versioned', slug='versioned', description='Bumps the version'))
+        db.session.commit()
+        assert table_version(Project) != before
+
+def test_project_grid_invalidated_on_change(app, client):
+    """Test the cached project grid picks up new projects"""
+    response = client.get('/projects/')
+    assert response.status_code == 200
+    assert b'Fresh Project' not in response.data
+    
+    with app.app_context():
+        db.session.add(Project(title='Fresh Project', slug='fresh-project', description='Just added'))
+        db.session.commit()
+    
+    response = client.get('/projects/')
+    assert b'Fresh Project' in response.data
+
+def test_static_pages_need_no_fragment_cache(app, client):
+    """Test the home and contact pages render without queries or cached fragments"""
+    statements = []
+    with app.app_context():
+        record = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            for url in ('/', '/contact'):
+                assert client.get(url).status_code == 200
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+    assert statements == []
+    assert app.extensions['fragment_cache'].misses == 0
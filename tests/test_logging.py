@@ -0,0 +1,69 @@
+"""
+Tests for queue-based logging and request ids
+"""
+import json
+import logging
+import queue
+import threading
+from app import create_app
+from config import TestingConfig
+from utils.log import BoundedQueueHandler, JsonFormatter
+
+def _record(msg, *args):
+    return logging.LogRecord('app', logging.INFO, __file__, 1, msg, args, None)
+
+def test_queue_handler_drops_when_full():
+    """Test a full queue drops records instead of blocking the caller"""
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1), policy='drop')
+    handler.handle(_record('first'))
+    handler.handle(_record('second'))
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+
+def test_queue_handler_resolves_message():
+    """Test records are formatted before they leave the calling thread"""
+    handler = BoundedQueueHandler(queue.Queue())
+    handler.handle(_record('hello %s', 'world'))
+    record = handler.queue.get_nowait()
+    assert record.msg == 'hello world'
+    assert record.args is None
+
+def test_json_formatter_includes_request_id():
+    """Test JSON log lines carry the request id"""
+    record = _record('hello')
+    record.request_id = 'abc-123'
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry['message'] == 'hello'
+    assert entry['request_id'] == 'abc-123'
+
+def test_request_id_header():
+    """Test a valid X-Request-ID is echoed and an invalid one replaced"""
+    app = create_app('testing')
+    client = app.test_client()
+    response = client.get('/health', headers={'X-Request-ID': 'abc-123'})
+    assert response.headers['X-Request-ID'] == 'abc-123'
+    response = client.get('/health', headers={'X-Request-ID': 'not valid!'})
+    assert response.headers['X-Request-ID'] != 'not valid!'
+
+def test_init_is_idempotent_per_logger():
+    """Test repeated create_app() calls share one writer thread and handler"""
+    first = create_app('testing').extensions['queue_logging']
+    threads = threading.active_count()
+    app = create_app('testing')
+    assert app.extensions['queue_logging'] is first
+    assert threading.active_count() == threads
+    assert app.logger.handlers.count(first.queue_handler) == 1
+    assert sum(isinstance(handler, BoundedQueueHandler) for handler in app.logger.handlers) == 1
+
+def test_changed_config_replaces_writer(monkeypatch, tmp_path):
+    """Test a different log file swaps the handler instead of adding one"""
+    first = create_app('testing').extensions['queue_logging']
+    monkeypatch.setattr(TestingConfig, 'LOG_FILE', str(tmp_path / 'other.log'))
+    app = create_app('testing')
+    second = app.extensions['queue_logging']
+    assert second is not first
+    assert first.listener is None
+    assert first.queue_handler not in app.logger.handlers
+    app.logger.info('to the new file')
+    second.stop()
+    assert 'to the new file' in (tmp_path / 'other.log').read_text()
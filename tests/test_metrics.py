@@ -0,0 +1,77 @@
+"""
+Tests for the Prometheus /metrics endpoint
+"""
+import itertools
+import threading
+import pytest
+from app import create_app, db
+from config import TestingConfig
+
+@pytest.fixture()
+def metrics_app(monkeypatch):
+    monkeypatch.setattr(TestingConfig, 'METRICS_ENABLED', True)
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+    yield app
+
+def test_metrics_disabled_by_default():
+    """Test /metrics isn't registered unless enabled"""
+    app = create_app('testing')
+    assert 'metrics.metrics' not in app.view_functions
+
+def test_metrics_report_requests_and_models(metrics_app):
+    """Test request latency is labelled by endpoint and DB latency by model"""
+    client = metrics_app.test_client()
+    client.get('/api/projects')
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    body = response.get_data(as_text=True)
+    assert 'http_request_duration_seconds_count{blueprint="app",endpoint="projectsapi",method="GET"}' in body
+    assert 'db_query_duration_seconds_count{model="Project",operation="select"}' in body
+    assert 'fragment_cache_hits_total' in body
+
+def test_metrics_token(metrics_app):
+    """Test scrapes need the bearer token when one is configured"""
+    metrics_app.config['METRICS_TOKEN'] = 'secret'
+    client = metrics_app.test_client()
+    assert client.get('/metrics').status_code == 401
+    response = client.get('/metrics', headers={'Authorization': 'Bearer secret'})
+    assert response.status_code == 200
+
+def test_metrics_require_token(monkeypatch):
+    """Test /metrics isn't registered without a token when one is required"""
+    monkeypatch.setattr(TestingConfig, 'METRICS_ENABLED', True)
+    monkeypatch.setattr(TestingConfig, 'METRICS_REQUIRE_TOKEN', True)
+    assert 'metrics.metrics' not in create_app('testing').view_functions
+    monkeypatch.setattr(TestingConfig, 'METRICS_TOKEN', 'secret')
+    assert 'metrics.metrics' in create_app('testing').view_functions
+
+def test_cache_counter_sync_counts_each_hit_once():
+    """Test concurrent syncs never add the same hits twice or lose hits landing mid-sync"""
+    from utils.metrics import _CacheCounterSync
+
+    class Counter:
+        def __init__(self):
+            self.total = 0
+        def inc(self, amount):
+            self.total += amount
+
+    class MovingCache:
+        """Totals that grow on every read, like a cache hit between two reads"""
+        def __init__(self):
+            self._reads = itertools.count(1)
+        @property
+        def hits(self):
+            return next(self._reads)
+        misses = 0
+
+    metrics = {'cache_hits': Counter(), 'cache_misses': Counter()}
+    sync, cache = _CacheCounterSync(), MovingCache()
+    threads = [threading.Thread(target=lambda: [sync.sync(metrics, cache) for _ in range(200)])
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert metrics['cache_hits'].total == sync.hits == 800
@@ -0,0 +1,72 @@
+"""
+Tests for the Alembic revisions
+"""
+import sqlite3
+import pytest
+from flask_migrate import downgrade, upgrade
+from sqlalchemy import inspect
+from app import create_app, db
+from config import TestingConfig
+from utils.schema import migrations_directory
+
+@pytest.fixture()
+def file_app(tmp_path, monkeypatch):
+    path = tmp_path / 'app.db'
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f'sqlite:///{path}')
+    app = create_app('testing')
+    app.config['DATABASE_PATH'] = str(path)
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+def test_upgrade_creates_schema(file_app):
+    """Test a fresh database gets every table and the role index"""
+    with file_app.app_context():
+        upgrade(directory=migrations_directory(file_app))
+        inspector = inspect(db.engine)
+        assert {'user', 'projects', 'ideas', 'sops', 'kpis', 'data_migrations'} <= set(inspector.get_table_names())
+        assert 'ix_user_role' in {index['name'] for index in inspector.get_indexes('user')}
+        assert {'name': 'ix_projects_title', 'unique': True} in [
+            {'name': index['name'], 'unique': index['unique']} for index in inspector.get_indexes('projects')]
+        for table in ('ideas', 'sops', 'kpis'):
+            assert f'ix_{table}_project_id' in {index['name'] for index in inspector.get_indexes(table)}
+            assert [(fk['constrained_columns'], fk['referred_table']) for fk in inspector.get_foreign_keys(table)] \
+                == [(['project_id'], 'projects')]
+        for table in db.metadata.sorted_tables:
+            assert {index.name for index in table.indexes} <= {index['name'] for index in inspector.get_indexes(table.name)}
+
+def test_upgrade_backfills_legacy_users(file_app):
+    """Test an unstamped pre-role database gains the column, backfill and index"""
+    connection = sqlite3.connect(file_app.config['DATABASE_PATH'])
+    connection.execute('CREATE TABLE "user" (id INTEGER PRIMARY KEY, email VARCHAR(120) NOT NULL UNIQUE, '
+                       'password_hash VARCHAR(128) NOT NULL, is_admin BOOLEAN, '
+                       'created_at DATETIME, updated_at DATETIME)')
+    connection.executemany('INSERT INTO "user" (email, password_hash, is_admin) VALUES (?, ?, ?)',
+                           [(f'user{i}@example.com', 'x', i % 5 == 0) for i in range(50)])
+    connection.commit()
+    connection.close()
+    
+    with file_app.app_context():
+        upgrade(directory=migrations_directory(file_app))
+        inspector = inspect(db.engine)
+        assert 'ix_user_role' in {index['name'] for index in inspector.get_indexes('user')}
+        roles = dict(db.session.execute(db.text('SELECT role, COUNT(*) FROM "user" GROUP BY role')).all())
+        assert roles == {'Admin': 10, 'Viewer': 40}
+        
+        downgrade(directory=migrations_directory(file_app), revision='8b1f3c2d9a47')
+        assert 'ix_user_role' not in {index['name'] for index in inspect(db.engine).get_indexes('user')}
+        assert 'project_id' not in {column['name'] for column in inspect(db.engine).get_columns('ideas')}
+
+def test_unique_title_upgrade_reports_duplicates(file_app):
+    """Test the title index is not built over duplicate titles"""
+    with file_app.app_context():
+        directory = migrations_directory(file_app)
+        upgrade(directory=directory, revision='c4e7a9152f3b')
+        for slug in ('first', 'second'):
+            db.session.execute(db.text("INSERT INTO projects (title, slug) VALUES ('Same', :slug)"), {'slug': slug})
+        db.session.commit()
+        
+        # Flask-Migrate logs the error and exits
+        with pytest.raises(SystemExit):
+            upgrade(directory=directory)
+        assert 'ix_projects_title' not in {index['name'] for index in inspect(db.engine).get_indexes('projects')}
@@ -1,6 +1,8 @@
 import pytest
 from models.project import Project
 
+pytestmark = pytest.mark.usefixtures('sample_data')
+
 def test_new_project(app):
     """Test creating a new project"""
     with app.app_context():
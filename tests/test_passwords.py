@@ -0,0 +1,19 @@
+"""
+Tests for parallel password hashing
+"""
+from werkzeug.security import check_password_hash
+from utils.passwords import MIN_PARALLEL, hash_passwords
+
+def test_hashes_in_process():
+    """Test small batches are hashed in order without a pool"""
+    passwords = ['first', 'second', 'third']
+    hashes = hash_passwords(passwords, workers=4)
+    assert [check_password_hash(h, p) for h, p in zip(hashes, passwords)] == [True] * 3
+
+def test_pool_preserves_order():
+    """Test pooled hashing returns hashes in input order"""
+    passwords = [f'password-{i}' for i in range(MIN_PARALLEL)]
+    hashes = hash_passwords(passwords, workers=2)
+    assert len(hashes) == len(passwords)
+    assert all(check_password_hash(h, p) for h, p in zip(hashes, passwords))
+    assert not check_password_hash(hashes[0], passwords[1])
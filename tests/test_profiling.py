@@ -0,0 +1,95 @@
+"""
+Tests for the sampling profiler and per-request profiles
+"""
+import sys
+import threading
+import time
+import pytest
+from app import create_app, db
+from config import TestingConfig
+from models.user import User, RoleEnum
+from utils.profiling import SamplingProfiler, make_profile_token
+
+@pytest.fixture()
+def profiling_app(monkeypatch, tmp_path):
+    monkeypatch.setattr(TestingConfig, 'PROFILING_ENABLED', True)
+    monkeypatch.setattr(TestingConfig, 'PROFILING_OUTPUT_DIR', str(tmp_path))
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(email='admin@example.com', password_hash='x', role=RoleEnum.ADMIN.value))
+        db.session.add(User(email='viewer@example.com', password_hash='x', role=RoleEnum.VIEWER.value))
+        db.session.commit()
+    yield app
+
+def _login(client, email):
+    with client.application.app_context():
+        user_id = User.query.filter_by(email=email).first().id
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+
+def _busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+def test_sampling_profiler_collapses_stacks():
+    """Test samples of another thread show up as collapsed stacks"""
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_loop, args=(stop,))
+    worker.start()
+    try:
+        stacks = SamplingProfiler(interval=0.001).sample_for(0.2)
+    finally:
+        stop.set()
+        worker.join()
+    assert any(stack.endswith('test_profiling.py:_busy_loop') for stack in stacks)
+
+def test_signed_header_profiles_request(profiling_app, tmp_path):
+    """Test a valid X-Profile header writes cProfile stats; a forged one doesn't"""
+    client = profiling_app.test_client()
+    response = client.get('/health', headers={'X-Profile': make_profile_token(profiling_app)})
+    profile_id = response.headers['X-Profile-Id']
+    assert (tmp_path / f'{profile_id}.prof').exists()
+    
+    response = client.get('/health', headers={'X-Profile': 'forged'})
+    assert 'X-Profile-Id' not in response.headers
+
+def test_request_profile_stops_when_view_raises(profiling_app, tmp_path):
+    """Test a request that raises still disables the profiler and writes its stats"""
+    @profiling_app.route('/boom')
+    def boom():
+        raise RuntimeError('boom')
+
+    client = profiling_app.test_client()
+    with pytest.raises(RuntimeError):
+        client.get('/boom', headers={'X-Profile': make_profile_token(profiling_app)})
+    assert sys.getprofile() is None
+    assert len(list(tmp_path.glob('*.prof'))) == 1
+
+def test_sample_endpoint_is_admin_only(profiling_app):
+    """Test only admins can start a sample"""
+    client = profiling_app.test_client()
+    assert client.post('/debug/profile').status_code == 302
+    _login(client, 'viewer@example.com')
+    assert client.post('/debug/profile').status_code == 403
+
+def test_sample_endpoint_returns_collapsed_stacks(profiling_app):
+    """Test a background sample can be fetched once finished"""
+    client = profiling_app.test_client()
+    _login(client, 'admin@example.com')
+    response = client.post('/debug/profile?seconds=0.1&interval_ms=1')
+    assert response.status_code == 202
+    result_url = response.get_json()['result']
+    
+    for _ in range(50):
+        response = client.get(result_url)
+        if response.status_code == 200:
+            break
+        time.sleep(0.05)
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain')
+
+def test_profiling_disabled_by_default():
+    """Test the endpoints don't exist unless enabled"""
+    app = create_app('testing')
+    assert 'profiling.start_sample' not in app.view_functions
@@ -0,0 +1,96 @@
+"""
+Tests for the /ready probe
+"""
+import threading
+import time
+import pytest
+
+@pytest.fixture()
+def ready_app(app, tmp_path):
+    app.config['UPLOAD_FOLDER'] = str(tmp_path / 'uploads')
+    app.config['READINESS_MIN_FREE_MB'] = 0
+    return app
+
+def test_ready_reports_each_check(ready_app):
+    """Test /ready passes and reports latency for every dependency"""
+    response = ready_app.test_client().get('/ready')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data['status'] == 'ready'
+    assert set(data['checks']) == {'pool', 'database', 'uploads', 'logs', 'cache', 'schema'}
+    assert all('latency_ms' in check for check in data['checks'].values())
+
+def test_ready_fails_on_unwritable_uploads(ready_app, tmp_path):
+    """Test a broken upload folder takes the worker out of rotation"""
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('')
+    ready_app.config['UPLOAD_FOLDER'] = str(blocker)
+    response = ready_app.test_client().get('/ready')
+    assert response.status_code == 503
+    assert response.get_json()['checks']['uploads']['ok'] is False
+
+def test_ready_results_are_cached(ready_app, tmp_path):
+    """Test probes within the cache window don't rerun the checks"""
+    client = ready_app.test_client()
+    assert client.get('/ready').status_code == 200
+    blocker = tmp_path / 'not-a-dir'
+    blocker.write_text('')
+    ready_app.config['UPLOAD_FOLDER'] = str(blocker)
+    response = client.get('/ready')
+    assert response.status_code == 200
+    
+    ready_app.config['READINESS_CACHE_SECONDS'] = 0
+    assert client.get('/ready').status_code == 503
+
+def test_pending_migrations_do_not_fail_readiness(ready_app):
+    """Test a schema behind the migrations is reported but keeps the worker in rotation"""
+    ready_app.extensions['schema_status'] = {'up_to_date': False}
+    response = ready_app.test_client().get('/ready')
+    assert response.status_code == 200
+    assert response.get_json()['checks']['schema']['detail'] == 'migrations pending'
+
+def test_slow_database_fails_within_timeout(ready_app):
+    """Test a database that doesn't answer fails the probe after READINESS_DB_TIMEOUT"""
+    from sqlalchemy import event
+    from app import db
+
+    def stall(*args):
+        time.sleep(0.5)
+
+    ready_app.config['READINESS_DB_TIMEOUT'] = 0.05
+    with ready_app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', stall)
+        try:
+            start = time.perf_counter()
+            response = ready_app.test_client().get('/ready')
+            elapsed = time.perf_counter() - start
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', stall)
+            time.sleep(0.5)  # Let the abandoned probe finish with the connection
+    assert response.status_code == 503
+    assert response.get_json()['checks']['database']['detail'] == 'no reply within 0.05s'
+    assert elapsed < 0.5
+
+def test_concurrent_probes_get_last_result_while_refreshing(ready_app, monkeypatch):
+    """Test probes arriving during a refresh don't wait for the checks"""
+    from utils import readiness
+
+    cache = readiness.ReadinessCache()
+    with ready_app.app_context():
+        cache.get(ready_app, 0)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_checks(app):
+        started.set()
+        release.wait(5)
+        return False, {}
+
+    monkeypatch.setattr(readiness, 'run_checks', slow_checks)
+    refresh = threading.Thread(target=cache.get, args=(ready_app, 0))
+    refresh.start()
+    started.wait(5)
+    ready, results, age = cache.get(ready_app, 0)
+    release.set()
+    refresh.join()
+    assert ready is True and 'database' in results
+    assert cache.get(ready_app, 60)[0] is False
@@ -0,0 +1,95 @@
+"""
+Tests for project relationships and ?include= eager loading
+"""
+import contextlib
+import pytest
+from sqlalchemy import event
+from app import db
+from models.idea import Idea
+from models.kpi import KPI
+from models.project import Project
+from models.sop import SOP
+
+INCLUDE_ALL = 'include=ideas,sops,kpis'
+
+def add_projects(count, start=0):
+    """Projects with two ideas, one SOP and one KPI each"""
+    for i in range(start, start + count):
+        project = Project(title=f'Project {i}', slug=f'project-{i}')
+        project.ideas = [Idea(title=f'Idea {i}a'), Idea(title=f'Idea {i}b')]
+        project.sops = [SOP(title=f'SOP {i}')]
+        project.kpis = [KPI(title=f'KPI {i}', target_value=10, current_value=5)]
+        db.session.add(project)
+    db.session.commit()
+
+@pytest.fixture()
+def app(app):
+    with app.app_context():
+        add_projects(3)
+    return app
+
+@contextlib.contextmanager
+def count_queries():
+    statements = []
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+def test_include_embeds_related_items(app):
+    """Test ?include= adds each collection, serialized like its own endpoint"""
+    client = app.test_client()
+    project = client.get(f'/api/projects/1?{INCLUDE_ALL}').get_json()
+    assert [idea['title'] for idea in project['ideas']] == ['Idea 0a', 'Idea 0b']
+    assert project['kpis'][0]['progress_percentage'] == 50
+    assert project['sops'] == [client.get(f"/api/sops/{project['sops'][0]['id']}").get_json()]
+    assert 'ideas' not in client.get('/api/projects/1').get_json()
+
+def test_include_query_count_is_constant(app):
+    """Test the list with every include costs the same queries for 3 or 30 projects"""
+    client = app.test_client()
+    with app.app_context():
+        with count_queries() as few:
+            response = client.get(f'/api/projects?{INCLUDE_ALL}')
+        assert len(response.get_json()) == 3
+
+        add_projects(27, start=3)
+        with count_queries() as many:
+            response = client.get(f'/api/projects?{INCLUDE_ALL}')
+        assert len(response.get_json()) == 30
+        assert sum(len(project['ideas']) for project in response.get_json()) == 60
+
+    # The projects, then one SELECT ... IN per relationship
+    assert len(few) == len(many) == 4
+
+def test_unknown_include_is_rejected(app):
+    """Test an include that is not a relationship returns the usual 400 shape"""
+    response = app.test_client().get('/api/projects?include=ideas,owner')
+    assert response.status_code == 400
+    assert response.get_json() == {
+        'errors': {'include': ['Cannot include owner; expected one of: ideas, kpis, sops']}}
+    assert app.test_client().get('/api/ideas?include=project').status_code == 400
+
+def test_project_id_must_exist(app):
+    """Test items can be linked to existing projects only"""
+    client = app.test_client()
+    idea = {'title': 'Linked idea', 'description': 'An idea that belongs to a project'}
+    response = client.post('/api/ideas', json={**idea, 'project_id': 99})
+    assert response.status_code == 400
+    assert response.get_json() == {'errors': {'project_id': ['Project 99 does not exist']}}
+
+    response = client.post('/api/ideas', json={**idea, 'project_id': 2})
+    assert response.status_code == 201
+    assert response.get_json()['project_id'] == 2
+    assert len(client.get(f'/api/projects/2?include=ideas').get_json()['ideas']) == 3
+
+def test_deleting_project_unlinks_items(app):
+    """Test a project's items survive its deletion without a project"""
+    client = app.test_client()
+    assert client.delete('/api/projects/1').status_code == 204
+    with app.app_context():
+        assert Idea.query.count() == 6
+        assert Idea.query.filter_by(project_id=None).count() == 2
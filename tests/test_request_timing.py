@@ -0,0 +1,67 @@
+"""
+Tests for request timing and query budgets
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from app import db
+from models.project import Project
+from utils.timing import QueryBudgetExceeded, query_budget
+
+@pytest.fixture()
+def timed_app(app):
+    @app.route('/_queries/<int:n>')
+    def run_queries(n):
+        for _ in range(n):
+            Project.query.count()
+        return 'ok'
+    
+    @app.route('/_failing_query')
+    def run_failing_query():
+        with pytest.raises(OperationalError):
+            db.session.execute(text('SELECT * FROM no_such_table'))
+        db.session.rollback()
+        Project.query.count()
+        return str(len(db.session.connection().info))
+
+    @app.route('/_queries_allowed/<int:n>')
+    @query_budget(100)
+    def run_allowed_queries(n):
+        return run_queries(n)
+    
+    return app
+
+def test_server_timing_header(timed_app):
+    """Test responses report app and DB time with the query count"""
+    response = timed_app.test_client().get('/_queries/3')
+    header = response.headers['Server-Timing']
+    assert 'app;dur=' in header
+    assert 'db;dur=' in header
+    assert 'desc="3 queries"' in header
+
+def test_stats_aggregate_per_endpoint(timed_app):
+    """Test timings are collected into a per-endpoint histogram"""
+    client = timed_app.test_client()
+    client.get('/_queries/1')
+    client.get('/_queries/2')
+    stats = timed_app.extensions['request_timing'].snapshot()['run_queries']
+    assert stats['count'] == 2
+    assert stats['max_queries'] == 2
+    assert stats['bytes'] == 4
+    assert sum(stats['histogram'].values()) == 2
+
+def test_query_budget_fails_tests(timed_app):
+    """Test a route over QUERY_BUDGET raises under TESTING"""
+    with pytest.raises(QueryBudgetExceeded):
+        timed_app.test_client().get('/_queries/%d' % (timed_app.config['QUERY_BUDGET'] + 1))
+
+def test_query_budget_override(timed_app):
+    """Test a view can raise its own budget"""
+    response = timed_app.test_client().get('/_queries_allowed/%d' % (timed_app.config['QUERY_BUDGET'] + 1))
+    assert response.status_code == 200
+
+def test_failed_query_leaves_no_timing_state(timed_app):
+    """Test a statement that raises is not counted and leaves nothing on the connection"""
+    response = timed_app.test_client().get('/_failing_query')
+    assert response.get_data(as_text=True) == '0'
+    assert 'desc="1 queries"' in response.headers['Server-Timing']
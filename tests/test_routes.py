@@ -1,3 +1,7 @@
+import pytest
+
+pytestmark = pytest.mark.usefixtures('sample_data')
+
 def test_home_page(client):
     """Test the home page loads successfully"""
     response = client.get('/')
@@ -0,0 +1,64 @@
+"""
+Tests for the column-tuple list path (models/rows.py and ApiSchema.serialize_many)
+"""
+import pytest
+from sqlalchemy import event
+from app import db
+from models.idea import Idea
+from models.kpi import KPI
+from models.project import Project
+from models.sop import SOP
+from models.user import User
+from schemas.idea import idea_schema
+from schemas.kpi import kpi_schema
+from schemas.project import project_schema
+from schemas.sop import sop_schema
+from schemas.user import user_schema
+from utils.datagen import generate
+
+SCHEMAS = {Project: project_schema, Idea: idea_schema, SOP: sop_schema, KPI: kpi_schema, User: user_schema}
+
+@pytest.fixture()
+def app(app):
+    with app.app_context():
+        with db.engine.begin() as connection:
+            generate(connection, {'users': 5, 'projects': 5, 'ideas': 5, 'sops': 5, 'kpis': 2},
+                     kpi_periods=3, sop_bytes=256, password_hash='x')
+        # A KPI with missing values exercises the None handling
+        db.session.add(KPI(title='Empty KPI', current_value=None))
+        db.session.commit()
+    return app
+
+@pytest.mark.parametrize('model', SCHEMAS, ids=lambda model: model.__name__)
+def test_rows_match_serialize(app, model):
+    """Test serializing row_select() rows gives exactly what serialize() does"""
+    with app.app_context():
+        expected = [obj.serialize() for obj in model.query.order_by(model.id)]
+        db.session.expunge_all()
+        rows = db.session.execute(model.row_select().order_by(model.id))
+        assert SCHEMAS[model].serialize_many(rows) == expected
+
+def test_rows_skip_orm_instances(app):
+    """Test the row path leaves nothing in the identity map"""
+    with app.app_context():
+        rows = db.session.execute(Idea.row_select().where(Idea.status == 'new').limit(2))
+        assert all(row['status'] == 'new' for row in idea_schema.serialize_many(rows))
+        assert len(db.session.identity_map) == 0
+
+def test_user_rows_never_select_password(app):
+    """Test the user row path does not read password hashes"""
+    statements = []
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: statements.append(statement))
+        rows = db.session.execute(User.row_select()).all()
+    assert 'password_hash' not in statements[0]
+    assert 'password_hash' not in rows[0]._fields
+
+def test_list_endpoint_uses_rows(app):
+    """Test GET /api/kpis returns serialize()-identical items"""
+    client = app.test_client()
+    with app.app_context():
+        expected = {kpi.id: kpi.serialize() for kpi in KPI.query}
+    data = client.get('/api/kpis').get_json()
+    assert {item['id']: item for item in data} == expected
@@ -0,0 +1,32 @@
+"""
+Tests for the startup schema check
+"""
+import pytest
+from sqlalchemy import inspect
+from app import create_app, db
+from utils.schema import check_schema_version, create_schema
+
+def test_startup_does_not_create_tables():
+    """Test building the app runs no DDL"""
+    app = create_app('testing')
+    app.config['SCHEMA_CHECK_ON_STARTUP'] = True
+    check_schema_version(app)
+    with app.app_context():
+        assert not inspect(db.engine).has_table('projects')
+    assert app.extensions['schema_status']['up_to_date'] is not True
+
+def test_auto_create_schema_when_enabled():
+    """Test development mode still creates missing tables"""
+    app = create_app('testing')
+    app.config['AUTO_CREATE_SCHEMA'] = True
+    check_schema_version(app)
+    with app.app_context():
+        assert inspect(db.engine).has_table('projects')
+
+def test_create_schema_creates_tables():
+    """Test the explicit init-db path creates every table"""
+    app = create_app('testing')
+    with app.app_context():
+        create_schema(app)
+        tables = inspect(db.engine).get_table_names()
+    assert {'projects', 'ideas', 'sops', 'kpis', 'user'} <= set(tables)
@@ -0,0 +1,129 @@
+"""
+Tests for the shared API schemas and uniqueness handling
+"""
+import pytest
+from sqlalchemy import event
+from app import db
+from models.idea import Idea
+from models.kpi import KPI
+from models.project import Project
+from models.sop import SOP
+from schemas.idea import idea_schema
+from schemas.kpi import kpi_schema
+from schemas.project import project_schema
+from schemas.sop import sop_schema
+
+PROJECT = {
+    'title': 'Schema Project',
+    'slug': 'schema-project',
+    'description': 'A project for the schema tests',
+    'github_url': 'https://github.com/example/schema',
+}
+
+def test_create_project(app):
+    """Test POST validates through the shared schema and returns 201"""
+    response = app.test_client().post('/api/projects', json=PROJECT)
+    assert response.status_code == 201
+    assert response.get_json()['title'] == 'Schema Project'
+    with app.app_context():
+        assert Project.query.count() == 1
+
+def test_duplicate_title_uses_unique_index(app):
+    """Test a duplicate title is rejected by the index without a lookup query"""
+    client = app.test_client()
+    client.post('/api/projects', json=PROJECT)
+
+    statements = []
+    with app.app_context():
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            response = client.post('/api/projects', json=dict(PROJECT, slug='other-slug'))
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+    assert response.status_code == 400
+    assert response.get_json() == {'errors': {'title': ['Project with title "Schema Project" already exists']}}
+    assert not any(statement.lstrip().startswith('SELECT') for statement in statements)
+
+def test_update_conflict_and_partial_update(app):
+    """Test PUT applies partial data and reports unique conflicts"""
+    client = app.test_client()
+    client.post('/api/projects', json=PROJECT)
+    second = client.post('/api/projects', json=dict(PROJECT, title='Second Project', slug='second')).get_json()
+
+    response = client.put(f"/api/projects/{second['id']}", json={'title': 'Schema Project'})
+    assert response.status_code == 400
+    assert 'title' in response.get_json()['errors']
+
+    response = client.put(f"/api/projects/{second['id']}", json={'description': 'A new description here'})
+    assert response.status_code == 200
+    assert response.get_json()['title'] == 'Second Project'
+
+def test_schema_ignores_read_only_fields():
+    """Test id and timestamps are not taken from request data"""
+    data = project_schema.load(dict(PROJECT, id=99, created_at='2020-01-01T00:00:00'), partial=True,
+                               unknown='exclude')
+    assert 'id' not in data and 'created_at' not in data
+
+VALID = {
+    'ideas': {'title': 'New idea', 'description': 'An idea worth testing', 'status': 'new', 'priority': 2},
+    'sops': {'title': 'Backups', 'content': '1. Stop the service\n2. Copy the data', 'category': 'Ops'},
+    'kpis': {'title': 'Uptime', 'description': 'Monthly availability', 'target_value': 99.9,
+             'current_value': 99.5, 'unit': '%', 'start_date': '2026-01-01', 'end_date': '2026-12-31'},
+}
+
+@pytest.mark.parametrize('resource', sorted(VALID))
+def test_crud_through_schemas(app, resource):
+    """Test every resource creates, partially updates and deletes via its schema"""
+    client = app.test_client()
+    created = client.post(f'/api/{resource}', json=VALID[resource])
+    assert created.status_code == 201, created.get_json()
+    url = f"/api/{resource}/{created.get_json()['id']}"
+
+    updated = client.put(url, json={'title': 'Renamed'})
+    assert updated.status_code == 200
+    assert updated.get_json()['title'] == 'Renamed'
+    assert client.get(url).get_json() == updated.get_json()
+
+    assert client.delete(url).status_code == 204
+    assert client.get(url).status_code == 404
+    assert client.put(url, json={'title': 'Gone'}).status_code == 404
+
+def test_optional_fields_take_model_defaults(app):
+    """Test only titles are required, as before the schemas; omitted fields get the model defaults"""
+    client = app.test_client()
+    idea = client.post('/api/ideas', json={'title': 'Bare idea'}).get_json()
+    assert (idea['description'], idea['status'], idea['priority']) == (None, 'new', 0)
+    sop = client.post('/api/sops', json={'title': 'Bare SOP'}).get_json()
+    assert (sop['content'], sop['version']) == (None, '1.0')
+    kpi = client.post('/api/kpis', json={'title': 'Bare KPI'}).get_json()
+    assert (kpi['target_value'], kpi['current_value'], kpi['progress_percentage']) == (None, 0, 0)
+
+@pytest.mark.parametrize('resource, body, field', [
+    ('ideas', {'title': 'No', 'description': 'Too short a title'}, 'title'),
+    ('ideas', dict(VALID['ideas'], status='someday'), 'status'),
+    ('sops', dict(VALID['sops'], version='1.0.0-beta.1'), 'version'),
+    ('kpis', dict(VALID['kpis'], end_date='2025-01-01'), 'end_date'),
+    ('kpis', dict(VALID['kpis'], target_value='lots'), 'target_value'),
+    ('projects', 'not an object', '_schema'),
+])
+def test_shared_error_format(app, resource, body, field):
+    """Test invalid input gets the same 400 error shape on every resource"""
+    response = app.test_client().post(f'/api/{resource}', json=body)
+    assert response.status_code == 400
+    assert field in response.get_json()['errors']
+
+def test_serialize_matches_dump_and_model(app):
+    """Test the compiled serializer matches schema.dump() and Model.serialize()"""
+    client = app.test_client()
+    for resource in VALID:
+        client.post(f'/api/{resource}', json=VALID[resource])
+    client.post('/api/projects', json=PROJECT)
+
+    with app.app_context():
+        for model, schema in ((Project, project_schema), (Idea, idea_schema), (KPI, kpi_schema), (SOP, sop_schema)):
+            obj = model.query.one()
+            assert schema.serialize(obj) == schema.dump(obj) == obj.serialize()
+            row = db.session.execute(db.select(*model.__table__.columns)).one()
+            assert schema.serialize(row) == obj.serialize()
@@ -0,0 +1,129 @@
+"""
+Tests for the seed command
+"""
+import json
+from sqlalchemy import event
+from app import db
+from commands import seed_command
+from models.idea import Idea
+from models.project import Project
+from models.user import User
+
+def seed_counts(app):
+    with open(f'{app.root_path}/scripts/seed-data.json') as f:
+        data = json.load(f)
+    return {name: len(records) for name, records in data.items()}
+
+def test_reset_empties_and_reseeds(app):
+    """Test reset mode leaves exactly the seed data behind"""
+    runner = app.test_cli_runner()
+    with app.app_context():
+        db.session.add(Idea(title='Stale idea'))
+        db.session.commit()
+    
+    result = runner.invoke(seed_command, ['--mode', 'reset'])
+    assert result.exit_code == 0
+    counts = seed_counts(app)
+    with app.app_context():
+        assert User.query.count() == counts['users']
+        assert Idea.query.count() == counts['ideas']
+        assert Idea.query.filter_by(title='Stale idea').first() is None
+        user = User.query.first()
+        assert user.created_at is not None
+        assert user.password_hash.startswith(('pbkdf2', 'scrypt'))
+
+def test_incremental_only_adds_missing(app):
+    """Test incremental mode skips existing keys and adds the rest"""
+    runner = app.test_cli_runner()
+    runner.invoke(seed_command, ['--mode', 'reset'])
+    with app.app_context():
+        db.session.delete(Project.query.first())
+        db.session.commit()
+    
+    runner.invoke(seed_command, ['--mode', 'incremental'])
+    counts = seed_counts(app)
+    with app.app_context():
+        assert Project.query.count() == counts['projects']
+        assert User.query.count() == counts['users']
+
+def test_incremental_prefetches_keys(app):
+    """Test incremental mode runs one lookup per table, not one per record"""
+    runner = app.test_cli_runner()
+    runner.invoke(seed_command, ['--mode', 'reset'])
+    
+    selects = []
+    with app.app_context():
+        engine = db.engine
+    
+    def count_selects(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            selects.append(statement)
+    
+    event.listen(engine, 'before_cursor_execute', count_selects)
+    try:
+        runner.invoke(seed_command, ['--mode', 'incremental'])
+    finally:
+        event.remove(engine, 'before_cursor_execute', count_selects)
+    assert len(selects) == 5
+
+def load_seed_script():
+    import importlib.util
+    import os
+    path = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'seed.py')
+    spec = importlib.util.spec_from_file_location('seed_script', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def test_seed_script_loads_in_process(tmp_path):
+    """Test scripts/seed.py loads the database without the sqlite3 CLI"""
+    import sqlite3
+    from werkzeug.security import check_password_hash
+    seed_script = load_seed_script()
+    path = str(tmp_path / 'seed.db')
+    seed_script.run_seed(mode='reset', hash_workers=1, database=path)
+    
+    connection = sqlite3.connect(path)
+    email, password_hash = connection.execute('SELECT email, password_hash FROM "user" LIMIT 1').fetchone()
+    data = seed_script.load_seed_data()
+    password = next(user['password'] for user in data['users'] if user['email'] == email)
+    assert check_password_hash(password_hash, password)
+    assert connection.execute('SELECT COUNT(*) FROM kpis').fetchone()[0] == len(data['kpis'])
+    connection.close()
+
+def test_seed_script_streams_sql(tmp_path):
+    """Test --output writes SQL that recreates the same data"""
+    import sqlite3
+    seed_script = load_seed_script()
+    output = tmp_path / 'seed.sql'
+    seed_script.run_seed(mode='reset', hash_workers=1, output=str(output))
+    
+    connection = sqlite3.connect(':memory:')
+    connection.executescript(output.read_text())
+    data = seed_script.load_seed_data()
+    assert connection.execute('SELECT COUNT(*) FROM projects').fetchone()[0] == len(data['projects'])
+
+def test_seed_script_reset_matches_models(tmp_path):
+    """Test a reset database has the models' schema and is stamped at the migration head"""
+    import sqlite3
+    from sqlalchemy import create_engine, inspect
+    seed_script = load_seed_script()
+    path = str(tmp_path / 'seed.db')
+    connection = sqlite3.connect(path)
+    connection.execute('CREATE TABLE ideas (id INTEGER PRIMARY KEY, title TEXT)')
+    connection.execute("CREATE TABLE alembic_version (version_num VARCHAR(32))")
+    connection.execute("INSERT INTO alembic_version VALUES ('8b1f3c2d9a47')")
+    connection.commit()
+    connection.close()
+    seed_script.run_seed(mode='reset', hash_workers=1, database=path)
+
+    engine = create_engine(f'sqlite:///{path}')
+    with engine.connect() as connection:
+        rows = connection.execute(Idea.row_select()).all()
+        assert len(rows) == len(seed_script.load_seed_data()['ideas'])
+        assert all(row.created_at is not None for row in rows)
+        stamp = connection.exec_driver_sql('SELECT version_num FROM alembic_version').scalars().all()
+        assert stamp == [seed_script.migration_head()]
+    indexes = {index['name'] for index in inspect(engine).get_indexes('ideas')}
+    assert {index.name for index in Idea.__table__.indexes} <= indexes
+    engine.dispose()
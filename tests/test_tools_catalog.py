@@ -0,0 +1,64 @@
+"""
+Tests for the tools catalog and its API filters
+"""
+import json
+import os
+import pytest
+from utils.catalog import ToolCatalog
+
+CATALOG = {
+    'alpha': {'name': 'Alpha', 'category': 'CLI Utility', 'status': 'Active',
+              'description': 'First tool', 'download_link': '/downloads/alpha.zip'},
+    'beta': {'name': 'Beta', 'category': 'CLI Utility', 'status': 'Beta',
+             'description': 'Second tool'},
+    'gamma': {'name': 'Gamma', 'category': 'Dev Tool', 'status': 'Active',
+              'description': 'Third tool'},
+}
+
+@pytest.fixture()
+def catalog_path(tmp_path):
+    path = tmp_path / 'projects.json'
+    path.write_text(json.dumps(CATALOG))
+    return path
+
+def test_catalog_indexes_by_id(catalog_path):
+    """Test tools are looked up by id"""
+    snapshot = ToolCatalog(str(catalog_path)).snapshot()
+    assert snapshot.get('alpha')['name'] == 'Alpha'
+    assert snapshot.get('alpha')['download'] == 'alpha.zip'
+    assert snapshot.get('missing') is None
+
+def test_catalog_is_immutable(catalog_path):
+    """Test snapshot records can't be mutated by callers"""
+    snapshot = ToolCatalog(str(catalog_path)).snapshot()
+    with pytest.raises(TypeError):
+        snapshot.get('alpha')['name'] = 'Changed'
+
+def test_catalog_filters_by_facets(catalog_path):
+    """Test category/status filters combine and ignore case"""
+    snapshot = ToolCatalog(str(catalog_path)).snapshot()
+    assert [t['id'] for t in snapshot.filter(category='cli utility')] == ['alpha', 'beta']
+    assert [t['id'] for t in snapshot.filter(category='CLI Utility', status='active')] == ['alpha']
+    assert snapshot.filter(status='Retired') == ()
+    assert len(snapshot.filter()) == 3
+
+def test_catalog_reloads_on_mtime_change(catalog_path):
+    """Test edits to the file are picked up without a restart"""
+    catalog = ToolCatalog(str(catalog_path))
+    first = catalog.snapshot()
+    assert catalog.snapshot() is first
+    
+    updated = dict(CATALOG, delta={'name': 'Delta', 'category': 'Dev Tool'})
+    catalog_path.write_text(json.dumps(updated))
+    stat = os.stat(catalog_path)
+    os.utime(catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    
+    assert catalog.snapshot().get('delta')['name'] == 'Delta'
+
+def test_api_filters_tools(client):
+    """Test the tools API filters by status"""
+    response = client.get('/tools/api/tools?status=Beta')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data
+    assert all(tool['status'] == 'Beta' for tool in data)
@@ -0,0 +1,88 @@
+"""
+Tests for the admin-only users API
+"""
+import pytest
+from sqlalchemy import event
+from app import db
+from models.user import RoleEnum, User
+
+@pytest.fixture()
+def app(app):
+    with app.app_context():
+        for email, role in (('admin@example.com', RoleEnum.ADMIN.value),
+                            ('viewer@example.com', RoleEnum.VIEWER.value)):
+            user = User(email=email, role=role)
+            user.set_password('correct horse')
+            db.session.add(user)
+        db.session.commit()
+    return app
+
+def login(app, email):
+    client = app.test_client()
+    with app.app_context():
+        user_id = User.query.filter_by(email=email).first().id
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user_id)
+    return client
+
+def test_users_api_is_admin_only(app):
+    """Test anonymous users and non-admins get 403 on every method"""
+    for client in (app.test_client(), login(app, 'viewer@example.com')):
+        assert client.get('/api/users').status_code == 403
+        assert client.post('/api/users', json={'email': 'x@example.com', 'password': 'long enough'}).status_code == 403
+        assert client.put('/api/users/1', json={'role': 'Admin'}).status_code == 403
+        assert client.delete('/api/users/1').status_code == 403
+
+def test_list_never_reads_password_hash(app):
+    """Test the list comes from the row select and leaves out the hash"""
+    client = login(app, 'admin@example.com')
+    statements = []
+    with app.app_context():
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            response = client.get('/api/users')
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+        expected = [user.serialize() for user in User.query.order_by(User.id)]
+    assert response.status_code == 200
+    assert response.get_json() == expected
+    assert not any('password' in item for item in response.get_json())
+    assert 'password_hash' not in statements[-1]
+
+def test_users_crud(app):
+    """Test admins create, update and delete users through the shared schema"""
+    client = login(app, 'admin@example.com')
+    response = client.post('/api/users', json={'email': 'new@example.com', 'password': 'a new password',
+                                               'role': RoleEnum.CONTRIBUTOR.value})
+    assert response.status_code == 201
+    created = response.get_json()
+    assert created['role'] == 'Contributor' and 'password' not in created
+    url = f"/api/users/{created['id']}"
+
+    assert client.put(url, json={'password': 'changed password'}).status_code == 200
+    with app.app_context():
+        user = db.session.get(User, created['id'])
+        assert user.check_password('changed password') and user.role == 'Contributor'
+
+    updated = client.put(url, json={'role': 'Viewer'}).get_json()
+    assert updated['role'] == 'Viewer'
+    assert client.get(url).get_json() == updated
+    assert client.delete(url).status_code == 204
+    assert client.get(url).status_code == 404
+
+def test_users_errors_use_shared_shapes(app):
+    """Test invalid bodies, duplicate emails and self-deletion return 400 errors"""
+    client = login(app, 'admin@example.com')
+    response = client.post('/api/users', json={'email': 'not an email', 'password': 'short', 'role': 'Owner'})
+    assert response.status_code == 400
+    assert set(response.get_json()['errors']) == {'email', 'password', 'role'}
+
+    response = client.post('/api/users', json={'email': 'viewer@example.com', 'password': 'long enough'})
+    assert response.status_code == 400
+    assert response.get_json() == {'errors': {'email': ['User with email "viewer@example.com" already exists']}}
+
+    response = client.delete('/api/users/1')
+    assert response.status_code == 400
+    assert response.get_json() == {'errors': {'id': ['You cannot delete your own account']}}
@@ -0,0 +1,259 @@
+"""
+Streaming export and import of application data
+
+An archive is a directory with one gzip-compressed NDJSON file per table
+(``<table>.ndjson.gz``, one JSON object per row) and a ``manifest.json``
+recording row counts and the schema revision. Rows are streamed in chunks
+in both directions, so memory stays flat whatever the table size.
+
+Tables are independent files, so both directions can work on several
+tables at once (``jobs``); imports still respect foreign key order by only
+running tables in parallel once the tables they reference are done.
+
+On PostgreSQL an export is a consistent snapshot: every table is read in a
+REPEATABLE READ transaction sharing one ``pg_export_snapshot()``, so rows
+written during a long export never leave the archive with, say, ideas
+pointing at projects it doesn't contain. Other databases read each table in
+its own transaction; stop writes while exporting them.
+"""
+import gzip
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, delete, insert, select, text
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+MANIFEST = 'manifest.json'
+DEFAULT_CHUNK_SIZE = 5000
+CONFLICT_MODES = ('error', 'skip', 'update')
+
+
+def _table_path(directory, table):
+    return os.path.join(directory, f'{table.name}.ndjson.gz')
+
+
+def _encode(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _decoders(table):
+    """Per-column converters back from JSON for the types JSON can't carry"""
+    decoders = {}
+    for column in table.columns:
+        if isinstance(column.type, DateTime):
+            decoders[column.name] = datetime.fromisoformat
+        elif isinstance(column.type, Date):
+            decoders[column.name] = date.fromisoformat
+    return decoders
+
+
+def dependency_levels(tables):
+    """Group tables so each group only references tables in earlier groups"""
+    remaining = list(tables)
+    done = set()
+    levels = []
+    while remaining:
+        level = [table for table in remaining
+                 if all(fk.column.table.name in done or fk.column.table is table
+                        for fk in table.foreign_keys)]
+        if not level:
+            # A reference cycle; fall back to one table at a time
+            level = remaining[:1]
+        levels.append(level)
+        done.update(table.name for table in level)
+        remaining = [table for table in remaining if table not in level]
+    return levels
+
+
+@contextmanager
+def _snapshot(engine):
+    """
+    Yield a function that opens a connection for exporting one table
+
+    On PostgreSQL the connection kept open here exports its snapshot, and
+    every connection handed out adopts it, so all tables are read as of the
+    same instant whichever worker reads them. Elsewhere each call is a plain
+    connection.
+    """
+    if engine.dialect.name != 'postgresql':
+        yield engine.connect
+        return
+
+    with engine.connect() as holder:
+        holder.execution_options(isolation_level='REPEATABLE READ', postgresql_readonly=True)
+        snapshot_id = holder.execute(text('SELECT pg_export_snapshot()')).scalar()
+
+        def connect():
+            connection = engine.connect()
+            connection.execution_options(isolation_level='REPEATABLE READ', postgresql_readonly=True)
+            # Must be the transaction's first statement, while the holder's is still open
+            connection.exec_driver_sql(f"SET TRANSACTION SNAPSHOT '{snapshot_id}'")
+            return connection
+
+        yield connect
+
+
+def export_table(connection, table, directory, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Stream one table to ``<table>.ndjson.gz``; returns the row count"""
+    order = list(table.primary_key.columns) or list(table.columns)[:1]
+    count = 0
+    # yield_per uses a server-side cursor where the driver supports it
+    result = connection.execution_options(yield_per=chunk_size).execute(select(table).order_by(*order))
+    with gzip.open(_table_path(directory, table), 'wt', encoding='utf-8', compresslevel=6) as f:
+        for partition in result.mappings().partitions():
+            f.writelines(json.dumps(dict(row), default=_encode, separators=(',', ':')) + '\n'
+                         for row in partition)
+            count += len(partition)
+    return count
+
+
+def export_archive(engine, metadata, directory, tables=None, chunk_size=DEFAULT_CHUNK_SIZE, jobs=1,
+                   revision=None):
+    """Export ``tables`` (default: every table in ``metadata``) into ``directory``"""
+    os.makedirs(directory, exist_ok=True)
+    selected = [table for table in metadata.sorted_tables if tables is None or table.name in tables]
+    start = time.perf_counter()
+
+    with _snapshot(engine) as connect:
+        def run(table):
+            with connect() as connection:
+                count = export_table(connection, table, directory, chunk_size)
+            logger.info(f"Exported {count} rows from {table.name}")
+            return table.name, count
+
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            counts = dict(pool.map(run, selected))
+
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'created_at': datetime.utcnow().isoformat(),
+        'dialect': engine.dialect.name,
+        'revision': revision,
+        'tables': {name: {'rows': counts[name], 'file': f'{name}.ndjson.gz'} for name in counts},
+    }
+    with open(os.path.join(directory, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    logger.info(f"Exported {sum(counts.values())} rows in {time.perf_counter() - start:.1f}s")
+    return manifest
+
+
+def read_manifest(directory):
+    with open(os.path.join(directory, MANIFEST)) as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported archive format {manifest.get('format_version')}")
+    return manifest
+
+
+def read_rows(directory, table):
+    """Yield the rows of one table file as dicts with native Python values"""
+    decoders = _decoders(table)
+    with gzip.open(_table_path(directory, table), 'rt', encoding='utf-8') as f:
+        for line in f:
+            row = json.loads(line)
+            for name, decode in decoders.items():
+                if row.get(name) is not None:
+                    row[name] = decode(row[name])
+            yield row
+
+
+def _insert_statement(connection, table, on_conflict):
+    """
+    An INSERT for ``table`` that handles conflicts as asked
+
+    ``skip`` ignores rows that clash with any primary key or unique
+    constraint. ``update`` can only name one conflict target, so it
+    overwrites rows by primary key; a row whose unique column (such as a
+    project title) matches a different existing row still fails.
+    """
+    if on_conflict == 'error':
+        return insert(table)
+
+    dialect = connection.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise ValueError(f"--on-conflict {on_conflict} is not supported on {dialect}")
+
+    statement = dialect_insert(table)
+    keys = list(table.primary_key.columns)
+    if on_conflict == 'skip':
+        return statement.on_conflict_do_nothing()
+    updates = {column.name: statement.excluded[column.name] for column in table.columns if not column.primary_key}
+    return statement.on_conflict_do_update(index_elements=keys, set_=updates)
+
+
+def _reset_sequence(connection, table):
+    """Move a PostgreSQL serial sequence past the imported ids"""
+    keys = list(table.primary_key.columns)
+    if connection.dialect.name != 'postgresql' or len(keys) != 1 or not keys[0].autoincrement:
+        return
+    preparer = connection.dialect.identifier_preparer
+    name = preparer.format_table(table)
+    connection.execute(
+        text("SELECT setval(pg_get_serial_sequence(:table, :column), "
+             f"COALESCE((SELECT MAX({preparer.quote(keys[0].name)}) FROM {name}), 0) + 1, false)"),
+        {'table': name, 'column': keys[0].name},
+    )
+
+
+def import_table(engine, table, directory, on_conflict='error', chunk_size=DEFAULT_CHUNK_SIZE):
+    """Load one table file with chunked executemany inserts in one transaction"""
+    count = 0
+    with engine.begin() as connection:
+        statement = _insert_statement(connection, table, on_conflict)
+        chunk = []
+        for row in read_rows(directory, table):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                connection.execute(statement, chunk)
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            connection.execute(statement, chunk)
+            count += len(chunk)
+        _reset_sequence(connection, table)
+    return count
+
+
+def import_archive(engine, metadata, directory, tables=None, on_conflict='error', truncate=False,
+                   chunk_size=DEFAULT_CHUNK_SIZE, jobs=1):
+    """Import an archive; tables in the same dependency level load in parallel"""
+    manifest = read_manifest(directory)
+    selected = [table for table in metadata.sorted_tables
+                if table.name in manifest['tables'] and (tables is None or table.name in tables)]
+    if engine.dialect.name == 'sqlite' and jobs > 1:
+        # SQLite has a single writer; parallel loads would only wait on each other
+        logger.info("SQLite allows one writer at a time, importing tables sequentially")
+        jobs = 1
+    start = time.perf_counter()
+
+    def run(table):
+        count = import_table(engine, table, directory, on_conflict, chunk_size)
+        logger.info(f"Imported {count} rows into {table.name}")
+        return table.name, count
+
+    if truncate:
+        # Empty referencing tables before the tables they point at
+        with engine.begin() as connection:
+            for table in reversed(selected):
+                connection.execute(delete(table))
+
+    counts = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        for level in dependency_levels(selected):
+            counts.update(pool.map(run, level))
+    logger.info(f"Imported {sum(counts.values())} rows in {time.perf_counter() - start:.1f}s")
+    return counts
+
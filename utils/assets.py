@@ -0,0 +1,126 @@
+"""
+Static asset fingerprinting and precompression
+
+``build_assets`` copies every file under ``static/`` into the dist folder as
+``name.<hash>.ext``, writes ``.gz`` (and ``.br`` when the ``brotli`` package is
+installed) variants next to compressible files, and records the mapping in
+``manifest.json``. Templates reference assets through ``asset_url`` so the
+fingerprinted URL is used once a build exists.
+"""
+import gzip
+import hashlib
+import json
+import os
+import shutil
+
+from flask import current_app, url_for
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+MANIFEST_NAME = 'manifest.json'
+
+# Directories under static/ that are not build inputs
+SKIP_DIRS = {'dist', 'uploads', '.well-known'}
+
+# Text formats worth precompressing; images are already compressed
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.svg', '.json', '.txt', '.html', '.xml', '.map'}
+
+# Don't bother compressing tiny files
+MIN_COMPRESS_SIZE = 256
+
+
+def fingerprint(path, length=12):
+    """Return a short content hash for the file at ``path``"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:length]
+
+
+def _iter_source_files(static_dir):
+    for root, dirs, files in os.walk(static_dir):
+        rel_root = os.path.relpath(root, static_dir)
+        if rel_root == '.':
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            yield os.path.normpath(os.path.join(rel_root, name)).replace(os.sep, '/')
+
+
+def _write_compressed(path):
+    """Write .gz/.br siblings for ``path``; returns the encodings written"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < MIN_COMPRESS_SIZE:
+        return []
+
+    written = []
+    # mtime=0 keeps the gzip output byte-for-byte reproducible
+    with open(path + '.gz', 'wb') as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    written.append('gzip')
+
+    if brotli is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+        written.append('br')
+    return written
+
+
+def build_assets(static_dir, dist_dir):
+    """
+    Fingerprint and precompress everything under ``static_dir``
+
+    Returns the manifest dict mapping logical names to fingerprinted names.
+    """
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir)
+
+    manifest = {}
+    for logical_name in sorted(_iter_source_files(static_dir)):
+        source = os.path.join(static_dir, logical_name)
+        stem, ext = os.path.splitext(logical_name)
+        hashed_name = f"{stem}.{fingerprint(source)}{ext}"
+        target = os.path.join(dist_dir, hashed_name)
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(source, target)
+        if ext.lower() in COMPRESSIBLE_EXTENSIONS:
+            _write_compressed(target)
+        manifest[logical_name] = hashed_name
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def load_manifest(dist_dir):
+    """Load the asset manifest, or an empty mapping if no build exists"""
+    try:
+        with open(os.path.join(dist_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def asset_url(filename):
+    """
+    URL for a static asset, fingerprinted when a build exists
+
+    Falls back to the plain static URL so development works without a build.
+    """
+    manifest = current_app.extensions.get('asset_manifest', {})
+    hashed_name = manifest.get(filename)
+    if hashed_name is None:
+        return url_for('static', filename=filename)
+    return url_for('assets.serve_asset', filename=hashed_name)
+
+
+def init_assets(app):
+    """Load the manifest and expose ``asset_url`` to templates"""
+    app.extensions['asset_manifest'] = load_manifest(app.config['ASSETS_DIST_FOLDER'])
+    app.add_template_global(asset_url)
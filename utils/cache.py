@@ -0,0 +1,125 @@
+"""
+Template fragment caching and Jinja bytecode caching
+
+Public pages re-render the same blocks (project grid, tools list) on every
+request even though the underlying data rarely changes. Fragments wrapped in
+``{% cache 'name', version %}...{% endcache %}`` are rendered once per
+version and served from an in-process LRU afterwards.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+from flask import current_app
+from jinja2 import FileSystemBytecodeCache, nodes
+from jinja2.ext import Extension
+from sqlalchemy import func
+
+
+class FragmentCache:
+    """Thread-safe LRU of rendered template fragments"""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, key, render):
+        """Return the cached fragment for ``key`` or render and store it"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Render outside the lock so a slow fragment doesn't block other keys
+        value = render()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Drop every cached fragment"""
+        with self._lock:
+            self._entries.clear()
+
+
+class FragmentCacheExtension(Extension):
+    """
+    Jinja ``{% cache %}`` tag
+
+    Usage:
+    {% cache 'project-grid', projects_version %}
+      ... expensive markup ...
+    {% endcache %}
+
+    Every argument becomes part of the cache key, so passing a version derived
+    from the data (see ``table_version``) invalidates the fragment on change.
+    """
+    tags = {'cache'}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        while parser.stream.skip_if('comma'):
+            args.append(parser.parse_expression())
+        body = parser.parse_statements(['name:endcache'], drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method('_render_fragment', [nodes.List(args)]), [], [], body
+        ).set_lineno(lineno)
+
+    def _render_fragment(self, key_parts, caller):
+        cache = current_app.extensions.get('fragment_cache')
+        if cache is None:
+            return caller()
+        return cache.get_or_render(tuple(key_parts), caller)
+
+
+def table_version(model):
+    """
+    Cheap version stamp for a table: (max updated_at, row count)
+
+    The row count catches deletes, which don't move max(updated_at).
+    """
+    from app import db
+    latest, count = db.session.query(
+        func.max(model.updated_at), func.count(model.id)
+    ).one()
+    return (latest.isoformat() if latest else None, count)
+
+
+def init_template_cache(app):
+    """Attach the fragment cache and the Jinja bytecode cache to the app"""
+    app.jinja_env.add_extension(FragmentCacheExtension)
+
+    if app.config.get('FRAGMENT_CACHE_ENABLED', True):
+        app.extensions['fragment_cache'] = FragmentCache(
+            max_entries=app.config.get('FRAGMENT_CACHE_MAX_ENTRIES', 256)
+        )
+
+    bytecode_dir = app.config.get('JINJA_BYTECODE_CACHE_DIR')
+    if bytecode_dir:
+        os.makedirs(bytecode_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(bytecode_dir)
+
+
+def compile_templates(app):
+    """
+    Load every template once so its bytecode lands in the bytecode cache
+
+    Run at build time so cold workers skip parsing base.html and the macros.
+    Returns the number of templates compiled.
+    """
+    env = app.jinja_env
+    compiled = 0
+    for name in env.list_templates(extensions=['html']):
+        env.get_template(name)
+        compiled += 1
+    return compiled
@@ -0,0 +1,124 @@
+"""
+Tools catalog loaded from projects.json
+
+The catalog is parsed once into an immutable snapshot with an id index and
+precomputed facet maps (category, status), so lookups and filters never scan
+the list. The file's mtime is checked on access and the snapshot is rebuilt
+when it changes, so edits show up without a restart.
+"""
+import json
+import logging
+import os
+import threading
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# Fields that can be used to filter the catalog
+FACETS = ('category', 'status')
+
+
+def _to_tool(tool_id, entry):
+    """Normalize a projects.json entry into a tool record"""
+    tool = {
+        'id': tool_id,
+        'name': entry.get('name', tool_id),
+        'description': entry.get('description', ''),
+        'category': entry.get('category'),
+        'status': entry.get('status', 'Active'),
+    }
+    for key in ('tagline', 'tech_stack', 'repo_link'):
+        if entry.get(key):
+            tool[key] = entry[key]
+    if entry.get('download_link'):
+        tool['download'] = os.path.basename(entry['download_link'])
+    return MappingProxyType(tool)
+
+
+class CatalogSnapshot:
+    """Immutable, indexed view of the catalog at one file version"""
+
+    def __init__(self, entries, version):
+        self.version = version
+        self.tools = tuple(_to_tool(tool_id, entry) for tool_id, entry in entries.items())
+        self.by_id = MappingProxyType({tool['id']: tool for tool in self.tools})
+
+        facets = {name: {} for name in FACETS}
+        for tool in self.tools:
+            for name in FACETS:
+                value = tool.get(name)
+                if value:
+                    facets[name].setdefault(value.lower(), []).append(tool)
+        self.facets = MappingProxyType({
+            name: MappingProxyType({value: tuple(tools) for value, tools in values.items()})
+            for name, values in facets.items()
+        })
+
+    def get(self, tool_id):
+        """Return a tool by id, or None"""
+        return self.by_id.get(tool_id)
+
+    def filter(self, **criteria):
+        """
+        Return tools matching every given facet value (case-insensitive)
+
+        Unknown facets raise KeyError; empty criteria return every tool.
+        """
+        matches = None
+        for name, value in criteria.items():
+            if not value:
+                continue
+            tools = self.facets[name].get(value.lower(), ())
+            if matches is None:
+                matches = tools
+            else:
+                ids = {tool['id'] for tool in tools}
+                matches = tuple(tool for tool in matches if tool['id'] in ids)
+        return self.tools if matches is None else matches
+
+
+class ToolCatalog:
+    """Reloads a CatalogSnapshot whenever the backing file changes"""
+
+    def __init__(self, path):
+        self.path = path
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def _mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _load(self, mtime):
+        if mtime is None:
+            logger.warning(f"Tools catalog not found at {self.path}")
+            return CatalogSnapshot({}, None)
+        with open(self.path, 'r') as file:
+            entries = json.load(file)
+        logger.info(f"Loaded {len(entries)} tools from {self.path}")
+        return CatalogSnapshot(entries, mtime)
+
+    def snapshot(self):
+        """Return the current snapshot, reloading if the file changed"""
+        mtime = self._mtime()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == mtime:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != mtime:
+                try:
+                    self._snapshot = self._load(mtime)
+                except (OSError, json.JSONDecodeError) as e:
+                    # Keep serving the last good snapshot if an edit is half-written
+                    logger.error(f"Failed to reload tools catalog: {e}")
+                    if self._snapshot is None:
+                        self._snapshot = CatalogSnapshot({}, None)
+            return self._snapshot
+
+
+def init_tool_catalog(app):
+    """Attach the tools catalog to the app"""
+    app.extensions['tool_catalog'] = ToolCatalog(app.config['TOOLS_CATALOG_PATH'])
@@ -0,0 +1,297 @@
+"""
+Synthetic data generator for scale testing
+
+Produces realistic users, projects, ideas, SOPs (with multi-kilobyte
+markdown bodies) and KPI histories from a fixed seed. Each entity type has
+its own random stream, so changing one count never changes the rows of
+another (apart from which projects the ideas, SOPs and KPIs link to).
+Rows are generated lazily and written in chunks: PostgreSQL uses
+``COPY ... FROM STDIN``, other databases executemany-style Core inserts.
+
+Used by ``flask generate-data`` and the benchmark suite.
+"""
+import csv
+import io
+import logging
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+
+logger = logging.getLogger(__name__)
+
+BASE_DATE = datetime(2024, 1, 1)
+DEFAULT_CHUNK_SIZE = 5000
+
+# All synthetic users share this password; hashing millions of distinct
+# passwords would dominate the run time
+SYNTHETIC_PASSWORD = 'password'
+
+WORDS = (
+    'automation', 'dashboard', 'pipeline', 'inventory', 'analytics', 'workflow',
+    'scheduler', 'reporting', 'onboarding', 'billing', 'support', 'migration',
+    'monitoring', 'compliance', 'forecast', 'integration', 'catalog', 'audit',
+    'customer', 'vendor', 'release', 'backlog', 'escalation', 'quarterly',
+)
+ROLES = (('Viewer', 80), ('Contributor', 17), ('Admin', 3))
+IDEA_STATUSES = ('new', 'in_progress', 'completed', 'archived')
+CATEGORIES = ('Operations', 'Finance', 'Engineering', 'Sales', 'Support')
+UNITS = ('%', 'hours', 'tickets', 'USD', 'users')
+
+
+def _sentence(rng, words):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+class TextPool:
+    """
+    Pre-generated sentences and titles
+
+    Picking from a pool is far cheaper than building text word by word,
+    which matters when generating millions of multi-kilobyte documents.
+    """
+
+    def __init__(self, rng, size=2048):
+        self.rng = rng
+        self.sentences = [_sentence(rng, rng.randint(6, 16)) for _ in range(size)]
+        self.titles = [_sentence(rng, rng.randint(2, 4))[:-1] for _ in range(size)]
+
+    def sentence(self):
+        return self.rng.choice(self.sentences)
+
+    def title(self):
+        return self.rng.choice(self.titles)
+
+    def paragraph(self, sentences):
+        return ' '.join(self.rng.choices(self.sentences, k=sentences))
+
+
+def _timestamps(rng, i):
+    created = BASE_DATE + timedelta(minutes=i, seconds=rng.randrange(60))
+    return created, created + timedelta(days=rng.randrange(30))
+
+
+def markdown_body(text, target_bytes):
+    """A markdown document of roughly ``target_bytes`` with headings, lists and code"""
+    rng = text.rng
+    parts = [f'# {text.title()}', text.paragraph(3)]
+    size = sum(len(p) for p in parts)
+    section = 1
+    while size < target_bytes:
+        block = [f'## {section}. {text.title()}', text.paragraph(rng.randint(2, 5))]
+        block.extend(f'- {text.sentence()}' for _ in range(rng.randint(2, 6)))
+        if section % 3 == 0:
+            block.append(f'```bash\n./run-{rng.choice(WORDS)}.sh --env {rng.choice(WORDS)}\n```')
+        block = '\n\n'.join(block)
+        parts.append(block)
+        size += len(block)
+        section += 1
+    return '\n\n'.join(parts)
+
+
+def user_rows(count, rng, password_hash):
+    roles, weights = zip(*ROLES)
+    for i in range(count):
+        created, updated = _timestamps(rng, i)
+        yield {
+            'email': f'user{i}@example.com',
+            'password_hash': password_hash,
+            'role': rng.choices(roles, weights)[0],
+            'created_at': created,
+            'updated_at': updated,
+        }
+
+
+def project_rows(count, rng, long_description_bytes=600):
+    text = TextPool(rng)
+    for i in range(count):
+        created, updated = _timestamps(rng, i)
+        yield {
+            'title': f'{text.title()} {i}',
+            'slug': f'project-{i}',
+            'description': text.sentence(),
+            'long_description': markdown_body(text, long_description_bytes),
+            'image_url': f'/static/images/projects/{i}.png',
+            'demo_url': f'https://demo.example.com/{i}',
+            'github_url': f'https://github.com/example/project-{i}',
+            'download_url': f'/downloads/project-{i}.zip',
+            'is_featured': i % 10 == 0,
+            'created_at': created,
+            'updated_at': updated,
+        }
+
+
+def idea_rows(count, rng):
+    text = TextPool(rng)
+    for i in range(count):
+        created, updated = _timestamps(rng, i)
+        yield {
+            'title': f'{text.title()} {i}',
+            'description': text.paragraph(rng.randint(1, 4)),
+            'status': rng.choice(IDEA_STATUSES),
+            'priority': rng.randrange(5),
+            'created_at': created,
+            'updated_at': updated,
+        }
+
+
+def sop_rows(count, rng, body_bytes=4096):
+    text = TextPool(rng)
+    for i in range(count):
+        created, updated = _timestamps(rng, i)
+        yield {
+            'title': f'{text.title()} {i}',
+            'description': text.sentence(),
+            'content': markdown_body(text, body_bytes),
+            'version': f'{rng.randint(1, 3)}.{rng.randrange(10)}',
+            'category': rng.choice(CATEGORIES),
+            'created_at': created,
+            'updated_at': updated,
+        }
+
+
+def kpi_rows(series, rng, periods=12):
+    """
+    KPI histories: one row per metric per monthly period
+
+    There is no separate history table, so a history is a run of KPI rows
+    with the same title over consecutive start/end windows, with the value
+    drifting towards the target.
+    """
+    text = TextPool(rng)
+    for i in range(series):
+        title = f'{text.title()} {i}'
+        description = text.sentence()
+        unit = rng.choice(UNITS)
+        category = rng.choice(CATEGORIES)
+        target = float(rng.randrange(10, 1000))
+        value = target * rng.uniform(0.1, 0.6)
+        start = BASE_DATE + timedelta(days=rng.randrange(365))
+        for period in range(periods):
+            value = max(0.0, value + target * rng.uniform(-0.05, 0.12))
+            period_start = start + timedelta(days=30 * period)
+            yield {
+                'title': title,
+                'description': description,
+                'target_value': target,
+                'current_value': round(value, 2),
+                'unit': unit,
+                'category': category,
+                'start_date': period_start,
+                'end_date': period_start + timedelta(days=30),
+                'created_at': period_start,
+                'updated_at': period_start + timedelta(days=30),
+            }
+
+
+def link_projects(rows, project_ids, rng):
+    """
+    Set project_id on each row to a random project, or None if there are
+    none; consecutive rows with the same title (a KPI history) share one
+    """
+    title = project_id = None
+    for row in rows:
+        if row['title'] != title:
+            title = row['title']
+            project_id = rng.choice(project_ids) if project_ids else None
+        row['project_id'] = project_id
+        yield row
+
+
+def _copy_value(value):
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    return value
+
+
+def _copy_chunk(connection, table, chunk):
+    """Stream a chunk through PostgreSQL COPY in CSV format"""
+    columns = list(chunk[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in chunk:
+        writer.writerow([_copy_value(row[column]) for column in columns])
+    buffer.seek(0)
+
+    preparer = connection.dialect.identifier_preparer
+    statement = (
+        f'COPY {preparer.format_table(table)} '
+        f'({", ".join(preparer.quote(column) for column in columns)}) '
+        f'FROM STDIN WITH (FORMAT csv)'
+    )
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(statement, buffer)
+
+
+def write_rows(connection, model, rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Write an iterable of row dicts in chunks; returns the number written"""
+    table = model.__table__
+    use_copy = connection.dialect.name == 'postgresql'
+    written = 0
+    chunk = []
+
+    def flush():
+        if use_copy:
+            _copy_chunk(connection, table, chunk)
+        else:
+            connection.execute(insert(table), chunk)
+
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            flush()
+            written += len(chunk)
+            chunk = []
+    if chunk:
+        flush()
+        written += len(chunk)
+    return written
+
+
+def generate(connection, counts, seed=42, sop_bytes=4096, kpi_periods=12,
+             chunk_size=DEFAULT_CHUNK_SIZE, password_hash=None):
+    """
+    Generate and write synthetic rows
+
+    ``counts`` maps 'users', 'projects', 'ideas', 'sops' and 'kpis' (KPI
+    series, each with ``kpi_periods`` rows) to how many to create. Returns
+    {entity: rows written}. The caller owns the transaction.
+    """
+    from models.idea import Idea
+    from models.kpi import KPI
+    from models.project import Project
+    from models.sop import SOP
+    from models.user import User
+
+    def stream(name):
+        return random.Random(f'{seed}-{name}')
+
+    generators = {
+        'users': lambda n: (User, user_rows(n, stream('users'), password_hash)),
+        'projects': lambda n: (Project, project_rows(n, stream('projects'))),
+        'ideas': lambda n: (Idea, idea_rows(n, stream('ideas'))),
+        'sops': lambda n: (SOP, sop_rows(n, stream('sops'), sop_bytes)),
+        'kpis': lambda n: (KPI, kpi_rows(n, stream('kpis'), kpi_periods)),
+    }
+
+    if counts.get('users') and password_hash is None:
+        from werkzeug.security import generate_password_hash
+        password_hash = generate_password_hash(SYNTHETIC_PASSWORD)
+
+    written = {}
+    project_ids = None
+    for name, make in generators.items():
+        count = counts.get(name, 0)
+        if not count:
+            continue
+        model, rows = make(count)
+        if name in ('ideas', 'sops', 'kpis'):
+            # Projects are generated first, so these can link to them
+            if project_ids is None:
+                project_ids = connection.execute(select(Project.id)).scalars().all()
+            rows = link_projects(rows, project_ids, stream(f'{name}-projects'))
+        written[name] = write_rows(connection, model, rows, chunk_size)
+        logger.info(f"Generated {written[name]} {name} rows")
+    return written
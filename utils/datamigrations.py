@@ -0,0 +1,206 @@
+"""
+Batched, resumable data migrations
+
+Schema changes go through Alembic; rewriting existing rows (backfills) goes
+through here so large tables are never updated in one statement. A
+migration walks its table in primary-key order (keyset pagination, so each
+batch is an index range scan however far in it is), updates one batch per
+transaction and records the last key in the ``data_migrations`` table in
+that same transaction. An interrupted run resumes after the last committed
+batch.
+
+Define a migration by subclassing DataMigration and decorating it with
+``@register``; run it with ``flask data-migrate run <name>``.
+"""
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from sqlalchemy import MetaData, Table, and_, case, delete, func, insert, inspect, or_, select, true, update
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS = {}
+
+
+def register(migration_class):
+    """Class decorator adding a migration to the registry"""
+    MIGRATIONS[migration_class.name] = migration_class
+    return migration_class
+
+
+class DataMigration:
+    """
+    A backfill over one table, applied in batches of keys
+
+    ``table_name`` is reflected from the database, so migrations can use
+    columns the models no longer define. ``key`` must be unique and indexed.
+    """
+    name = None
+    table_name = None
+    key = 'id'
+    batch_size = 1000
+    # Seconds to sleep between batches, to leave room for live traffic
+    pause = 0.0
+
+    def pending(self, table):
+        """Optional where-clause limiting the walk to rows that still need the change"""
+        return None
+
+    def process(self, connection, table, keys):
+        """Apply the change to the rows with these keys; return the number changed"""
+        raise NotImplementedError
+
+
+def _state_table():
+    from models.data_migration import DataMigrationState
+    return DataMigrationState.__table__
+
+
+def _decode_key(column, value):
+    if value is None:
+        return None
+    try:
+        return column.type.python_type(value)
+    except NotImplementedError:
+        return value
+
+
+def get_state(connection, name):
+    """The checkpoint row for ``name`` as a mapping, or None"""
+    states = _state_table()
+    return connection.execute(select(states).where(states.c.name == name)).mappings().first()
+
+
+@contextmanager
+def _transaction(bind):
+    """A transaction on a new connection (Engine) or on the given Connection"""
+    if isinstance(bind, Engine):
+        with bind.begin() as connection:
+            yield connection
+    elif bind.get_execution_options().get('isolation_level') == 'AUTOCOMMIT':
+        # e.g. Alembic's connection inside autocommit_block(): each statement
+        # commits as it runs, and a batch that dies between its update and
+        # checkpoint is simply redone
+        yield bind
+    else:
+        with bind.begin():
+            yield bind
+
+
+def _keys_query(migration, table, after):
+    key = table.c[migration.key]
+    conditions = [condition for condition in (
+        key > after if after is not None else None,
+        migration.pending(table),
+    ) if condition is not None]
+    return select(key).where(*conditions).order_by(key)
+
+
+def run_migration(migration, bind, batch_size=None, pause=None, dry_run=False,
+                  restart=False, max_batches=None):
+    """
+    Run (or resume) ``migration`` against ``bind``
+
+    ``bind`` is an Engine, a Connection with no transaction open, or one in
+    AUTOCOMMIT mode (such as Alembic's inside ``autocommit_block()``); each
+    batch commits separately.
+    With ``dry_run`` nothing is written (not even the checkpoint table, whose
+    absence means no checkpoint) and the result holds the number of rows
+    still to process. ``restart`` discards the checkpoint first;
+    ``max_batches`` stops early, leaving the checkpoint to resume from.
+    """
+    states = _state_table()
+    batch_size = batch_size or migration.batch_size
+    pause = migration.pause if pause is None else pause
+
+    with _transaction(bind) as connection:
+        if dry_run:
+            has_states = inspect(connection).has_table(states.name)
+            state = get_state(connection, migration.name) if has_states else None
+        else:
+            states.create(connection, checkfirst=True)
+            if restart:
+                connection.execute(delete(states).where(states.c.name == migration.name))
+            state = get_state(connection, migration.name)
+        table = Table(migration.table_name, MetaData(), autoload_with=connection)
+        key = table.c[migration.key]
+        last_key = _decode_key(key, state['last_key']) if state else None
+
+        result = {
+            'name': migration.name,
+            'rows_processed': state['rows_processed'] if state else 0,
+            'batches': state['batches'] if state else 0,
+            'last_key': last_key,
+            'completed': bool(state and state['completed_at']),
+            'dry_run': dry_run,
+        }
+
+        if dry_run:
+            remaining = _keys_query(migration, table, last_key).subquery()
+            result['pending_rows'] = 0 if result['completed'] else \
+                connection.execute(select(func.count()).select_from(remaining)).scalar()
+            return result
+        if result['completed']:
+            logger.info(f"Data migration {migration.name} already completed")
+            return result
+        if state is None:
+            connection.execute(insert(states).values(name=migration.name, rows_processed=0, batches=0))
+
+    start = time.perf_counter()
+    batches_run = 0
+    while max_batches is None or batches_run < max_batches:
+        with _transaction(bind) as connection:
+            keys = connection.execute(_keys_query(migration, table, last_key).limit(batch_size)).scalars().all()
+            changed = migration.process(connection, table, keys) if keys else 0
+            if keys:
+                last_key = keys[-1]
+                result['rows_processed'] += changed
+                result['batches'] += 1
+            done = len(keys) < batch_size
+            connection.execute(
+                update(states).where(states.c.name == migration.name).values(
+                    last_key=None if last_key is None else str(last_key),
+                    rows_processed=result['rows_processed'],
+                    batches=result['batches'],
+                    completed_at=datetime.utcnow() if done else None,
+                )
+            )
+        batches_run += 1
+        result['last_key'] = last_key
+
+        if done:
+            result['completed'] = True
+            break
+        logger.info(f"{migration.name}: batch {result['batches']} up to {migration.key}={last_key}, "
+                    f"{result['rows_processed']} rows changed")
+        if pause:
+            time.sleep(pause)
+
+    elapsed = time.perf_counter() - start
+    state = 'completed' if result['completed'] else 'paused'
+    logger.info(f"{migration.name} {state}: {result['rows_processed']} rows changed in "
+                f"{result['batches']} batches ({elapsed:.1f}s this run)")
+    return result
+
+
+@register
+class BackfillUserRoles(DataMigration):
+    """Set role from the legacy is_admin flag, and Viewer where it is missing"""
+    name = 'backfill-user-roles'
+    table_name = 'user'
+
+    def pending(self, table):
+        condition = table.c.role.is_(None)
+        if 'is_admin' in table.c:
+            condition = or_(condition, and_(table.c.is_admin == true(), table.c.role != 'Admin'))
+        return condition
+
+    def process(self, connection, table, keys):
+        role = func.coalesce(table.c.role, 'Viewer')
+        if 'is_admin' in table.c:
+            role = case((table.c.is_admin == true(), 'Admin'), else_=role)
+        statement = update(table).where(table.c[self.key].in_(keys)).values(role=role)
+        return connection.execute(statement).rowcount
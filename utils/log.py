@@ -0,0 +1,220 @@
+"""
+Non-blocking application logging
+
+Request threads only put records on a bounded in-memory queue; a background
+QueueListener thread formats them and does the file I/O (with rotation).
+When the queue is full, records are dropped (default) or the caller blocks
+for a short time, so a slow disk can't stall requests indefinitely.
+"""
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import re
+import uuid
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from flask import g, has_request_context, request
+
+# Accept upstream request ids (load balancer, frontend) when they look sane
+REQUEST_ID_PATTERN = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s [%(request_id)s] in %(module)s: %(message)s'
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp records with the current request id (runs in the caller's thread)"""
+
+    def filter(self, record):
+        record.request_id = g.get('request_id', '-') if has_request_context() else '-'
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'message': record.getMessage(),
+            'request_id': getattr(record, 'request_id', '-'),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc_info'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler with a backpressure policy
+
+    'drop'  - never wait; count and discard records when the queue is full
+    'block' - wait up to block_timeout seconds for space, then drop
+    """
+
+    def __init__(self, log_queue, policy='drop', block_timeout=0.05):
+        super().__init__(log_queue)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Resolve the message and traceback here, while args may still point
+        # at request-local objects, but leave the layout to the writer thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self.policy == 'block':
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class QueueLogging:
+    """Owns the queue and writer thread; restarts them in forked workers"""
+
+    def __init__(self, handlers, maxsize, policy, block_timeout, settings=None):
+        self.handlers = handlers
+        self.maxsize = maxsize
+        # The configuration this was built from, to tell whether a later
+        # init_logging() can reuse it
+        self.settings = settings
+        self.queue_handler = BoundedQueueHandler(
+            queue.Queue(maxsize=maxsize), policy=policy, block_timeout=block_timeout
+        )
+        self.listener = None
+
+    def start(self):
+        self.listener = QueueListener(self.queue_handler.queue, *self.handlers,
+                                      respect_handler_level=True)
+        self.listener.start()
+
+    def stop(self):
+        """Flush queued records and stop the writer thread"""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def close(self):
+        """Stop the writer thread and close the handlers"""
+        self.stop()
+        for handler in self.handlers:
+            handler.close()
+
+    def restart_after_fork(self):
+        # Threads don't survive fork (gunicorn --preload builds the app in the
+        # master), so each worker needs a fresh queue and writer
+        if self.listener is None:
+            return
+        self.queue_handler.queue = queue.Queue(maxsize=self.maxsize)
+        self.queue_handler.dropped = 0
+        self.start()
+
+
+# One QueueLogging per logger for the whole process, however many apps
+# create_app() builds (the tests build one per test)
+_instances = {}
+_process_hooks_registered = False
+
+
+def _stop_all():
+    for queue_logging in list(_instances.values()):
+        queue_logging.stop()
+
+
+def _restart_all_after_fork():
+    for queue_logging in _instances.values():
+        queue_logging.restart_after_fork()
+
+
+def _register_process_hooks():
+    global _process_hooks_registered
+    if _process_hooks_registered:
+        return
+    atexit.register(_stop_all)
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=_restart_all_after_fork)
+    _process_hooks_registered = True
+
+
+def _assign_request_id():
+    header = request.headers.get('X-Request-ID', '')
+    g.request_id = header if REQUEST_ID_PATTERN.match(header) else uuid.uuid4().hex
+
+
+def _add_request_id_header(response):
+    request_id = g.get('request_id')
+    if request_id:
+        response.headers['X-Request-ID'] = request_id
+    return response
+
+
+def init_logging(app):
+    """
+    Attach queue-based logging and request ids to the app
+
+    Idempotent per logger: apps sharing a logger (every create_app() call
+    in a process) share one queue, writer thread and file handler, which
+    is replaced only when the logging configuration changes.
+    """
+    level = getattr(logging, app.config['LOG_LEVEL'])
+    settings = (
+        os.path.abspath(app.config['LOG_FILE']),
+        app.config.get('LOG_MAX_BYTES', 10 * 1024 * 1024),
+        app.config.get('LOG_BACKUP_COUNT', 5),
+        app.config.get('LOG_FORMAT', 'json'),
+        app.config.get('LOG_QUEUE_SIZE', 10000),
+        app.config.get('LOG_QUEUE_POLICY', 'drop'),
+        app.config.get('LOG_QUEUE_BLOCK_TIMEOUT', 0.05),
+        level,
+    )
+
+    queue_logging = _instances.get(app.logger.name)
+    if queue_logging is not None and queue_logging.settings != settings:
+        app.logger.removeHandler(queue_logging.queue_handler)
+        queue_logging.close()
+        queue_logging = None
+
+    if queue_logging is None:
+        log_file, max_bytes, backup_count, log_format, queue_size, policy, block_timeout, _ = settings
+        file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
+        file_handler.setLevel(level)
+        if log_format == 'json':
+            file_handler.setFormatter(JsonFormatter())
+        else:
+            file_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+        queue_logging = QueueLogging([file_handler], maxsize=queue_size, policy=policy,
+                                     block_timeout=block_timeout, settings=settings)
+        queue_logging.queue_handler.setLevel(level)
+        queue_logging.queue_handler.addFilter(RequestIdFilter())
+        _instances[app.logger.name] = queue_logging
+
+    if queue_logging.listener is None:
+        queue_logging.start()
+    _register_process_hooks()
+
+    app.logger.addHandler(queue_logging.queue_handler)
+    app.logger.setLevel(level)
+    app.extensions['queue_logging'] = queue_logging
+
+    app.before_request(_assign_request_id)
+    app.after_request(_add_request_id_header)
+    return queue_logging
@@ -0,0 +1,230 @@
+"""
+Prometheus metrics
+
+Request latency per blueprint/endpoint, ORM query latency per model, DB pool
+usage, fragment cache hits and the password-hash pool queue depth, served
+from /metrics (see routes/metrics.py).
+
+Under gunicorn, set PROMETHEUS_MULTIPROC_DIR to an empty directory before
+the workers start (gunicorn.conf.py does the cleanup) so every worker writes
+its samples there and a scrape of any worker returns the aggregate.
+prometheus_client is only imported when METRICS_ENABLED is set.
+"""
+import logging
+import os
+import threading
+import time
+
+from flask import current_app, g, request
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+_metrics = None
+_metrics_lock = threading.Lock()
+_listeners_installed = False
+
+
+def multiprocess_enabled():
+    """True when samples are shared between worker processes"""
+    return bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+
+def get_metrics():
+    """Create the metric objects once per process (names must be unique per registry)"""
+    global _metrics
+    if _metrics is not None:
+        return _metrics
+
+    with _metrics_lock:
+        if _metrics is None:
+            if multiprocess_enabled():
+                # Outside gunicorn (CLI, tests) nothing has created it yet
+                os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+            from prometheus_client import Counter, Gauge, Histogram
+
+            _metrics = {
+                'requests': Counter(
+                    'http_requests_total', 'HTTP requests',
+                    ['blueprint', 'endpoint', 'method', 'status'],
+                ),
+                'latency': Histogram(
+                    'http_request_duration_seconds', 'HTTP request latency',
+                    ['blueprint', 'endpoint', 'method'], buckets=LATENCY_BUCKETS,
+                ),
+                'db_latency': Histogram(
+                    'db_query_duration_seconds', 'ORM statement latency',
+                    ['model', 'operation'], buckets=DB_BUCKETS,
+                ),
+                'pool_checked_out': Gauge(
+                    'db_pool_checked_out', 'Connections in use',
+                    multiprocess_mode='livesum',
+                ),
+                'pool_size': Gauge(
+                    'db_pool_size', 'Connections kept in the pool',
+                    multiprocess_mode='livesum',
+                ),
+                'pool_overflow': Gauge(
+                    'db_pool_overflow', 'Connections opened beyond the pool size',
+                    multiprocess_mode='livesum',
+                ),
+                'cache_hits': Counter(
+                    'fragment_cache_hits_total', 'Template fragment cache hits',
+                ),
+                'cache_misses': Counter(
+                    'fragment_cache_misses_total', 'Template fragment cache misses',
+                ),
+                'hash_queue_depth': Gauge(
+                    'password_hash_queue_depth', 'Passwords waiting for the hash pool',
+                    multiprocess_mode='livesum',
+                ),
+            }
+    return _metrics
+
+
+def set_hash_queue_depth(depth):
+    """Report how many passwords are waiting in the hash pool"""
+    if _metrics is not None:
+        _metrics['hash_queue_depth'].set(depth)
+
+
+def _statement_model(orm_execute_state):
+    mappers = orm_execute_state.all_mappers
+    return mappers[0].class_.__name__ if mappers else 'none'
+
+
+def _statement_operation(orm_execute_state):
+    if orm_execute_state.is_select:
+        return 'select'
+    if orm_execute_state.is_insert:
+        return 'insert'
+    if orm_execute_state.is_update:
+        return 'update'
+    if orm_execute_state.is_delete:
+        return 'delete'
+    return 'other'
+
+
+def _time_orm_execute(orm_execute_state):
+    if _metrics is None:
+        return None
+    start = time.perf_counter()
+    try:
+        return orm_execute_state.invoke_statement()
+    finally:
+        _metrics['db_latency'].labels(
+            _statement_model(orm_execute_state), _statement_operation(orm_execute_state)
+        ).observe(time.perf_counter() - start)
+
+
+def _install_session_listener():
+    global _listeners_installed
+    if _listeners_installed:
+        return
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+    event.listen(Session, 'do_orm_execute', _time_orm_execute)
+    _listeners_installed = True
+
+
+class _CacheCounterSync:
+    """Turns the fragment cache's running totals into counter increments"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def sync(self, metrics, cache):
+        # Concurrent requests sync the same totals; without the lock two of
+        # them could both add the same delta. The totals are read once, so
+        # hits landing mid-sync are counted by the next one.
+        with self._lock:
+            hits, misses = cache.hits, cache.misses
+            if hits > self.hits:
+                metrics['cache_hits'].inc(hits - self.hits)
+            if misses > self.misses:
+                metrics['cache_misses'].inc(misses - self.misses)
+            self.hits, self.misses = hits, misses
+
+
+def _watch_pool(pool):
+    """Track connections in use through pool checkout/checkin events"""
+    from sqlalchemy import event
+    metrics = get_metrics()
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics['pool_checked_out'].inc()
+        # Not every pool class (e.g. SQLite's StaticPool) reports these
+        if hasattr(pool, 'size'):
+            metrics['pool_size'].set(pool.size())
+        if hasattr(pool, 'overflow'):
+            metrics['pool_overflow'].set(max(pool.overflow(), 0))
+
+    def on_checkin(dbapi_connection, connection_record):
+        metrics['pool_checked_out'].dec()
+
+    event.listen(pool, 'checkout', on_checkout)
+    event.listen(pool, 'checkin', on_checkin)
+
+
+def _start_request_timer():
+    g.metrics_start = time.perf_counter()
+
+
+def _record_request(response):
+    start = g.pop('metrics_start', None)
+    if start is None or request.endpoint == 'metrics.metrics':
+        return response
+
+    metrics = get_metrics()
+    blueprint = request.blueprint or 'app'
+    endpoint = request.endpoint or 'unmatched'
+    metrics['latency'].labels(blueprint, endpoint, request.method).observe(
+        time.perf_counter() - start
+    )
+    metrics['requests'].labels(blueprint, endpoint, request.method, response.status_code).inc()
+
+    cache = current_app.extensions.get('fragment_cache')
+    if cache is not None:
+        current_app.extensions['metrics_cache_sync'].sync(metrics, cache)
+    return response
+
+
+def init_metrics(app):
+    """Collect Prometheus metrics for the app if METRICS_ENABLED"""
+    if not app.config.get('METRICS_ENABLED'):
+        return False
+    if app.config.get('METRICS_REQUIRE_TOKEN') and not app.config.get('METRICS_TOKEN'):
+        logger.warning("METRICS_ENABLED is set without METRICS_TOKEN; /metrics is not registered")
+        return False
+
+    from app import db
+
+    get_metrics()
+    _install_session_listener()
+    with app.app_context():
+        _watch_pool(db.engine.pool)
+    app.extensions['metrics_cache_sync'] = _CacheCounterSync()
+    app.before_request(_start_request_timer)
+    app.after_request(_record_request)
+
+    from routes.metrics import metrics_bp
+    app.register_blueprint(metrics_bp)
+    logger.info(f"Prometheus metrics enabled (multiprocess={multiprocess_enabled()})")
+    return True
+
+
+def render_metrics():
+    """Return (body, content type) for a scrape"""
+    from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
+
+    if multiprocess_enabled():
+        from prometheus_client import multiprocess
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
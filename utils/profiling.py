@@ -0,0 +1,197 @@
+"""
+Production profiling
+
+- SamplingProfiler: a background thread that snapshots every thread's stack
+  at a fixed interval and counts collapsed stacks ("a;b;c 12"), the input
+  format for flamegraph.pl / speedscope. Overhead is one stack walk per
+  interval, so it is safe to run against live traffic.
+- Per-request cProfile: a request carrying a valid signed ``X-Profile``
+  header (see ``make_profile_token``) is run under cProfile and its stats
+  are written to PROFILING_OUTPUT_DIR.
+
+Both are disabled unless PROFILING_ENABLED is set.
+"""
+import cProfile
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+from flask import current_app, g, request
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f'{os.path.basename(code.co_filename)}:{code.co_name}'
+
+
+def collapse_stack(frame):
+    """Return the stack as 'outermost;...;innermost'"""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
+
+
+class SamplingProfiler:
+    """Counts collapsed stacks of every other thread in this process"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._ignore = set()
+
+    def _run(self):
+        self._ignore.add(threading.get_ident())
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id not in self._ignore:
+                    self.stacks[collapse_stack(frame)] += 1
+            self.samples += 1
+
+    def start(self, ignore_current_thread=True):
+        if ignore_current_thread:
+            self._ignore.add(threading.get_ident())
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def sample_for(self, seconds):
+        """Sample for a fixed time and return the stack counts"""
+        self.start()
+        try:
+            time.sleep(seconds)
+        finally:
+            self.stop()
+        return self.stacks
+
+    def collapsed(self):
+        """Stacks in the collapsed text format, hottest first"""
+        return '\n'.join(f'{stack} {count}' for stack, count in self.stacks.most_common())
+
+
+def profile_output_dir(app):
+    directory = app.config['PROFILING_OUTPUT_DIR']
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def start_background_sample(app, seconds, interval):
+    """
+    Sample this worker for ``seconds`` without blocking the caller
+
+    Results are written to ``<PROFILING_OUTPUT_DIR>/<id>.collapsed`` so any
+    worker can serve them back. Returns the profile id.
+    """
+    profile_id = uuid.uuid4().hex
+    path = os.path.join(profile_output_dir(app), f'{profile_id}.collapsed')
+    profiler = SamplingProfiler(interval=interval)
+
+    def run():
+        profiler.sample_for(seconds)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(profiler.collapsed())
+        os.replace(tmp_path, path)
+        logger.info(f"Profile {profile_id}: {profiler.samples} samples written to {path}")
+
+    threading.Thread(target=run, name=f'profile-{profile_id}', daemon=True).start()
+    return profile_id
+
+
+def load_sample(app, profile_id):
+    """Return collapsed stacks for a finished sample, or None if not ready"""
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    path = os.path.join(profile_output_dir(app), f'{profile_id}.collapsed')
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return f.read()
+
+
+def _serializer(app):
+    return URLSafeTimedSerializer(app.config['SECRET_KEY'], salt='request-profile')
+
+
+def make_profile_token(app):
+    """Signed value for the X-Profile header"""
+    return _serializer(app).dumps('profile')
+
+
+def _valid_profile_token(app, token):
+    try:
+        _serializer(app).loads(token, max_age=app.config.get('PROFILING_TOKEN_MAX_AGE', 3600))
+        return True
+    except BadSignature:
+        return False
+
+
+def _start_request_profile():
+    token = request.headers.get(PROFILE_HEADER)
+    if not token or not _valid_profile_token(current_app, token):
+        return
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        # Another profiler is already active on this thread
+        return
+    g.request_profile = profile
+
+
+def _save_request_profile(profile):
+    """Stop the request's profiler and write its stats; returns the profile id"""
+    profile.disable()
+    profile_id = uuid.uuid4().hex
+    path = os.path.join(profile_output_dir(current_app), f'{profile_id}.prof')
+    profile.dump_stats(path)
+    logger.info(f"Request profile for {request.path} written to {path}")
+    return profile_id
+
+
+def _finish_request_profile(response):
+    profile = g.pop('request_profile', None)
+    if profile is not None:
+        response.headers['X-Profile-Id'] = _save_request_profile(profile)
+    return response
+
+
+def _teardown_request_profile(exc):
+    # after_request is skipped when a view raises; don't leave the profiler
+    # enabled on this worker thread
+    profile = g.pop('request_profile', None)
+    if profile is not None:
+        _save_request_profile(profile)
+
+
+def init_profiling(app):
+    """Enable per-request cProfile and the profiling endpoints if PROFILING_ENABLED"""
+    if not app.config.get('PROFILING_ENABLED'):
+        return False
+
+    app.before_request(_start_request_profile)
+    app.after_request(_finish_request_profile)
+    app.teardown_request(_teardown_request_profile)
+
+    from routes.profiling import profiling_bp
+    app.register_blueprint(profiling_bp, url_prefix='/debug/profile')
+    return True
@@ -18,7 +18,7 @@ def roles_required(*allowed_roles):
     def decorator(fn):
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            if not current_user.is_authenticated or current_user.role not in allowed_roles:
+            if not current_user.is_authenticated or not current_user.has_role(*allowed_roles):
                 abort(403)
             return fn(*args, **kwargs)
         return wrapper
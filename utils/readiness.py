@@ -0,0 +1,174 @@
+"""
+Readiness checks for the /ready probe
+
+Each check returns whether the worker can serve traffic plus how long the
+check took. Results are cached for READINESS_CACHE_SECONDS so frequent load
+balancer probes don't add database or disk load, and the database round trip
+gives up after READINESS_DB_TIMEOUT seconds so a hung database fails the
+probe instead of hanging it.
+"""
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+
+def _timed(check, *args):
+    start = time.perf_counter()
+    try:
+        ok, detail = check(*args)
+    except Exception as e:
+        ok, detail = False, str(e)
+    return {'ok': ok, 'latency_ms': round((time.perf_counter() - start) * 1000, 2), 'detail': detail}
+
+
+def check_database(db, timeout):
+    """Round-trip a SELECT 1, failing if connecting or the query takes longer than ``timeout``"""
+    from sqlalchemy import text
+    engine = db.engine
+    outcome = {}
+
+    def probe():
+        try:
+            with engine.connect() as connection:
+                if connection.dialect.name == 'postgresql':
+                    # Have the server cancel the query too, so it doesn't outlive the probe
+                    connection.execute(text(f'SET LOCAL statement_timeout = {int(timeout * 1000)}'))
+                connection.execute(text('SELECT 1'))
+        except Exception as e:
+            outcome['error'] = e
+
+    # A thread bounds the connect as well, which no portable statement timeout does
+    thread = threading.Thread(target=probe, name='readiness-database', daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        return False, f'no reply within {timeout}s'
+    if 'error' in outcome:
+        raise outcome['error']
+    return True, 'SELECT 1 ok'
+
+
+def check_pool(db, max_utilization):
+    """Fail when the pool has no spare connections"""
+    pool = db.engine.pool
+    if not hasattr(pool, 'checkedout') or not hasattr(pool, 'size'):
+        return True, f'{type(pool).__name__} does not report usage'
+
+    max_overflow = getattr(pool, '_max_overflow', 0)
+    if max_overflow < 0:
+        return True, f'{pool.checkedout()} checked out, unbounded overflow'
+
+    capacity = pool.size() + max_overflow
+    in_use = pool.checkedout()
+    utilization = in_use / capacity if capacity else 1.0
+    return utilization < max_utilization, f'{in_use}/{capacity} connections in use'
+
+
+def check_writable_directory(path, min_free_mb):
+    """Write and remove a probe file, and make sure the disk isn't nearly full"""
+    os.makedirs(path, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path, prefix='.ready-') as probe:
+        probe.write(b'ok')
+        probe.flush()
+    free_mb = shutil.disk_usage(path).free // (1024 * 1024)
+    return free_mb >= min_free_mb, f'{free_mb} MB free'
+
+
+def check_cache(app):
+    """The fragment cache is in-process; check it's attached and its bytecode dir is writable"""
+    cache = app.extensions.get('fragment_cache')
+    if cache is None:
+        return True, 'fragment cache disabled'
+    bytecode_dir = app.config.get('JINJA_BYTECODE_CACHE_DIR')
+    if bytecode_dir and not os.access(bytecode_dir, os.W_OK):
+        return False, f'{bytecode_dir} not writable'
+    return True, f'{cache.hits} hits, {cache.misses} misses'
+
+
+def check_schema(app):
+    """
+    Report whether the schema is at the migration head
+
+    Never fails: deploys run ``flask db upgrade`` before the workers start,
+    and a worker that booted ahead of it would otherwise stay out of
+    rotation until restarted, since the stamp is only read at startup.
+    """
+    status = app.extensions.get('schema_status')
+    if status is None or status['up_to_date'] is None:
+        return True, 'not checked'
+    return True, 'at head' if status['up_to_date'] else 'migrations pending'
+
+
+def run_checks(app):
+    """Run every readiness check and return (ready, results)"""
+    from app import db
+
+    config = app.config
+    min_free_mb = config.get('READINESS_MIN_FREE_MB', 50)
+    log_dir = os.path.dirname(os.path.abspath(config['LOG_FILE']))
+
+    # Pool first, so the SELECT 1 connection isn't counted as in use
+    results = {
+        'pool': _timed(check_pool, db, config.get('READINESS_MAX_POOL_UTILIZATION', 0.9)),
+        'database': _timed(check_database, db, config.get('READINESS_DB_TIMEOUT', 2.0)),
+        'uploads': _timed(check_writable_directory,
+                          os.path.join(app.root_path, config['UPLOAD_FOLDER']), min_free_mb),
+        'logs': _timed(check_writable_directory, log_dir, min_free_mb),
+        'cache': _timed(check_cache, app),
+        'schema': _timed(check_schema, app),
+    }
+    ready = all(result['ok'] for result in results.values())
+    if not ready:
+        failed = [name for name, result in results.items() if not result['ok']]
+        logger.warning(f"Readiness check failed: {', '.join(failed)}")
+    return ready, results
+
+
+class ReadinessCache:
+    """
+    Holds the last result for a few seconds
+
+    One probe at a time runs the checks, outside the lock; probes arriving
+    meanwhile get the previous result rather than queueing behind it.
+    """
+
+    def __init__(self):
+        self._result = None
+        self._checked_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def get(self, app, max_age):
+        """Return (ready, results, age in seconds)"""
+        with self._lock:
+            age = time.monotonic() - self._checked_at
+            if self._result is not None and (age < max_age or self._refreshing):
+                ready, results = self._result
+                return ready, results, age
+            self._refreshing = True
+
+        try:
+            result = run_checks(app)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+        with self._lock:
+            self._result = result
+            self._checked_at = time.monotonic()
+        ready, results = result
+        return ready, results, 0.0
+
+
+def get_readiness():
+    """Cached readiness for the current app"""
+    app = current_app._get_current_object()
+    cache = app.extensions.setdefault('readiness', ReadinessCache())
+    return cache.get(app, app.config.get('READINESS_CACHE_SECONDS', 5))
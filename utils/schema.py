@@ -0,0 +1,96 @@
+"""
+Database schema version checks
+
+Request-serving processes never run DDL. At startup the database's Alembic
+stamp is compared with the migration head once; when they match nothing else
+happens. Creating the schema is an explicit step (``flask init-db`` or
+``flask db upgrade``).
+"""
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def migrations_directory(app):
+    """Absolute path of the Flask-Migrate directory"""
+    directory = app.extensions['migrate'].directory
+    if not os.path.isabs(directory):
+        directory = os.path.join(app.root_path, directory)
+    return directory
+
+
+def head_revisions(app):
+    """Return the set of head revisions, or None if there are no migrations"""
+    directory = migrations_directory(app)
+    if not os.path.isdir(os.path.join(directory, 'versions')):
+        return None
+
+    from alembic.script import ScriptDirectory
+    return set(ScriptDirectory(directory).get_heads())
+
+
+def current_revisions(connection):
+    """Return the set of revisions stamped in the database"""
+    from alembic.runtime.migration import MigrationContext
+    return set(MigrationContext.configure(connection).get_current_heads())
+
+
+def check_schema_version(app):
+    """
+    Compare the database stamp with the migration head (once per process)
+
+    The outcome is stored in ``app.extensions['schema_status']``. If the schema
+    is behind and AUTO_CREATE_SCHEMA is set (development), tables are created
+    with ``create_all``; otherwise a warning is logged and nothing is changed.
+    """
+    from app import db
+
+    status = {'current': None, 'head': None, 'up_to_date': None}
+    app.extensions['schema_status'] = status
+
+    try:
+        status['head'] = head_revisions(app)
+        with app.app_context():
+            with db.engine.connect() as connection:
+                status['current'] = current_revisions(connection)
+    except Exception as e:
+        # A database that's down at boot shouldn't stop the app from starting;
+        # the readiness probe reports it instead
+        logger.warning(f"Could not check database schema version: {e}")
+        return status
+
+    if status['head'] is not None:
+        status['up_to_date'] = status['current'] == status['head']
+    if status['up_to_date']:
+        return status
+
+    if app.config.get('AUTO_CREATE_SCHEMA'):
+        logger.info("Database schema not stamped at head, creating missing tables")
+        with app.app_context():
+            db.create_all()
+    elif status['head'] is None:
+        logger.info("No migrations found, skipping schema version check")
+    else:
+        logger.warning(
+            f"Database schema is at {sorted(status['current']) or 'no revision'}, "
+            f"expected {sorted(status['head'])}. Run `flask db upgrade`."
+        )
+    return status
+
+
+def create_schema(app):
+    """
+    Create all tables and stamp the database at the migration head
+
+    Stamping means later `flask db upgrade` runs only apply newer revisions.
+    Must be called inside an app context.
+    """
+    from app import db
+
+    db.create_all()
+    if head_revisions(app) is not None:
+        from flask_migrate import stamp
+        stamp(directory=migrations_directory(app))
+        return True
+    return False
@@ -3,9 +3,6 @@ Sentry integration for error monitoring in production
 """
 import os
 import logging
-import sentry_sdk
-from sentry_sdk.integrations.flask import FlaskIntegration
-from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +24,11 @@ def init_sentry(app):
     
     logger.info(f"Initializing Sentry in {environment} environment")
     
+    # Imported here so processes without Sentry enabled don't pay for the SDK
+    import sentry_sdk
+    from sentry_sdk.integrations.flask import FlaskIntegration
+    from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+    
     # Initialize Sentry with Flask and SQLAlchemy integrations
     sentry_sdk.init(
         dsn=dsn,
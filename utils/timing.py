@@ -0,0 +1,179 @@
+"""
+Per-request timing and SQL query counting
+
+SQLAlchemy cursor events add each statement's duration to the current
+request; after the request the totals go out as a ``Server-Timing`` header
+and into an in-process, per-endpoint histogram. Routes that issue more
+queries than QUERY_BUDGET fail under TESTING and log a warning otherwise.
+"""
+import bisect
+import logging
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the latency histogram buckets; the last one is open
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised under TESTING when a request issues too many queries"""
+
+
+class RequestTiming:
+    """Counters for a single request"""
+
+    __slots__ = ('start', 'db_seconds', 'queries')
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.db_seconds = 0.0
+        self.queries = 0
+
+
+class EndpointStats:
+    """Aggregated timings for one endpoint"""
+
+    __slots__ = ('count', 'total_ms', 'db_ms', 'queries', 'max_queries', 'bytes', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.db_ms = 0.0
+        self.queries = 0
+        self.max_queries = 0
+        self.bytes = 0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total_ms / self.count, 2) if self.count else 0,
+            'avg_db_ms': round(self.db_ms / self.count, 2) if self.count else 0,
+            'avg_queries': round(self.queries / self.count, 2) if self.count else 0,
+            'max_queries': self.max_queries,
+            'bytes': self.bytes,
+            'histogram': {
+                **{f'le_{bound}': n for bound, n in zip(BUCKETS_MS, self.buckets)},
+                'inf': self.buckets[-1],
+            },
+        }
+
+
+class TimingStats:
+    """Thread-safe per-endpoint histogram kept for the life of the process"""
+
+    def __init__(self):
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, total_ms, db_ms, queries, size):
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = EndpointStats()
+            stats.count += 1
+            stats.total_ms += total_ms
+            stats.db_ms += db_ms
+            stats.queries += queries
+            stats.max_queries = max(stats.max_queries, queries)
+            stats.bytes += size or 0
+            stats.buckets[bisect.bisect_left(BUCKETS_MS, total_ms)] += 1
+
+    def snapshot(self):
+        """Return {endpoint: stats dict}"""
+        with self._lock:
+            return {endpoint: stats.to_dict() for endpoint, stats in self._endpoints.items()}
+
+    def clear(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+def query_budget(limit):
+    """Override QUERY_BUDGET for one view"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            g.query_budget = limit
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _current_timing():
+    return g.get('request_timing') if has_request_context() else None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # The start lives on the statement's execution context, which is
+    # discarded with it, so a statement that raises leaves nothing behind
+    if context is not None and _current_timing() is not None:
+        context.request_timing_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timing = _current_timing()
+    start = getattr(context, 'request_timing_start', None)
+    if timing is None or start is None:
+        return
+    timing.db_seconds += time.perf_counter() - start
+    timing.queries += 1
+
+
+def _install_engine_listeners():
+    # Listening on the Engine class covers every engine, including ones
+    # created after the app (e.g. per-test databases)
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+def _start_timing():
+    g.request_timing = RequestTiming()
+
+
+def _finish_timing(response):
+    timing = g.pop('request_timing', None)
+    if timing is None:
+        return response
+
+    total_ms = (time.perf_counter() - timing.start) * 1000
+    db_ms = timing.db_seconds * 1000
+    endpoint = request.endpoint or 'unmatched'
+    size = response.calculate_content_length()
+
+    current_app.extensions['request_timing'].record(endpoint, total_ms, db_ms, timing.queries, size)
+
+    if current_app.config.get('SERVER_TIMING_HEADER', True):
+        response.headers.add(
+            'Server-Timing',
+            f'app;dur={total_ms:.1f}, db;dur={db_ms:.1f};desc="{timing.queries} queries"'
+        )
+
+    budget = g.get('query_budget', current_app.config.get('QUERY_BUDGET'))
+    if budget and timing.queries > budget:
+        message = f"{endpoint} issued {timing.queries} queries (budget {budget})"
+        if current_app.testing:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+    return response
+
+
+def init_request_timing(app):
+    """Attach request timing, the Server-Timing header and query budgets"""
+    if not app.config.get('REQUEST_TIMING_ENABLED', True):
+        return None
+
+    _install_engine_listeners()
+    stats = TimingStats()
+    app.extensions['request_timing'] = stats
+    app.before_request(_start_timing)
+    app.after_request(_finish_timing)
+    return stats
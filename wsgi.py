@@ -1,8 +1,12 @@
 import os
-from app import create_app
 
-# Create application instance
-app = create_app(os.getenv('FLASK_ENV') or 'production')
+# Default to production when served by Gunicorn; must be set before the app is built
+os.environ.setdefault('FLASK_ENV', 'production')
+
+from app import get_app
+
+# Create application instance (shared with `app:app`, so it is only built once)
+app = get_app()
 
 # This is needed for Gunicorn to find the app
 application = app